@@ -7,11 +7,14 @@ from typing import List, Optional, Union
 
 from datajudge.client.run_builder import RunBuilder
 from datajudge.client.store_handler import StoreHandler
+from datajudge.run.worker_pool import WorkerPool
 from datajudge.utils.commons import (
     DEFAULT_DIRECTORY,
+    DEFAULT_DOWNLOAD_CACHE_SIZE,
     DEFAULT_EXPERIMENT,
     DEFAULT_PROJECT,
 )
+from datajudge.utils.sql_utils import dispose_engines
 
 
 class Client:
@@ -35,6 +38,22 @@ class Client:
         The id of the project, required for the DigitalHub metadata store, by default "project".
     tmp_dir : Optional[str], optional
         Default local temporary folder where to store input data, by default "./djruns/tmp".
+    max_workers : Optional[int], optional
+        Number of worker processes shared by the runs for multiprocess execution.
+        If None, the pool grows to the number of workers requested by the runs,
+        by default None.
+    executor : Optional[DistributedExecutor], optional
+        Executor used to ship plugins that support distributed execution to remote
+        workers, by default None.
+    download_cache : Optional[bool], optional
+        If True, files downloaded from remote stores are kept in a cache directory and
+        reused across runs and processes while their version (ETag or last modification)
+        is unchanged, by default False.
+    download_cache_size : Optional[int], optional
+        Disk budget in bytes of the download cache (None unbounded), by default 20 GB.
+    download_cache_dir : Optional[str], optional
+        Directory of the download cache, by default a directory private to the user
+        (~/.cache/datajudge/downloads).
 
     Methods
     -------
@@ -42,6 +61,8 @@ class Client:
         Add a new store to the client internal registry.
     create_run
         Create a new run.
+    shutdown
+        Shut down the worker processes and the database connections shared by the runs.
 
     """
 
@@ -51,9 +72,23 @@ class Client:
         store: Optional[Union["StoreConfig", List["StoreConfig"]]] = None,
         project: Optional[str] = DEFAULT_PROJECT,
         tmp_dir: Optional[str] = DEFAULT_DIRECTORY,
+        max_workers: Optional[int] = None,
+        executor: Optional["DistributedExecutor"] = None,
+        download_cache: Optional[bool] = False,
+        download_cache_size: Optional[int] = DEFAULT_DOWNLOAD_CACHE_SIZE,
+        download_cache_dir: Optional[str] = None,
     ) -> None:
-        self._store_handler = StoreHandler(metadata_store, store, project, tmp_dir)
-        self._run_builder = RunBuilder(self._store_handler)
+        self._store_handler = StoreHandler(
+            metadata_store,
+            store,
+            project,
+            tmp_dir,
+            download_cache,
+            download_cache_size,
+            download_cache_dir,
+        )
+        self._worker_pool = WorkerPool(max_workers)
+        self._run_builder = RunBuilder(self._store_handler, self._worker_pool, executor)
 
     def add_store(self, store: "StoreConfig") -> None:
         """
@@ -99,3 +134,13 @@ class Client:
         return self._run_builder.create_run(
             resources, run_config, experiment, run_id, overwrite
         )
+
+    def shutdown(self) -> None:
+        """
+        Shut down the worker processes and the database connections
+        shared by the runs. Worker processes are started at the first
+        parallel execution and pooled connections at the first query,
+        and both are kept alive between runs until shutdown is called.
+        """
+        self._worker_pool.shutdown()
+        dispose_engines()
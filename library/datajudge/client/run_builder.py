@@ -18,11 +18,19 @@ class RunBuilder:
 
     """
 
-    def __init__(self, store_handler: "StoreHandler") -> None:
+    def __init__(
+        self,
+        store_handler: "StoreHandler",
+        worker_pool: Optional["WorkerPool"] = None,
+        executor: Optional["DistributedExecutor"] = None,
+    ) -> None:
         """
-        The RunBuilder recieves a store handler to get stores.
+        The RunBuilder recieves a store handler to get stores,
+        the worker pool and the distributed executor shared by the runs.
         """
         self._store_handler = store_handler
+        self._worker_pool = worker_pool
+        self._executor = executor
 
     def _init_run(self, exp_name: str, run_id: str, overwrite: bool) -> None:
         """
@@ -75,7 +83,9 @@ class RunBuilder:
         run_md_uri = self._get_md_uri(experiment, run_id)
         run_art_uri = self._get_art_uri(experiment, run_id)
 
-        run_handler = RunHandler(run_config, self._store_handler)
+        run_handler = RunHandler(
+            run_config, self._store_handler, self._worker_pool, self._executor
+        )
         run_info = RunInfo(
             experiment, resources, run_id, run_config, run_md_uri, run_art_uri
         )
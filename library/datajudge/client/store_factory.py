@@ -2,7 +2,7 @@
 StoreFactory module.
 """
 from pathlib import Path
-from typing import Union
+from typing import Optional, Union
 
 from datajudge.store_artifact.registry import ART_STORES
 from datajudge.store_metadata.registry import MD_STORES
@@ -36,9 +36,15 @@ class StoreBuilder:
     StoreBuilder class.
     """
 
-    def __init__(self, project_id: str, tmp_dir: str) -> None:
+    def __init__(
+        self,
+        project_id: str,
+        tmp_dir: str,
+        download_cache: Optional["DownloadCache"] = None,
+    ) -> None:
         self.project_id = project_id
         self.tmp_dir = tmp_dir
+        self.download_cache = download_cache
 
     def build(self, config: Union[dict, StoreConfig], md_store: bool = False) -> dict:
         """
@@ -82,11 +88,13 @@ class StoreBuilder:
         new_uri = self.resolve_artifact_uri(cfg.uri, scheme)
         tmp = str(Path(self.tmp_dir, get_uiid()))
         try:
-            return ART_STORES[cfg.type](
+            store = ART_STORES[cfg.type](
                 cfg.name, cfg.type, new_uri, tmp, cfg.config, cfg.isDefault
             )
         except KeyError:
             raise NotImplementedError
+        store.download_cache = self.download_cache
+        return store
 
     @staticmethod
     def resolve_artifact_uri(uri: str, scheme: str) -> str:
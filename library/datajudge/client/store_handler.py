@@ -4,9 +4,15 @@ StoreHandler module.
 from typing import List, Optional, Union
 
 from datajudge.client.store_factory import StoreBuilder
-from datajudge.utils.commons import DEFAULT_DIRECTORY, DEFAULT_PROJECT
+from datajudge.store_artifact.download_cache import DownloadCache
+from datajudge.utils.commons import (
+    DEFAULT_DIRECTORY,
+    DEFAULT_DOWNLOAD_CACHE_SIZE,
+    DEFAULT_PROJECT,
+    DOWNLOAD_CACHE_DIRECTORY,
+)
 from datajudge.utils.exceptions import StoreError
-from datajudge.utils.file_utils import clean_all
+from datajudge.utils.file_utils import clean_all, get_user_cache_dir
 from datajudge.utils.utils import listify
 
 
@@ -90,9 +96,16 @@ class StoreHandler:
         store: Optional[List["StoreConfig"]] = None,
         project: Optional[str] = DEFAULT_PROJECT,
         tmp_dir: Optional[str] = DEFAULT_DIRECTORY,
+        download_cache: Optional[bool] = False,
+        download_cache_size: Optional[int] = DEFAULT_DOWNLOAD_CACHE_SIZE,
+        download_cache_dir: Optional[str] = None,
     ) -> None:
         self._store_registry = StoreRegistry()
-        self._store_builder = StoreBuilder(project, tmp_dir)
+        cache = None
+        if download_cache:
+            path = download_cache_dir or get_user_cache_dir(DOWNLOAD_CACHE_DIRECTORY)
+            cache = DownloadCache(path, download_cache_size)
+        self._store_builder = StoreBuilder(project, tmp_dir, cache)
         self._setup(metadata_store, store)
 
         self._tmp_dir = tmp_dir
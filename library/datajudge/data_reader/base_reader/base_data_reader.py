@@ -1,8 +1,16 @@
 """
 DataReader module.
 """
+import sys
 from abc import ABCMeta, abstractmethod
-from typing import Any
+from functools import partial
+from typing import Any, Callable, Iterator, Optional, Tuple
+
+from datajudge.utils.commons import DEFAULT_BATCH_SIZE, SAMPLE_ROW_GROUPS
+from datajudge.utils.io_utils import read_arrow_ipc, write_arrow_ipc
+from datajudge.utils.logger import LOGGER
+from datajudge.utils.sampling_utils import Sampler, parse_sample_args
+from datajudge.utils.utils import listify
 
 
 class DataReader(metaclass=ABCMeta):
@@ -11,13 +19,181 @@ class DataReader(metaclass=ABCMeta):
 
     This is the basic abstract class for the DataReaders.
 
+    Attributes
+    ----------
+    read_only : bool, default = False
+        If True, the plugin that uses the reader never modifies data
+        in place, so data cached for the run are handed out as views.
+        Otherwise every plugin gets its own copy.
+
     """
 
-    def __init__(self, store: "ArtifactStore") -> None:
+    # Readers that can convert their data to and from Arrow
+    # can share them with worker processes (see share_data).
+    shareable = False
+
+    def __init__(
+        self,
+        store: "ArtifactStore",
+        cache: Optional["DataCache"] = None,
+        read_only: bool = False,
+    ) -> None:
         self.store = store
+        self.cache = cache
+        self.read_only = read_only
+        self.shared = {}
 
     @abstractmethod
     def fetch_data(self, src: str) -> Any:
         """
         Fetch resources from backend.
         """
+
+    def _fetch_cached(self, src: Any, fetch_fnc: Callable) -> Any:
+        """
+        Return data from the run cache if present, otherwise
+        fetch it with fetch_fnc and cache it.
+        """
+        shared = self.shared.get(str(src))
+        if shared is not None:
+            return self._read_shared(shared)
+        if self.cache is None:
+            return fetch_fnc()
+        if self.shareable and self.cache.disk is not None:
+            fetch_fnc = partial(self._fetch_persisted, src, fetch_fnc)
+        key = self.cache.get_key(self, src)
+        data = self.cache.get_or_fetch(key, fetch_fnc, self.get_size)
+        if self.read_only:
+            return self.get_view(data)
+        return self.get_copy(data)
+
+    def _fetch_persisted(self, src: Any, fetch_fnc: Callable) -> Any:
+        """
+        Return data from the disk cache if the cached version of the
+        resource is still current, otherwise fetch it with fetch_fnc
+        and persist it.
+        """
+        versions = [self.store.get_version(pth) for pth in listify(src)]
+        if None in versions:
+            return fetch_fnc()
+        disk = self.cache.disk
+        key = disk.get_key(self, src, versions)
+        path = disk.get(key)
+        if path is not None:
+            return self._read_shared(path)
+        data = fetch_fnc()
+        try:
+            disk.add(key, self.to_arrow(data))
+        except Exception as ex:
+            LOGGER.info(f"Unable to persist resource {src} in disk cache: {ex}")
+        return data
+
+    def share_data(self, src: Any, path: str, write: bool = True) -> None:
+        """
+        Write data in an Arrow IPC file and read them from that file
+        from now on. Worker processes that receive the reader map the
+        file instead of fetching and parsing data again.
+        """
+        if write:
+            write_arrow_ipc(self.to_arrow(self.fetch_data(src)), path)
+        self.shared[str(src)] = path
+
+    def fetch_batches(self, src: str, batch_size: int) -> Iterator[Any]:
+        """
+        Fetch resources from backend and yield them in batches
+        of about batch_size rows, without loading them whole.
+        """
+        raise NotImplementedError
+
+    def fetch_row_groups(self, src: str, step: int) -> Iterator[Any]:
+        """
+        Fetch resources from backend and yield one every step
+        row groups (or batches, for formats without row groups).
+        """
+        for idx, batch in enumerate(self.fetch_batches(src, DEFAULT_BATCH_SIZE)):
+            if idx % step == 0:
+                yield batch
+
+    def fetch_sample(self, src: str, sample: dict) -> Tuple[Any, dict]:
+        """
+        Fetch a sample of resources and return it with a description
+        of the sampling. Resources are streamed in batches, so only
+        the sample is held in memory, and reading stops as soon as
+        the sample is complete.
+        """
+        args = parse_sample_args(sample)
+        if args["strategy"] == SAMPLE_ROW_GROUPS:
+            batches = self.fetch_row_groups(src, args["step"])
+        else:
+            batches = self.fetch_batches(src, args["batchSize"])
+        sampler = Sampler(args, self.take_rows, self.get_column)
+        for batch in batches:
+            sampler.add(batch, len(batch))
+            if sampler.done:
+                break
+        sample = sampler.get_sample()
+        if not sample:
+            raise ValueError(f"Resource {src} is empty.")
+        return self.concat_data(sample), sampler.describe()
+
+    def concat_data(self, data: list) -> Any:
+        """
+        Concatenate a list of data.
+        """
+        raise NotImplementedError
+
+    @staticmethod
+    def take_rows(data: Any, idx: "np.ndarray") -> Any:
+        """
+        Return the rows of data at the given positions.
+        """
+        raise NotImplementedError
+
+    @staticmethod
+    def get_column(data: Any, column: str) -> "np.ndarray":
+        """
+        Return a column of data as numpy array.
+        """
+        raise NotImplementedError
+
+    def _read_shared(self, path: str) -> Any:
+        """
+        Read data from a shared Arrow IPC file.
+        """
+        return self.from_arrow(read_arrow_ipc(path))
+
+    def to_arrow(self, data: Any) -> "pa.Table":
+        """
+        Convert data to an Arrow table.
+        """
+        raise NotImplementedError
+
+    def from_arrow(self, table: "pa.Table") -> Any:
+        """
+        Convert an Arrow table to data.
+        """
+        raise NotImplementedError
+
+    @staticmethod
+    def get_size(data: Any) -> int:
+        """
+        Return the memory footprint of data in bytes.
+        """
+        return sys.getsizeof(data)
+
+    @staticmethod
+    def get_view(data: Any) -> Any:
+        """
+        Return a view of data that shares memory with the cached
+        object. Changes made in place to the view may be seen by the
+        other plugins, so views are handed only to read-only plugins.
+        """
+        return data
+
+    def get_copy(self, data: Any) -> Any:
+        """
+        Return a copy of data that a plugin can modify without
+        affecting the cached object. By default it is the view,
+        for data that cannot be modified in place.
+        """
+        return self.get_view(data)
@@ -1,7 +1,17 @@
 """
 FileReader module.
 """
+from typing import Any, Iterator, List, Optional, Union
+
 from datajudge.data_reader.base_reader.base_data_reader import DataReader
+from datajudge.plugins.utils.frictionless_utils import (
+    describe_buffer,
+    describe_resource,
+)
+from datajudge.utils.commons import DEFAULT_BATCH_SIZE, DEFAULT_READ_WORKERS
+from datajudge.utils.io_utils import iter_parquet_row_groups
+from datajudge.utils.partition_utils import parse_partitions
+from datajudge.utils.utils import listify, parallel_map
 
 
 class FileReader(DataReader):
@@ -10,10 +20,108 @@ class FileReader(DataReader):
 
     The FileReader object tells the stores to fetch physical
     resources from backend and store them locally.
+
+    Attributes
+    ----------
+    partitioned : bool, default = False
+        If True, the resource is a hive-partitioned directory and
+        the partitions in the path of its files are added as columns.
     """
 
-    def fetch_data(self, src: str) -> str:
+    def __init__(
+        self,
+        store: "ArtifactStore",
+        cache: Optional["DataCache"] = None,
+        read_only: bool = False,
+        partitioned: bool = False,
+    ) -> None:
+        super().__init__(store, cache, read_only)
+        self.partitioned = partitioned
+
+    def fetch_data(self, src: Union[str, List[str]]) -> Union[str, List[str]]:
         """
-        Fetch resource from backend.
+        Fetch resource from backend. Multiple files
+        are fetched concurrently.
         """
+        if isinstance(src, list):
+            return parallel_map(self.store.fetch_file, src, DEFAULT_READ_WORKERS)
         return self.store.fetch_file(src)
+
+    def fetch_batches(self, src: str, batch_size: int) -> Iterator[Any]:
+        """
+        Fetch resource from backend and yield it in batches of about
+        batch_size rows. CSV files are read in chunks and parquet
+        files by row groups, so only a batch is held in memory.
+        """
+        for pth in listify(src):
+            res = self._fetch_resource(pth)
+            for batch in self._read_batches_from_path(res, batch_size):
+                yield self.add_partitions(batch, pth)
+
+    def fetch_row_groups(self, src: str, step: int) -> Iterator[Any]:
+        """
+        Fetch resource from backend and yield one every step row
+        groups of parquet files. Other row groups are never read.
+        Other formats are read in batches.
+        """
+        for pth in listify(src):
+            res = self._fetch_resource(pth)
+            if res.get("format") == "parquet":
+                tables = iter_parquet_row_groups(res.get("path"), step)
+                batches = (self.from_arrow(table) for table in tables)
+            else:
+                batches = self._read_batches_from_path(res, DEFAULT_BATCH_SIZE)
+                batches = (b for i, b in enumerate(batches) if i % step == 0)
+            for batch in batches:
+                yield self.add_partitions(batch, pth)
+
+    def _fetch_resource(self, src: str) -> dict:
+        """
+        Fetch a single file from backend and describe it. Stores that
+        support ranged reads return a file that is read in place, so
+        only the parts of the resource that are parsed are transferred.
+        Stores that download whole objects in memory return a buffer
+        if the resource is small enough, which is parsed directly
+        instead of being written in a temporary file.
+        Stores with a download cache always fetch files, which are
+        reused by later runs.
+        """
+        if self.store.download_cache is None:
+            stream = self.store.open_file(src)
+            if stream is not None:
+                return describe_buffer(stream, src)
+            if self.store.fits_in_memory(src):
+                return describe_buffer(self.store.fetch_buffer(src), src)
+        path = self.store.fetch_file(src)
+        return self._describe_resource(path)
+
+    def _describe_resource(self, src: str) -> dict:
+        """
+        Describe resource.
+        """
+        return describe_resource(src)
+
+    def _read_batches_from_path(self, resource: dict, batch_size: int) -> Iterator[Any]:
+        """
+        Read a described file in batches of about batch_size rows.
+        """
+        raise NotImplementedError
+
+    def add_partitions(self, data: Any, src: str) -> Any:
+        """
+        Add the hive partitions of a file as columns, if the
+        resource is partitioned.
+        """
+        if not self.partitioned:
+            return data
+        partitions = parse_partitions(src)
+        if not partitions:
+            return data
+        return self.add_columns(data, partitions)
+
+    @staticmethod
+    def add_columns(data: Any, columns: dict) -> Any:
+        """
+        Add columns with a constant value.
+        """
+        raise NotImplementedError
@@ -7,6 +7,7 @@ import duckdb
 import pandas as pd
 
 from datajudge.data_reader.base_reader.base_native_reader import NativeReader
+from datajudge.plugins.utils.sql_checks import COUNT_COLUMN, wrap_counted_query
 from datajudge.utils.exceptions import StoreError
 
 
@@ -23,6 +24,14 @@ class PandasDataFrameDuckDBReader(NativeReader):
         """
         return self._read_df_from_db(src, query)
 
+    def fetch_rows(self, src: str, query: str, limit: int) -> tuple:
+        """
+        Return the number of rows of a query result and its first
+        limit rows, fetched with a single statement.
+        """
+        df = self._read_df_from_db(src, wrap_counted_query(query, limit))
+        return self.split_count(df)
+
     @staticmethod
     def _read_df_from_db(src: str, query: str) -> pd.DataFrame:
         """
@@ -57,3 +66,12 @@ class PandasDataFrameDuckDBReader(NativeReader):
         Return length of DataFrame.
         """
         return df.shape[0]
+
+    @staticmethod
+    def split_count(df: pd.DataFrame) -> tuple:
+        """
+        Return the rows count and the DataFrame without the
+        count column of a query wrapped by wrap_counted_query.
+        """
+        count = int(df[COUNT_COLUMN].iloc[0]) if len(df) else 0
+        return count, df.drop(columns=COUNT_COLUMN)
@@ -1,11 +1,17 @@
 """
 PandasDataFrameReader module.
 """
+from functools import partial
+from typing import Iterator
+
+import numpy as np
 import pandas as pd
+import pyarrow as pa
 
 from datajudge.data_reader.base_reader.base_file_reader import FileReader
-from datajudge.plugins.utils.frictionless_utils import describe_resource
-from datajudge.utils.utils import listify
+from datajudge.utils.commons import DEFAULT_READ_WORKERS
+from datajudge.utils.io_utils import iter_parquet_batches
+from datajudge.utils.utils import listify, parallel_map
 
 
 class PandasDataFrameFileReader(FileReader):
@@ -15,19 +21,28 @@ class PandasDataFrameFileReader(FileReader):
     Read a DataFrame from local file.
     """
 
+    shareable = True
+
     def fetch_data(self, src: str) -> pd.DataFrame:
         """
         Fetch resource from backend.
         """
-        path = super().fetch_data(src)
-        res = self._describe_resource(path)
-        return self._read_df_from_path(res)
+        return self._fetch_cached(src, lambda: self._fetch_df(src))
+
+    def _fetch_df(self, src: str) -> pd.DataFrame:
+        """
+        Fetch resource from backend and parse it. Multiple
+        files are fetched and parsed concurrently.
+        """
+        dfs = parallel_map(self._fetch_file_df, listify(src), DEFAULT_READ_WORKERS)
+        return self.concat_data(dfs)
 
-    def _describe_resource(self, src: str) -> dict:
+    def _fetch_file_df(self, src: str) -> pd.DataFrame:
         """
-        Describe resource.
+        Fetch a single file from backend and parse it.
         """
-        return describe_resource(src)
+        df = self._read_df_from_path(self._fetch_resource(src))
+        return self.add_partitions(df, src)
 
     def _read_df_from_path(self, resource: dict) -> pd.DataFrame:
         """
@@ -41,12 +56,106 @@ class PandasDataFrameFileReader(FileReader):
                 "sep": resource.get("dialect", {}).get("delimiter", ","),
                 "encoding": resource.get("encoding"),
             }
-            list_df = [pd.read_csv(i, **csv_args) for i in paths]
+            read_fnc = partial(pd.read_csv, **csv_args)
         elif file_format in ["xls", "xlsx", "ods", "odf"]:
-            list_df = [pd.read_excel(i) for i in paths]
+            read_fnc = pd.read_excel
         elif file_format == "parquet":
-            list_df = [pd.read_parquet(i) for i in paths]
+            read_fnc = pd.read_parquet
         else:
             raise ValueError("File extension not supported!")
 
-        return pd.concat(list_df)
+        return self.concat_data(parallel_map(read_fnc, paths, DEFAULT_READ_WORKERS))
+
+    def _read_batches_from_path(
+        self, resource: dict, batch_size: int
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Read a file into pandas DataFrames of at most batch_size rows.
+        """
+        path = resource.get("path")
+        file_format = resource.get("format")
+
+        if file_format == "csv":
+            with pd.read_csv(
+                path,
+                sep=resource.get("dialect", {}).get("delimiter", ","),
+                encoding=resource.get("encoding"),
+                chunksize=batch_size,
+            ) as chunks:
+                yield from chunks
+        elif file_format == "parquet":
+            for batch in iter_parquet_batches(path, batch_size):
+                yield batch.to_pandas(split_blocks=True)
+        else:
+            # Other formats cannot be read in chunks
+            df = self._read_df_from_path(resource)
+            for idx in range(0, len(df), batch_size):
+                yield df.iloc[idx : idx + batch_size]
+
+    @staticmethod
+    def add_columns(data: pd.DataFrame, columns: dict) -> pd.DataFrame:
+        """
+        Add columns with a constant value to a DataFrame.
+        """
+        data = data.copy(deep=False)
+        for key, value in columns.items():
+            data[key] = value
+        return data
+
+    @staticmethod
+    def take_rows(data: pd.DataFrame, idx: np.ndarray) -> pd.DataFrame:
+        """
+        Return the rows of a DataFrame at the given positions.
+        """
+        return data.iloc[idx]
+
+    @staticmethod
+    def get_column(data: pd.DataFrame, column: str) -> np.ndarray:
+        """
+        Return a column of a DataFrame as numpy array.
+        """
+        return data[column].to_numpy()
+
+    def concat_data(self, dfs: list) -> pd.DataFrame:
+        """
+        Concatenate a list of pandas DataFrames without copying
+        single DataFrames.
+        """
+        if len(dfs) == 1:
+            return dfs[0]
+        return pd.concat(dfs, copy=False)
+
+    def to_arrow(self, data: pd.DataFrame) -> pa.Table:
+        """
+        Convert a pandas DataFrame to an Arrow table.
+        """
+        return pa.Table.from_pandas(data)
+
+    def from_arrow(self, table: pa.Table) -> pd.DataFrame:
+        """
+        Convert an Arrow table to a pandas DataFrame. Columns are kept
+        in separate blocks to avoid copies on consolidation.
+        """
+        return table.to_pandas(split_blocks=True)
+
+    @staticmethod
+    def get_size(data: pd.DataFrame) -> int:
+        """
+        Return the memory footprint of a DataFrame in bytes.
+        """
+        return int(data.memory_usage(deep=True).sum())
+
+    @staticmethod
+    def get_view(data: pd.DataFrame) -> pd.DataFrame:
+        """
+        Return a shallow copy of a DataFrame sharing the same data.
+        Without copy-on-write (pandas < 2), values set in place in
+        the copy are also set in the cached DataFrame.
+        """
+        return data.copy(deep=False)
+
+    def get_copy(self, data: pd.DataFrame) -> pd.DataFrame:
+        """
+        Return a deep copy of a DataFrame.
+        """
+        return data.copy(deep=True)
@@ -4,11 +4,13 @@ PandasDataFrameReader module.
 from typing import Any
 
 import pandas as pd
-from sqlalchemy import create_engine
+from sqlalchemy import text
 from sqlalchemy.engine import Engine
 
 from datajudge.data_reader.base_reader.base_native_reader import NativeReader
+from datajudge.plugins.utils.sql_checks import wrap_count_query
 from datajudge.utils.exceptions import StoreError
+from datajudge.utils.sql_utils import get_engine, get_pool_args
 
 
 class PandasDataFrameSQLReader(NativeReader):
@@ -25,13 +27,23 @@ class PandasDataFrameSQLReader(NativeReader):
         conn_string = super().fetch_data(src)
         return self._read_df_from_db(conn_string, query)
 
-    @staticmethod
-    def _get_engine(conn_str: str) -> Engine:
+    def fetch_rows(self, src: str, query: str, limit: int) -> tuple:
+        """
+        Return the number of rows of a query result and its first
+        limit rows. Rows are counted by the database and the sample
+        is streamed with fetchmany, so no dialect-specific LIMIT
+        is needed and only limit rows are transferred.
         """
-        Create a SQLAlchemy Engine.
+        conn_string = super().fetch_data(src)
+        return self._read_rows_from_db(conn_string, query, limit)
+
+    def _get_engine(self, conn_str: str) -> Engine:
         """
+        Return a pooled SQLAlchemy Engine.
+        """
+        pool_args = get_pool_args(getattr(self.store, "config", None))
         try:
-            return create_engine(conn_str)
+            return get_engine(conn_str, **pool_args)
         except Exception as ex:
             raise StoreError(
                 f"Something wrong with connection string. Arguments: {str(ex.args)}"
@@ -43,13 +55,32 @@ class PandasDataFrameSQLReader(NativeReader):
         """
         engine = self._get_engine(conn_str)
         try:
-            return pd.read_sql(query, engine)
+            with engine.connect() as conn:
+                return pd.read_sql(text(query), conn)
+        except Exception as ex:
+            raise StoreError(
+                f"Unable to read data from query: {query}. Arguments: {str(ex.args)}"
+            )
+
+    def _read_rows_from_db(self, conn_str: str, query: str, limit: int) -> tuple:
+        """
+        Count the rows of a query result and read the first ones.
+        """
+        engine = self._get_engine(conn_str)
+        try:
+            with engine.connect() as conn:
+                count = conn.execute(text(wrap_count_query(query))).scalar()
+                result = conn.execution_options(stream_results=True).execute(
+                    text(query)
+                )
+                rows = result.fetchmany(limit)
+                columns = list(result.keys())
+                result.close()
+            return int(count), pd.DataFrame(rows, columns=columns)
         except Exception as ex:
             raise StoreError(
                 f"Unable to read data from query: {query}. Arguments: {str(ex.args)}"
             )
-        finally:
-            engine.dispose()
 
     @staticmethod
     def return_head(df: pd.DataFrame) -> dict:
@@ -1,13 +1,17 @@
 """
 PolarsDataFrameReader module.
 """
-from pathlib import Path
+from functools import partial
+from typing import Iterator
 
+import numpy as np
 import polars as pl
+import pyarrow as pa
 
 from datajudge.data_reader.base_reader.base_file_reader import FileReader
-from datajudge.plugins.utils.frictionless_utils import describe_resource
-from datajudge.utils.utils import listify
+from datajudge.utils.commons import DEFAULT_READ_WORKERS
+from datajudge.utils.io_utils import iter_parquet_batches
+from datajudge.utils.utils import listify, parallel_map
 
 
 class PolarsDataFrameFileReader(FileReader):
@@ -17,19 +21,28 @@ class PolarsDataFrameFileReader(FileReader):
     Read a DataFrame from local file.
     """
 
+    shareable = True
+
     def fetch_data(self, src: str) -> pl.DataFrame:
         """
         Fetch resource from backend.
         """
-        path = super().fetch_data(src)
-        res = self._describe_resource(path)
-        return self._read_df_from_path(res)
+        return self._fetch_cached(src, lambda: self._fetch_df(src))
 
-    def _describe_resource(self, src: str) -> dict:
+    def _fetch_df(self, src: str) -> pl.DataFrame:
         """
-        Describe resource.
+        Fetch resource from backend and parse it. Multiple
+        files are fetched and parsed concurrently.
         """
-        return describe_resource(src)
+        dfs = parallel_map(self._fetch_file_df, listify(src), DEFAULT_READ_WORKERS)
+        return self.concat_data(dfs)
+
+    def _fetch_file_df(self, src: str) -> pl.DataFrame:
+        """
+        Fetch a single file from backend and parse it.
+        """
+        df = self._read_df_from_path(self._fetch_resource(src))
+        return self.add_partitions(df, src)
 
     def _read_df_from_path(self, resource: dict) -> pl.DataFrame:
         """
@@ -43,16 +56,102 @@ class PolarsDataFrameFileReader(FileReader):
                 "separator": resource.get("dialect", {}).get("delimiter", ","),
                 "encoding": resource.get("encoding", "utf8"),
             }
-            list_df = [pl.read_csv(Path(i), **csv_args) for i in paths]
+            read_fnc = partial(pl.read_csv, **csv_args)
         elif file_format == "parquet":
-            list_df = [pl.read_parquet(Path(i)) for i in paths]
+            read_fnc = pl.read_parquet
         else:
             raise ValueError("File extension not supported!")
 
-        return pl.concat(list_df)
+        return self.concat_data(parallel_map(read_fnc, paths, DEFAULT_READ_WORKERS))
+
+    def _read_batches_from_path(
+        self, resource: dict, batch_size: int
+    ) -> Iterator[pl.DataFrame]:
+        """
+        Read a file into Polars DataFrames of about batch_size rows.
+        """
+        path = resource.get("path")
+        file_format = resource.get("format")
+
+        if file_format == "csv":
+            csv_args = {
+                "separator": resource.get("dialect", {}).get("delimiter", ","),
+                "encoding": resource.get("encoding", "utf8"),
+            }
+            if not isinstance(path, str):
+                # Polars reads only local files in batches, buffers
+                # are parsed whole and sliced without copies
+                df = pl.read_csv(path, **csv_args)
+                for idx in range(0, len(df), batch_size):
+                    yield df.slice(idx, batch_size)
+                return
+            reader = pl.read_csv_batched(path, batch_size=batch_size, **csv_args)
+            while True:
+                batches = reader.next_batches(1)
+                if not batches:
+                    break
+                yield from batches
+        elif file_format == "parquet":
+            for batch in iter_parquet_batches(path, batch_size):
+                yield pl.from_arrow(pa.Table.from_batches([batch]))
+        else:
+            raise ValueError("File extension not supported!")
+
+    @staticmethod
+    def add_columns(data: pl.DataFrame, columns: dict) -> pl.DataFrame:
+        """
+        Add columns with a constant value to a DataFrame.
+        """
+        return data.with_columns([pl.lit(v).alias(k) for k, v in columns.items()])
+
+    @staticmethod
+    def take_rows(data: pl.DataFrame, idx: np.ndarray) -> pl.DataFrame:
+        """
+        Return the rows of a DataFrame at the given positions.
+        """
+        return data.select(pl.all().take(pl.Series(idx, dtype=pl.UInt32)))
+
+    @staticmethod
+    def get_column(data: pl.DataFrame, column: str) -> np.ndarray:
+        """
+        Return a column of a DataFrame as numpy array.
+        """
+        return data[column].to_numpy()
 
     def concat_data(self, dfs: list) -> pl.DataFrame:
         """
-        Concatenate a list of Polars DataFrames.
+        Concatenate a list of Polars DataFrames. Chunks are
+        not merged, so data are not copied.
+        """
+        if len(dfs) == 1:
+            return dfs[0]
+        return pl.concat(dfs, rechunk=False)
+
+    def to_arrow(self, data: pl.DataFrame) -> pa.Table:
+        """
+        Convert a Polars DataFrame to an Arrow table.
+        """
+        return data.to_arrow()
+
+    def from_arrow(self, table: pa.Table) -> pl.DataFrame:
+        """
+        Convert an Arrow table to a Polars DataFrame, zero-copy
+        where the data types allow it.
+        """
+        return pl.from_arrow(table)
+
+    @staticmethod
+    def get_size(data: pl.DataFrame) -> int:
+        """
+        Return the memory footprint of a DataFrame in bytes.
+        """
+        return int(data.estimated_size())
+
+    @staticmethod
+    def get_view(data: pl.DataFrame) -> pl.DataFrame:
+        """
+        Return a clone of a DataFrame sharing the same buffers.
+        Buffers are copied on write, so the clone can be modified
+        without affecting the cached DataFrame.
         """
-        return pl.concat(dfs)
+        return data.clone()
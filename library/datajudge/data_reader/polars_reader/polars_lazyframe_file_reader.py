@@ -0,0 +1,106 @@
+"""
+PolarsLazyFrameReader module.
+"""
+from pathlib import Path
+from typing import List, Optional
+
+import polars as pl
+
+from datajudge.data_reader.base_reader.base_file_reader import FileReader
+from datajudge.utils.commons import DEFAULT_READ_WORKERS
+from datajudge.utils.utils import listify, parallel_map
+
+# Encodings supported by polars scan functions
+SCAN_ENCODINGS = ("utf-8", "utf8")
+
+
+class PolarsLazyFrameFileReader(FileReader):
+    """
+    PolarsLazyFrameFileReader class.
+
+    Read a LazyFrame from local file. Files are scanned, not loaded,
+    so only the columns and rows required by the query plan are read
+    when the LazyFrame is collected.
+
+    The built-in plugins do not use this reader yet: it is available
+    in the registry for plugins that build their own query plans.
+    """
+
+    def fetch_data(self, src: str) -> pl.LazyFrame:
+        """
+        Fetch resource from backend. Multiple files are
+        fetched concurrently.
+        """
+        lfs = parallel_map(self._fetch_file_lf, listify(src), DEFAULT_READ_WORKERS)
+        return lfs[0] if len(lfs) == 1 else pl.concat(lfs, rechunk=False)
+
+    def _fetch_file_lf(self, src: str) -> pl.LazyFrame:
+        """
+        Fetch a single file from backend and scan it.
+        """
+        path = super().fetch_data(src)
+        res = self._describe_resource(path)
+        lf = self._scan_lf_from_path(res)
+        return self.add_partitions(lf, src)
+
+    def _scan_lf_from_path(self, resource: dict) -> pl.LazyFrame:
+        """
+        Scan a file into a Polars LazyFrame.
+        """
+        paths = listify(resource.get("path"))
+        file_format = resource.get("format")
+
+        if file_format == "csv":
+            separator = resource.get("dialect", {}).get("delimiter", ",")
+            encoding = resource.get("encoding", "utf-8")
+            if encoding.lower() in SCAN_ENCODINGS:
+                list_lf = [pl.scan_csv(Path(i), separator=separator) for i in paths]
+            else:
+                # Polars can only scan utf-8 files
+                list_lf = [
+                    pl.read_csv(Path(i), separator=separator, encoding=encoding).lazy()
+                    for i in paths
+                ]
+        elif file_format == "parquet":
+            list_lf = [pl.scan_parquet(Path(i)) for i in paths]
+        else:
+            raise ValueError("File extension not supported!")
+
+        return list_lf[0] if len(list_lf) == 1 else pl.concat(list_lf, rechunk=False)
+
+    @staticmethod
+    def add_columns(data: pl.LazyFrame, columns: dict) -> pl.LazyFrame:
+        """
+        Add columns with a constant value to a LazyFrame.
+        """
+        return data.with_columns([pl.lit(v).alias(k) for k, v in columns.items()])
+
+    @staticmethod
+    def collect(
+        data: pl.LazyFrame,
+        columns: Optional[List[str]] = None,
+        predicate: Optional[pl.Expr] = None,
+    ) -> pl.DataFrame:
+        """
+        Collect a LazyFrame in streaming mode, reading only the
+        selected columns and the rows that match the predicate.
+        """
+        if predicate is not None:
+            data = data.filter(predicate)
+        if columns is not None:
+            data = data.select(columns)
+        return data.collect(streaming=True)
+
+    @staticmethod
+    def return_head(data: pl.LazyFrame) -> dict:
+        """
+        Return head(100) of LazyFrame as dict.
+        """
+        return data.head(100).collect().to_dict(as_series=True)
+
+    @staticmethod
+    def return_length(data: pl.LazyFrame) -> int:
+        """
+        Return the number of rows of a LazyFrame.
+        """
+        return data.select(pl.count()).collect(streaming=True)[0, 0]
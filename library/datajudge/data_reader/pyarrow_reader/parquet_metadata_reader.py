@@ -0,0 +1,139 @@
+"""
+ParquetMetadataReader module.
+"""
+from io import BytesIO
+from typing import Any, Optional
+
+import pyarrow.parquet as pq
+
+from datajudge.data_reader.base_reader.base_file_reader import FileReader
+from datajudge.utils.commons import DEFAULT_FOOTER_SIZE, DEFAULT_READ_WORKERS
+from datajudge.utils.utils import listify, parallel_map
+
+# Magic bytes at the start and at the end of a parquet file
+PARQUET_MAGIC = b"PAR1"
+
+
+class ParquetMetadataReader(FileReader):
+    """
+    ParquetMetadataReader class.
+
+    Read schema, row count and column statistics of parquet files
+    from their footer, without reading data pages. Footers of remote
+    files are fetched with ranged reads if the store supports them.
+    """
+
+    def fetch_data(self, src: str) -> dict:
+        """
+        Fetch the footers of the resource files and return
+        a description of the resource.
+        """
+        metadata = parallel_map(self.fetch_metadata, listify(src), DEFAULT_READ_WORKERS)
+        descriptions = [self.describe_metadata(meta) for meta in metadata]
+        return self.merge_descriptions(descriptions)
+
+    def fetch_metadata(self, src: str) -> pq.FileMetaData:
+        """
+        Fetch the footer of a parquet file.
+        """
+        footer = self._fetch_footer(src)
+        if footer is None:
+            return pq.read_metadata(super().fetch_data(src))
+        return pq.read_metadata(BytesIO(PARQUET_MAGIC + footer))
+
+    def _fetch_footer(self, src: str) -> Optional[bytes]:
+        """
+        Return the footer (metadata, length and magic bytes) of a
+        parquet file with ranged reads, None if the store does not
+        support them.
+        """
+        tail = self.store.fetch_tail(src, DEFAULT_FOOTER_SIZE)
+        if tail is None:
+            return None
+        if tail[-4:] != PARQUET_MAGIC:
+            raise ValueError(f"Resource {src} is not a parquet file.")
+        length = int.from_bytes(tail[-8:-4], "little") + 8
+        if length > len(tail):
+            tail = self.store.fetch_tail(src, length)
+        return tail[-length:]
+
+    @staticmethod
+    def describe_metadata(metadata: pq.FileMetaData) -> dict:
+        """
+        Return fields, row count and column statistics of a
+        parquet file from its metadata.
+        """
+        stats = {}
+        for idx in range(metadata.num_row_groups):
+            row_group = metadata.row_group(idx)
+            for col in range(row_group.num_columns):
+                column = row_group.column(col)
+                new = _get_statistics(column.statistics)
+                old = stats.get(column.path_in_schema)
+                stats[column.path_in_schema] = new if idx == 0 else _merge(old, new)
+
+        fields = []
+        for field in metadata.schema.to_arrow_schema():
+            desc = {
+                "name": field.name,
+                "type": field.type,
+                "nullable": field.nullable,
+                "min": None,
+                "max": None,
+                "nullCount": None,
+            }
+            # Statistics are available only for primitive columns
+            desc.update(stats.get(field.name) or {})
+            fields.append(desc)
+
+        return {"rows": metadata.num_rows, "fields": fields}
+
+    @staticmethod
+    def merge_descriptions(descriptions: list) -> dict:
+        """
+        Merge the descriptions of the files of a resource.
+        """
+        result = descriptions[0]
+        for desc in descriptions[1:]:
+            result["rows"] += desc["rows"]
+            others = {field["name"]: field for field in desc["fields"]}
+            for field in result["fields"]:
+                other = others.get(field["name"])
+                if other is None:
+                    field.update({"min": None, "max": None, "nullCount": None})
+                    continue
+                field["nullable"] = field["nullable"] or other["nullable"]
+                field.update(_merge(field, other))
+        return result
+
+
+def _get_statistics(statistics: Any) -> Optional[dict]:
+    """
+    Return min, max and null count from column chunk statistics.
+    """
+    if statistics is None:
+        return None
+    stats = {"min": None, "max": None, "nullCount": None}
+    if statistics.has_min_max:
+        stats["min"] = statistics.min
+        stats["max"] = statistics.max
+    if statistics.has_null_count:
+        stats["nullCount"] = statistics.null_count
+    return stats
+
+
+def _merge(old: Optional[dict], new: Optional[dict]) -> dict:
+    """
+    Merge statistics of two column chunks. Missing
+    statistics invalidate the merged ones.
+    """
+    if old is None or new is None:
+        return {"min": None, "max": None, "nullCount": None}
+    stats = {}
+    for key, fnc in (("min", min), ("max", max), ("nullCount", sum)):
+        values = [old[key], new[key]]
+        if None in values:
+            stats[key] = None
+        else:
+            stats[key] = fnc(values)
+    return stats
@@ -69,6 +69,26 @@ try:
 except ImportError:
     ...
 
+try:
+    from datajudge.data_reader.polars_reader.polars_lazyframe_file_reader import (
+        PolarsLazyFrameFileReader,
+    )
+    from datajudge.utils.commons import POLARS_LAZYFRAME_FILE_READER
+
+    REGISTRY[POLARS_LAZYFRAME_FILE_READER] = PolarsLazyFrameFileReader
+except ImportError:
+    ...
+
+try:
+    from datajudge.data_reader.pyarrow_reader.parquet_metadata_reader import (
+        ParquetMetadataReader,
+    )
+    from datajudge.utils.commons import PARQUET_METADATA_READER
+
+    REGISTRY[PARQUET_METADATA_READER] = ParquetMetadataReader
+except ImportError:
+    ...
+
 try:
     from datajudge.data_reader.polars_reader.polars_dataframe_sql_reader import (
         PolarsDataFrameSQLReader,
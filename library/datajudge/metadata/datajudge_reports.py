@@ -2,6 +2,7 @@
 Datajudge base report module.
 """
 from dataclasses import dataclass
+from typing import Optional
 
 
 @dataclass
@@ -45,11 +46,15 @@ class DatajudgeProfile(DatajudgeBaseReport):
         Descriptors of data stats.
     fields : dict
         Descriptors of data fields.
+    sample : dict, default = None
+        Description of the sample profiled, None if data
+        were profiled whole.
 
     """
 
     stats: dict
     fields: dict
+    sample: Optional[dict] = None
 
 
 @dataclass
@@ -82,7 +87,11 @@ class DatajudgeSchema(DatajudgeBaseReport):
     ----------
     fields : list
         A list of fields.
+    sample : dict, default = None
+        Description of the sample the schema was inferred
+        from, None if data were read whole.
 
     """
 
     fields: list
+    sample: Optional[dict] = None
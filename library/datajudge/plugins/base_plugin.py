@@ -3,13 +3,15 @@ Base abstract Run Plugin module.
 """
 from abc import ABCMeta, abstractmethod
 from copy import deepcopy
-from typing import Any, List
+from typing import Any, List, Optional
 
 from datajudge.data_reader.utils import build_reader
 from datajudge.plugins.utils.plugin_utils import RenderTuple
+from datajudge.utils.commons import SAMPLE_ARG
 from datajudge.utils.config import DataResource
 from datajudge.utils.exceptions import StoreError
 from datajudge.utils.logger import LOGGER
+from datajudge.utils.sampling_utils import get_sample_args
 from datajudge.utils.utils import get_uiid
 
 
@@ -29,6 +31,8 @@ class Plugin(metaclass=ABCMeta):
         self.exec_multiprocess = False
         self.exec_multithread = False
         self.exec_distributed = False
+        # Description of the sample the plugin worked on, if any
+        self.sample = None
 
     @abstractmethod
     def setup(self, *args, **kwargs) -> None:
@@ -54,6 +58,26 @@ class Plugin(metaclass=ABCMeta):
         Render an artifact to be persisted.
         """
 
+    def fetch_data(self, src: Any) -> Any:
+        """
+        Fetch data with the plugin reader. If a sample is configured
+        in the execution arguments, only a sample is fetched and
+        its description is kept.
+        """
+        sample = get_sample_args(self.exec_args)
+        if sample is None:
+            return self.data_reader.fetch_data(src)
+        data, self.sample = self.data_reader.fetch_sample(src, sample)
+        self.logger.info(f"Sampled {self.sample['rows']} rows - Plugin {self._id}")
+        return data
+
+    def get_lib_args(self) -> dict:
+        """
+        Return the execution arguments to be passed to the library,
+        without the ones used by datajudge.
+        """
+        return {k: v for k, v in (self.exec_args or {}).items() if k != SAMPLE_ARG}
+
     @staticmethod
     def get_render_tuple(obj: Any, filename: str) -> RenderTuple:
         """
@@ -90,9 +114,15 @@ class PluginBuilder:
     Abstract PluginBuilder class.
     """
 
-    def __init__(self, stores: List["ArtifactStore"], exec_args: dict) -> None:
+    def __init__(
+        self,
+        stores: List["ArtifactStore"],
+        exec_args: dict,
+        cache: Optional["DataCache"] = None,
+    ) -> None:
         self.stores = stores
         self.exec_args = exec_args
+        self.cache = cache
 
     @abstractmethod
     def build(self, *args, **kwargs) -> List[Plugin]:
@@ -118,12 +148,13 @@ class PluginBuilder:
                 f"No store registered with name '{resource.store}'. Impossible to fetch resource '{resource.name}'"
             )
 
-    @staticmethod
-    def _get_data_reader(type: str, store: "ArtifactStore") -> "DataReader":
+    def _get_data_reader(
+        self, type: str, store: "ArtifactStore", **kwargs
+    ) -> "DataReader":
         """
-        Get data reader.
+        Get data reader. Readers share the run data cache.
         """
-        return build_reader(type, store)
+        return build_reader(type, store, cache=self.cache, **kwargs)
 
     @abstractmethod
     def destroy(self) -> None:
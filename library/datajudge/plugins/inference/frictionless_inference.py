@@ -10,7 +10,12 @@ from datajudge.metadata.datajudge_reports import DatajudgeSchema
 from datajudge.plugins.base_plugin import PluginBuilder
 from datajudge.plugins.inference.inference_plugin import Inference
 from datajudge.plugins.utils.plugin_utils import exec_decorator
-from datajudge.utils.commons import BASE_FILE_READER, LIBRARY_FRICTIONLESS
+from datajudge.utils.commons import (
+    BASE_FILE_READER,
+    LIBRARY_FRICTIONLESS,
+    PANDAS_DATAFRAME_FILE_READER,
+)
+from datajudge.utils.sampling_utils import get_sample_args
 
 
 class InferencePluginFrictionless(Inference):
@@ -22,6 +27,7 @@ class InferencePluginFrictionless(Inference):
         super().__init__()
         self.resource = None
         self.exec_multiprocess = True
+        self.exec_distributed = True
 
     def setup(
         self, data_reader: "FileReader", resource: "DataResource", exec_args: dict
@@ -39,8 +45,15 @@ class InferencePluginFrictionless(Inference):
         Method that call infer on a resource and return an
         inferred schema.
         """
-        data = self.data_reader.fetch_data(self.resource.path)
-        schema = Schema.describe(path=data, name=self.resource.name, **self.exec_args)
+        data = self.fetch_data(self.resource.path)
+        name = self.resource.name
+        if self.sample is None:
+            schema = Schema.describe(path=data, name=name, **self.get_lib_args())
+        else:
+            # Samples are DataFrames, described as in-memory CSV
+            buffer = data.to_csv(index=False).encode()
+            args = {"format": "csv", "scheme": "buffer", **self.get_lib_args()}
+            schema = Schema.describe(buffer, name=name, **args)
         return Schema(schema.to_dict())
 
     @exec_decorator
@@ -61,7 +74,7 @@ class InferencePluginFrictionless(Inference):
             fields = []
 
         return DatajudgeSchema(
-            self.get_lib_name(), self.get_lib_version(), duration, fields
+            self.get_lib_name(), self.get_lib_version(), duration, fields, self.sample
         )
 
     @exec_decorator
@@ -108,7 +121,16 @@ class InferenceBuilderFrictionless(PluginBuilder):
         for res in resources:
             resource = self._get_resource_deepcopy(res)
             store = self._get_resource_store(resource)
-            data_reader = self._get_data_reader(BASE_FILE_READER, store)
+            # Samples are read as DataFrames
+            if get_sample_args(self.exec_args) is None:
+                data_reader = self._get_data_reader(BASE_FILE_READER, store)
+            else:
+                data_reader = self._get_data_reader(
+                    PANDAS_DATAFRAME_FILE_READER,
+                    store,
+                    partitioned=resource.partitions is not None,
+                    read_only=True,
+                )
             plugin = InferencePluginFrictionless()
             plugin.setup(data_reader, resource, self.exec_args)
             plugins.append(plugin)
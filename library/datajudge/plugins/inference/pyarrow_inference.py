@@ -0,0 +1,176 @@
+"""
+PyArrow implementation of inference plugin.
+"""
+# pylint: disable=import-error
+from datetime import date, datetime, time
+from decimal import Decimal
+from typing import Any, List
+
+import pyarrow as pa
+
+from datajudge.metadata.datajudge_reports import DatajudgeSchema
+from datajudge.plugins.base_plugin import PluginBuilder
+from datajudge.plugins.inference.inference_plugin import Inference
+from datajudge.plugins.utils.plugin_utils import exec_decorator
+from datajudge.utils.commons import LIBRARY_PYARROW, PARQUET_METADATA_READER
+
+
+class InferencePluginPyArrow(Inference):
+    """
+    PyArrow implementation of inference plugin.
+
+    The schema of parquet resources is read from the files
+    footer, so no data is read.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.resource = None
+        self.exec_multithread = True
+
+    def setup(
+        self,
+        data_reader: "ParquetMetadataReader",
+        resource: "DataResource",
+        exec_args: dict,
+    ) -> None:
+        """
+        Set plugin resource.
+        """
+        self.data_reader = data_reader
+        self.resource = resource
+        self.exec_args = exec_args
+
+    @exec_decorator
+    def infer(self) -> dict:
+        """
+        Method that reads the footer of a parquet resource and
+        return an inferred schema with row count and statistics.
+        """
+        desc = self.data_reader.fetch_data(self.resource.path)
+        fields = [self._render_field(field) for field in desc["fields"]]
+        return {"name": self.resource.name, "rows": desc["rows"], "fields": fields}
+
+    def _render_field(self, field: dict) -> dict:
+        """
+        Return a frictionless-like field description.
+        """
+        return {
+            "name": field["name"],
+            "type": self._get_type(field["type"]),
+            "arrowType": str(field["type"]),
+            "constraints": {"required": not field["nullable"]},
+            "min": self._serialize(field["min"]),
+            "max": self._serialize(field["max"]),
+            "nullCount": field["nullCount"],
+        }
+
+    @staticmethod
+    def _get_type(arrow_type: pa.DataType) -> str:
+        """
+        Map an Arrow type to a frictionless type.
+        """
+        if pa.types.is_boolean(arrow_type):
+            return "boolean"
+        if pa.types.is_integer(arrow_type):
+            return "integer"
+        if pa.types.is_floating(arrow_type) or pa.types.is_decimal(arrow_type):
+            return "number"
+        if pa.types.is_string(arrow_type) or pa.types.is_large_string(arrow_type):
+            return "string"
+        if pa.types.is_timestamp(arrow_type) or pa.types.is_date64(arrow_type):
+            return "datetime"
+        if pa.types.is_date32(arrow_type):
+            return "date"
+        if pa.types.is_time(arrow_type):
+            return "time"
+        if pa.types.is_list(arrow_type) or pa.types.is_large_list(arrow_type):
+            return "array"
+        if pa.types.is_struct(arrow_type) or pa.types.is_map(arrow_type):
+            return "object"
+        return "any"
+
+    @staticmethod
+    def _serialize(value: Any) -> Any:
+        """
+        Return a JSON serializable statistic.
+        """
+        if isinstance(value, (date, datetime, time)):
+            return value.isoformat()
+        if isinstance(value, Decimal):
+            return float(value)
+        if isinstance(value, bytes):
+            return value.decode(errors="replace")
+        return value
+
+    @exec_decorator
+    def render_datajudge(self, result: "Result") -> DatajudgeSchema:
+        """
+        Return a DatajudgeSchema.
+        """
+        exec_err = result.errors
+        duration = result.duration
+
+        if exec_err is None:
+            fields = [
+                self._get_fields(field.get("name", ""), field.get("type", ""))
+                for field in result.artifact.get("fields", [])
+            ]
+        else:
+            self.logger.error(f"Execution error {str(exec_err)} for plugin {self._id}")
+            fields = []
+
+        return DatajudgeSchema(
+            self.get_lib_name(), self.get_lib_version(), duration, fields
+        )
+
+    @exec_decorator
+    def render_artifact(self, result: "Result") -> List[tuple]:
+        """
+        Return the inferred schema to be persisted as artifact.
+        """
+        artifacts = []
+        if result.artifact is None:
+            _object = {"errors": result.errors}
+        else:
+            _object = result.artifact
+        filename = self._fn_schema.format(f"{LIBRARY_PYARROW}.json")
+        artifacts.append(self.get_render_tuple(_object, filename))
+        return artifacts
+
+    @staticmethod
+    def get_lib_name() -> str:
+        """
+        Get library name.
+        """
+        return pa.__name__
+
+    @staticmethod
+    def get_lib_version() -> str:
+        """
+        Get library version.
+        """
+        return pa.__version__
+
+
+class InferenceBuilderPyArrow(PluginBuilder):
+    """
+    Inference plugin builder.
+    """
+
+    def build(self, resources: List["DataResource"]) -> List[InferencePluginPyArrow]:
+        """
+        Build a plugin.
+        """
+        plugins = []
+        for res in resources:
+            resource = self._get_resource_deepcopy(res)
+            store = self._get_resource_store(resource)
+            data_reader = self._get_data_reader(PARQUET_METADATA_READER, store)
+            plugin = InferencePluginPyArrow()
+            plugin.setup(data_reader, resource, self.exec_args)
+            plugins.append(plugin)
+        return plugins
+
+    def destroy(self) -> None:
+        ...
@@ -1,19 +1,26 @@
 """
 Plugin builder factory module.
 """
-from typing import List
+from typing import List, Optional
 
 from datajudge.plugins.registry import REGISTRY
 
 
-def builder_factory(config: List["ExecConfig"], typology: str, stores: dict) -> list:
+def builder_factory(
+    config: List["ExecConfig"],
+    typology: str,
+    stores: dict,
+    cache: Optional["DataCache"] = None,
+) -> list:
     """
     Factory method that creates plugin builders.
     """
     builders = []
     for cfg in config:
         try:
-            builders.append(REGISTRY[typology][cfg.library](stores, cfg.execArgs))
+            builders.append(
+                REGISTRY[typology][cfg.library](stores, cfg.execArgs, cache)
+            )
         except KeyError:
             raise NotImplementedError
     return builders
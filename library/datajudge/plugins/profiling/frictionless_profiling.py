@@ -23,6 +23,7 @@ class ProfilePluginFrictionless(Profiling):
         super().__init__()
         self.resource = None
         self.exec_multiprocess = True
+        self.exec_distributed = True
 
     def setup(
         self, data_reader: "FileReader", resource: "DataResource", exec_args: dict
@@ -32,6 +32,7 @@ class ProfilePluginGreatExpectations(Profiling):
         super().__init__()
         self.resource = None
         self.exec_multiprocess = True
+        self.exec_distributed = True
 
     def setup(
         self,
@@ -51,7 +52,7 @@ class ProfilePluginGreatExpectations(Profiling):
         """
         Profile a Data Resource.
         """
-        data = self.data_reader.fetch_data(self.resource.path)
+        data = self.fetch_data(self.resource.path)
         validator = get_great_expectations_validator(
             data, str(self.resource.name), str(self.resource.title)
         )
@@ -77,7 +78,12 @@ class ProfilePluginGreatExpectations(Profiling):
             stats = {}
 
         return DatajudgeProfile(
-            self.get_lib_name(), self.get_lib_version(), duration, stats, fields
+            self.get_lib_name(),
+            self.get_lib_version(),
+            duration,
+            stats,
+            fields,
+            self.sample,
         )
 
     @exec_decorator
@@ -124,7 +130,12 @@ class ProfileBuilderGreatExpectations(PluginBuilder):
         for res in resources:
             resource = self._get_resource_deepcopy(res)
             store = self._get_resource_store(resource)
-            data_reader = self._get_data_reader(PANDAS_DATAFRAME_FILE_READER, store)
+            data_reader = self._get_data_reader(
+                PANDAS_DATAFRAME_FILE_READER,
+                store,
+                partitioned=resource.partitions is not None,
+                read_only=True,
+            )
             plugin = ProfilePluginGreatExpectations()
             plugin.setup(data_reader, resource, self.exec_args)
             plugins.append(plugin)
@@ -46,6 +46,7 @@ class ProfilePluginPandasProfiling(Profiling):
         super().__init__()
         self.resource = None
         self.exec_multiprocess = True
+        self.exec_distributed = True
 
     def setup(
         self,
@@ -158,7 +159,12 @@ class ProfileBuilderPandasProfiling(PluginBuilder):
         for res in resources:
             resource = self._get_resource_deepcopy(res)
             store = self._get_resource_store(resource)
-            data_reader = self._get_data_reader(PANDAS_DATAFRAME_FILE_READER, store)
+            data_reader = self._get_data_reader(
+                PANDAS_DATAFRAME_FILE_READER,
+                store,
+                partitioned=resource.partitions is not None,
+                read_only=True,
+            )
             plugin = ProfilePluginPandasProfiling()
             plugin.setup(data_reader, resource, self.exec_args)
             plugins.append(plugin)
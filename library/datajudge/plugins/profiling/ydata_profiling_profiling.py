@@ -45,6 +45,7 @@ class ProfilePluginYdataProfiling(Profiling):
         super().__init__()
         self.resource = None
         self.exec_multiprocess = True
+        self.exec_distributed = True
 
     def setup(
         self,
@@ -64,8 +65,8 @@ class ProfilePluginYdataProfiling(Profiling):
         """
         Generate ydata_profiling profile.
         """
-        data = self.data_reader.fetch_data(self.resource.path)
-        profile = ProfileReport(data, lazy=False, **self.exec_args)
+        data = self.fetch_data(self.resource.path)
+        profile = ProfileReport(data, lazy=False, **self.get_lib_args())
         return ProfileReport().loads(profile.dumps())
 
     @exec_decorator
@@ -99,7 +100,12 @@ class ProfilePluginYdataProfiling(Profiling):
             stats = {}
 
         return DatajudgeProfile(
-            self.get_lib_name(), self.get_lib_version(), duration, stats, fields
+            self.get_lib_name(),
+            self.get_lib_version(),
+            duration,
+            stats,
+            fields,
+            self.sample,
         )
 
     @exec_decorator
@@ -157,7 +163,12 @@ class ProfileBuilderYdataProfiling(PluginBuilder):
         for res in resources:
             resource = self._get_resource_deepcopy(res)
             store = self._get_resource_store(resource)
-            data_reader = self._get_data_reader(PANDAS_DATAFRAME_FILE_READER, store)
+            data_reader = self._get_data_reader(
+                PANDAS_DATAFRAME_FILE_READER,
+                store,
+                partitioned=resource.partitions is not None,
+                read_only=True,
+            )
             plugin = ProfilePluginYdataProfiling()
             plugin.setup(data_reader, resource, self.exec_args)
             plugins.append(plugin)
@@ -47,6 +47,16 @@ try:
 except ImportError:
     ...
 
+# pyarrow imports
+try:
+    from datajudge.plugins.inference.pyarrow_inference import InferenceBuilderPyArrow
+    from datajudge.utils.commons import LIBRARY_PYARROW
+
+    REGISTRY[OPERATION_INFERENCE][LIBRARY_PYARROW] = InferenceBuilderPyArrow
+
+except ImportError:
+    ...
+
 # great_expectations imports
 try:
     from datajudge.plugins.profiling.great_expectations_profiling import (
@@ -1,9 +1,20 @@
 """
 Frictionless utils module.
 """
-from typing import List, Union
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from copy import deepcopy
+from functools import partial
+from pathlib import Path
+from typing import IO, List, Optional, Union
 
 from datajudge.utils.config import ConstraintFrictionless
+from datajudge.utils.file_cache import FileCache
+from datajudge.utils.uri_utils import get_uri_path
+from datajudge.utils.utils import listify
 
 
 def frictionless_schema_converter(
@@ -90,11 +101,245 @@ from frictionless import Resource, Detector
 custom_frictionless_detector = Detector(buffer_size=20000, sample_size=1250)
 
 
+# Formats read by extension, without dialect/encoding detection
+BINARY_FORMATS = ("parquet", "xls", "xlsx", "ods", "odf")
+
+# Signatures of binary formats read from buffers
+BUFFER_SIGNATURES = {
+    b"PAR1": "parquet",
+    b"PK\x03\x04": "xlsx",
+    b"\xd0\xcf\x11\xe0": "xls",
+}
+
+# Extensions of buffers described as CSV
+TEXT_EXTENSIONS = ("csv", "tsv", "txt")
+
+# Bytes of a text buffer used to detect dialect and encoding
+BUFFER_SAMPLE_SIZE = 1024**2
+
+# Environment variable with the directory of a persistent description index
+ENV_DESCRIBE_INDEX = "DATAJUDGE_DESCRIBE_INDEX"
+
+# Descriptions kept in memory
+DESCRIBE_CACHE_ENTRIES = 1024
+
+# Disk budget in bytes of the description index
+DESCRIBE_INDEX_SIZE = 64 * 1024**2
+
+# Extension of the files of the description index
+DESCRIBE_INDEX_EXTENSION = ".json"
+
+
+class DescriptionIndex(FileCache):
+    """
+    Persistent index of resource descriptions, one JSON file per
+    description. Files are evicted in LRU order once the disk budget
+    is exceeded and are reused across processes.
+    """
+
+    def get(self, key: str) -> Optional[dict]:
+        """
+        Return a persisted description, None if not present.
+        """
+        path = super().get(self._get_digest(key), DESCRIBE_INDEX_EXTENSION)
+        if path is None:
+            return None
+        try:
+            with open(path, "r", encoding="utf-8") as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return None
+
+    def add(self, key: str, desc: dict) -> None:
+        """
+        Persist a description, evicting least recently used ones if
+        the disk budget is exceeded. Every key has its own file,
+        replaced atomically, so concurrent processes never overwrite
+        each other's descriptions.
+        """
+        path = self._write(
+            self._get_digest(key),
+            DESCRIBE_INDEX_EXTENSION,
+            partial(_write_json, desc),
+        )
+        self._evict(keep=path)
+
+    @staticmethod
+    def _get_digest(key: str) -> str:
+        """
+        Return the file name of a description.
+        """
+        return hashlib.sha256(key.encode()).hexdigest()
+
+
+class DescriptionCache:
+    """
+    Cache of resource descriptions keyed by file fingerprint
+    (path, size and modification time), so that a file is described
+    only once until it changes. At most max_entries descriptions are
+    kept in memory and evicted in LRU order. If an index directory is
+    provided, every description is also persisted there and reused
+    across processes.
+    """
+
+    def __init__(
+        self,
+        index: Optional[str] = None,
+        max_entries: int = DESCRIBE_CACHE_ENTRIES,
+        max_index_size: Optional[int] = DESCRIBE_INDEX_SIZE,
+    ) -> None:
+        self.index = None
+        if index is not None:
+            self.index = DescriptionIndex(index, max_index_size)
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def get_key(pth: Union[str, List[str]]) -> Optional[str]:
+        """
+        Return the fingerprint of a (list of) file(s), None if
+        a file does not exist.
+        """
+        fingerprint = []
+        for path in listify(pth):
+            try:
+                stat = os.stat(path)
+            except (OSError, TypeError, ValueError):
+                return None
+            fingerprint.append([os.path.abspath(path), stat.st_size, stat.st_mtime_ns])
+        return json.dumps(fingerprint)
+
+    def get(self, key: str) -> Optional[dict]:
+        """
+        Return a copy of a cached description, None if not present.
+        """
+        with self._lock:
+            desc = self._entries.get(key)
+            if desc is not None:
+                self._entries.move_to_end(key)
+        if desc is None:
+            if self.index is None:
+                return None
+            desc = self.index.get(key)
+            if desc is None:
+                return None
+            self._add_entry(key, desc)
+        return deepcopy(desc)
+
+    def add(self, key: str, desc: dict) -> None:
+        """
+        Add a description to the cache.
+        """
+        self._add_entry(key, deepcopy(desc))
+        if self.index is not None:
+            self.index.add(key, desc)
+
+    def clean_all(self) -> None:
+        """
+        Remove all descriptions from the in-memory cache.
+        """
+        with self._lock:
+            self._entries = OrderedDict()
+
+    def _add_entry(self, key: str, desc: dict) -> None:
+        """
+        Keep a description in memory, evicting the least recently
+        used ones beyond max_entries.
+        """
+        with self._lock:
+            self._entries[key] = desc
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def _write_json(obj: dict, path: str) -> None:
+    """
+    Write an object as JSON file.
+    """
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(obj, file)
+
+
+DESCRIPTION_CACHE = DescriptionCache(os.environ.get(ENV_DESCRIBE_INDEX))
+
+
 def describe_resource(pth: str) -> dict:
     """
-    Describe a resource using frictionless.
+    Describe a resource using frictionless. Binary formats are
+    described by extension, other descriptions are cached by file
+    fingerprint.
     """
+    desc = _describe_by_extension(pth)
+    if desc is not None:
+        return desc
+
+    key = DESCRIPTION_CACHE.get_key(pth)
+    if key is not None:
+        desc = DESCRIPTION_CACHE.get(key)
+        if desc is not None:
+            # The same file could be referenced by another path
+            desc["path"] = pth
+            return desc
+
     desc = Resource.describe(
         source=pth, expand=True, detector=custom_frictionless_detector
-    )
-    return desc.to_dict()
+    ).to_dict()
+    if key is not None:
+        DESCRIPTION_CACHE.add(key, desc)
+    return desc
+
+
+def describe_buffer(buffer: IO, src: Optional[str] = None) -> dict:
+    """
+    Describe a resource in a binary buffer. Binary formats are detected
+    by signature. Other buffers are described by the extension of the
+    source, if any, and only CSV files (or sources without extension)
+    are described by frictionless on a sample.
+    """
+    file_format = BUFFER_SIGNATURES.get(buffer.read(4))
+    buffer.seek(0)
+    if file_format is None and src is not None:
+        extension = Path(get_uri_path(str(src))).suffix.lower().lstrip(".")
+        if extension and extension not in TEXT_EXTENSIONS:
+            file_format = extension
+    if file_format is not None:
+        return {"path": buffer, "format": file_format, "scheme": "buffer"}
+
+    sample = buffer.read(BUFFER_SAMPLE_SIZE)
+    buffer.seek(0)
+    # Do not pass a truncated row to the detector
+    if len(sample) == BUFFER_SAMPLE_SIZE and b"\n" in sample:
+        sample = sample[: sample.rfind(b"\n") + 1]
+    desc = Resource.describe(
+        source=sample,
+        format="csv",
+        scheme="buffer",
+        detector=custom_frictionless_detector,
+    ).to_dict()
+    desc["path"] = buffer
+    return desc
+
+
+def _describe_by_extension(pth: Union[str, List[str]]) -> Optional[dict]:
+    """
+    Return a minimal description for files in binary formats,
+    None if format detection is needed.
+    """
+    paths = listify(pth)
+    formats = {Path(str(i)).suffix.lower().lstrip(".") for i in paths}
+    if len(formats) != 1:
+        return None
+    file_format = formats.pop()
+    if file_format not in BINARY_FORMATS or not all(os.path.exists(i) for i in paths):
+        return None
+    return {
+        "path": pth,
+        "name": Path(str(paths[0])).stem.lower(),
+        "format": file_format,
+        "scheme": "file",
+    }
@@ -13,6 +13,12 @@ from datajudge.utils.commons import (
     CONSTRAINT_SQL_RANGE,
 )
 
+# Number of rows fetched as sample of a query result
+ROWS_SAMPLE = 100
+
+# Column holding the number of rows of a query result
+COUNT_COLUMN = "_dj_count"
+
 
 def evaluate_validity(result: Any, expect: str, value: Any) -> tuple:
     """
@@ -118,3 +124,190 @@ def evaluate_range(result: Any, _range: str) -> tuple:
             )
     except ValueError:
         return False, "Invalid range format."
+
+
+# Simple single table query: SELECT <expr> FROM <table> [WHERE <condition>]
+SIMPLE_QUERY = re.compile(
+    r"^\s*select\s+(?P<expr>.+?)\s+from\s+(?P<table>[\w\.\"]+)"
+    r"(?:\s+where\s+(?P<where>.+?))?\s*;?\s*$",
+    re.IGNORECASE | re.DOTALL,
+)
+UNSUPPORTED_KEYWORDS = re.compile(
+    r"\b(select|from|join|group|order|having|limit|union|distinct|over)\b",
+    re.IGNORECASE,
+)
+FUNCTION_CALL = re.compile(r"(\w+)\s*\(")
+IDENTIFIER = re.compile(r"\b[a-z_]\w*\b(?!\s*\()", re.IGNORECASE)
+STRING_LITERAL = re.compile(r"'[^']*'")
+
+# Aggregate functions that return a single value over the whole table
+AGGREGATE_FUNCTIONS = frozenset(
+    (
+        "any_value",
+        "avg",
+        "bool_and",
+        "bool_or",
+        "count",
+        "max",
+        "mean",
+        "median",
+        "min",
+        "stddev",
+        "stddev_pop",
+        "stddev_samp",
+        "sum",
+        "var_pop",
+        "var_samp",
+        "variance",
+    )
+)
+
+
+def parse_simple_query(query: str) -> Union[dict, None]:
+    """
+    Parse a query of the form "SELECT <expr> FROM <table> [WHERE <condition>]"
+    that returns a single value computed with aggregate functions. Columns
+    can appear only inside aggregate calls, so scalar expressions that
+    return a row per record (e.g. "lower(col)") are never fused. Return a
+    dictionary with expression, table and condition, None if the query
+    does not match.
+    """
+    mtc = SIMPLE_QUERY.match(query)
+    if mtc is None:
+        return None
+    expr = mtc.group("expr").strip()
+    where = mtc.group("where")
+    for part in (expr, where or ""):
+        if UNSUPPORTED_KEYWORDS.search(part) or not _balanced(part):
+            return None
+    if _has_top_level_comma(expr) or not _is_aggregate(expr):
+        return None
+    # A filter can be attached only to a single aggregate call
+    if where is not None and not (
+        _is_single_call(expr)
+        and FUNCTION_CALL.match(expr).group(1).lower() in AGGREGATE_FUNCTIONS
+    ):
+        return None
+    return {"expr": expr, "table": mtc.group("table"), "where": where}
+
+
+def build_fused_query(table: str, parsed: list) -> str:
+    """
+    Build a single query that computes many expressions over
+    the same table. Conditions are pushed in FILTER clauses.
+    """
+    columns = []
+    for idx, pars in enumerate(parsed):
+        expr = pars["expr"]
+        if pars["where"] is not None:
+            expr = f"{expr} FILTER (WHERE {pars['where']})"
+        columns.append(f'{expr} AS "c{idx}"')
+    return f"SELECT {', '.join(columns)} FROM {table};"
+
+
+def _balanced(string: str) -> bool:
+    """
+    Check that parenthesis and quotes are balanced.
+    """
+    depth = 0
+    for char in string:
+        if char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+            if depth < 0:
+                return False
+    return depth == 0 and string.count("'") % 2 == 0 and string.count('"') % 2 == 0
+
+
+def _is_aggregate(string: str) -> bool:
+    """
+    Check if a string calls aggregate functions and references
+    columns only inside them, e.g. "round(avg(x), 2)".
+    """
+    found = False
+    parts = []
+    pos = 0
+    while True:
+        mtc = FUNCTION_CALL.search(string, pos)
+        if mtc is None:
+            break
+        if mtc.group(1).lower() not in AGGREGATE_FUNCTIONS:
+            parts.append(string[pos : mtc.end()])
+            pos = mtc.end()
+            continue
+        # Skip the arguments of the aggregate call
+        parts.append(string[pos : mtc.start()])
+        depth = 0
+        for idx in range(mtc.end() - 1, len(string)):
+            if string[idx] == "(":
+                depth += 1
+            elif string[idx] == ")":
+                depth -= 1
+                if depth == 0:
+                    break
+        pos = idx + 1
+        found = True
+    parts.append(string[pos:])
+    rest = STRING_LITERAL.sub("", "".join(parts))
+    return found and IDENTIFIER.search(rest) is None
+
+
+def _is_single_call(string: str) -> bool:
+    """
+    Check if a string is a single function call, e.g. "sum(x)".
+    """
+    mtc = re.match(r"^\w+\s*\(", string)
+    if mtc is None or not string.endswith(")"):
+        return False
+    depth = 0
+    for idx, char in enumerate(string[mtc.end() - 1 :]):
+        if char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+            if depth == 0:
+                return mtc.end() + idx == len(string)
+    return False
+
+
+def _has_top_level_comma(string: str) -> bool:
+    """
+    Check if a string contains a comma outside parenthesis.
+    """
+    depth = 0
+    for char in string:
+        if char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif char == "," and depth == 0:
+            return True
+    return False
+
+
+def wrap_count_query(query: str) -> str:
+    """
+    Wrap a query to count the rows it returns.
+    """
+    return f"SELECT COUNT(*) FROM ({_strip_query(query)}) dj_q"
+
+
+def wrap_counted_query(query: str, limit: int) -> str:
+    """
+    Wrap a query to return at most limit rows, each with the total
+    number of rows of the result in the COUNT_COLUMN column.
+    LIMIT is not standard SQL (e.g. MSSQL uses TOP), so this is
+    meant for DuckDB only.
+    """
+    return (
+        f'SELECT dj_q.*, COUNT(*) OVER () AS "{COUNT_COLUMN}" '
+        f"FROM ({_strip_query(query)}) dj_q LIMIT {int(limit)}"
+    )
+
+
+def _strip_query(query: str) -> str:
+    """
+    Remove trailing semicolons and whitespaces from a query.
+    """
+    return query.strip().rstrip(";").strip()
@@ -5,30 +5,47 @@ DuckDB implementation of validation plugin.
 import shutil
 from copy import deepcopy
 from pathlib import Path
-from typing import List, Any
+from typing import Any, Iterator, List, Optional
 
 import duckdb
+import pyarrow as pa
 
 from datajudge.metadata.datajudge_reports import DatajudgeReport
 from datajudge.plugins.utils.plugin_utils import exec_decorator, ValidationReport
-from datajudge.plugins.utils.sql_checks import evaluate_validity
+from datajudge.plugins.utils.sql_checks import (
+    build_fused_query,
+    evaluate_validity,
+    parse_simple_query,
+)
 from datajudge.plugins.validation.validation_plugin import (
-    Validation,
+    SQLValidation,
     ValidationPluginBuilder,
 )
 from datajudge.utils.commons import (
+    BASE_FILE_READER,
     POLARS_DATAFRAME_FILE_READER,
     PANDAS_DATAFRAME_FILE_READER,
     PANDAS_DATAFRAME_DUCKDB_READER,
+    DEFAULT_BATCH_SIZE,
     DEFAULT_DIRECTORY,
+    DEFAULT_READ_WORKERS,
     LIBRARY_DUCKDB,
-    CONSTRAINT_SQL_CHECK_ROWS,
     CONSTRAINT_SQL_CHECK_VALUE,
+    RESULT_DATAJUDGE,
+    RESULT_LIBRARY,
+    RESULT_RENDERED,
+    RESULT_WRAPPED,
 )
-from datajudge.utils.utils import flatten_list, get_uiid, listify
+from datajudge.utils.arrow_utils import fits_schema, promote_schema
+from datajudge.utils.file_utils import get_absolute_path
+from datajudge.utils.utils import flatten_list, get_uiid, listify, parallel_map
+
+# File extensions that DuckDB can scan directly
+CSV_EXTENSIONS = [".csv", ".tsv", ".txt"]
+PARQUET_EXTENSIONS = [".parquet", ".parq"]
 
 
-class ValidationPluginDuckDB(Validation):
+class ValidationPluginDuckDB(SQLValidation):
     """
     DuckDB implementation of validation plugin.
     """
@@ -36,6 +53,7 @@ class ValidationPluginDuckDB(Validation):
     def __init__(self) -> None:
         super().__init__()
         self.db = None
+        # Not distributed: the database is a file local to the client
         self.exec_multiprocess = True
 
     def setup(
@@ -61,8 +79,7 @@ class ValidationPluginDuckDB(Validation):
         Validate a Data Resource.
         """
         try:
-            data = self.data_reader.fetch_data(self.db, self.constraint.query)
-            value = self._filter_result(data)
+            value, data = self._fetch_result(self.db, self.constraint.query)
             valid, errors = evaluate_validity(
                 value, self.constraint.expect, self.constraint.value
             )
@@ -71,21 +88,6 @@ class ValidationPluginDuckDB(Validation):
         except Exception as ex:
             raise ex
 
-    def _filter_result(self, data: Any) -> Any:
-        """
-        Return value or size of DataFrame for SQL checks.
-        """
-        if self.constraint.check == CONSTRAINT_SQL_CHECK_VALUE:
-            return self.data_reader.return_first_value(data)
-        elif self.constraint.check == CONSTRAINT_SQL_CHECK_ROWS:
-            return self.data_reader.return_length(data)
-
-    def _shorten_data(self, data: Any) -> Any:
-        """
-        Return a short version of data.
-        """
-        return self.data_reader.return_head(data)
-
     @exec_decorator
     def render_datajudge(self, result: "Result") -> DatajudgeReport:
         """
@@ -145,6 +147,90 @@ class ValidationPluginDuckDB(Validation):
         return duckdb.__version__
 
 
+class ValidationPluginDuckDBFused(ValidationPluginDuckDB):
+    """
+    DuckDB implementation of validation plugin that evaluates
+    many scalar constraints over the same resource with a single
+    query, so the resource is scanned only once.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.constraints = None
+        self.query = None
+
+    def setup(
+        self,
+        data_reader: "NativeReader",
+        db: str,
+        constraints: List["ConstraintDuckDB"],
+        query: str,
+        error_report: str,
+        exec_args: dict,
+    ) -> None:
+        """
+        Set plugin resource.
+        """
+        super().setup(data_reader, db, constraints[0], error_report, exec_args)
+        self.constraints = constraints
+        self.query = query
+
+    def execute(self) -> dict:
+        """
+        Execute the fused query and split results in a report
+        for each constraint. If the fused query fails, constraints
+        are validated one by one.
+        """
+        plugin = f"Plugin: {self.lib_name} {self._id};"
+        constraints = f"Constraints: {[const.name for const in self.constraints]};"
+        self.logger.info(f"Execute fused validation - {plugin} {constraints}")
+        fused_result = self._fetch_fused()
+        if fused_result.errors is not None:
+            self.logger.info(
+                f"Fused query failed, validate constraints one by one - {plugin}"
+            )
+
+        results = {
+            RESULT_WRAPPED: [],
+            RESULT_DATAJUDGE: [],
+            RESULT_RENDERED: [],
+            RESULT_LIBRARY: [],
+        }
+        for idx, const in enumerate(self.constraints):
+            self.constraint = const
+            if fused_result.errors is None:
+                lib_result = self._validate_fused(fused_result.artifact, idx)
+                shared_time = fused_result.duration / len(self.constraints)
+                lib_result.duration = round(lib_result.duration + shared_time, 2)
+            else:
+                lib_result = self.validate()
+            results[RESULT_WRAPPED].append(lib_result)
+            results[RESULT_DATAJUDGE].append(self.render_datajudge(lib_result))
+            results[RESULT_RENDERED].append(self.render_artifact(lib_result))
+            results[RESULT_LIBRARY].append(self.get_library())
+        return results
+
+    @exec_decorator
+    def _fetch_fused(self) -> Any:
+        """
+        Execute fused query.
+        """
+        return self.data_reader.fetch_data(self.db, self.query)
+
+    @exec_decorator
+    def _validate_fused(self, data: Any, idx: int) -> ValidationReport:
+        """
+        Validate a constraint over its column of the fused query result.
+        """
+        data = data.iloc[:, [idx]]
+        value = self._filter_result(data)
+        valid, errors = evaluate_validity(
+            value, self.constraint.expect, self.constraint.value
+        )
+        result = self._shorten_data(data)
+        return ValidationReport(result, valid, errors)
+
+
 class ValidationBuilderDuckDB(ValidationPluginBuilder):
     """
     DuckDB validation plugin builder.
@@ -157,7 +243,8 @@ class ValidationBuilderDuckDB(ValidationPluginBuilder):
         error_report: str,
     ) -> List[ValidationPluginDuckDB]:
         """
-        Build a plugin for every resource and every constraint.
+        Build a plugin for every constraint. Scalar constraints on
+        the same resource are grouped in a single fused plugin.
         """
         self._setup_connection()
         f_constraint = self._filter_constraints(constraints)
@@ -166,8 +253,10 @@ class ValidationBuilderDuckDB(ValidationPluginBuilder):
             self._register_resources(res)
         self._tear_down_connection()
 
+        fused, single = self._plan_queries(f_constraint)
+
         plugins = []
-        for const in f_constraint:
+        for const in single:
             data_reader = self._get_data_reader(PANDAS_DATAFRAME_DUCKDB_READER, None)
             plugin = ValidationPluginDuckDB()
             plugin.setup(
@@ -175,8 +264,55 @@ class ValidationBuilderDuckDB(ValidationPluginBuilder):
             )
             plugins.append(plugin)
 
+        for consts, query in fused:
+            data_reader = self._get_data_reader(PANDAS_DATAFRAME_DUCKDB_READER, None)
+            plugin = ValidationPluginDuckDBFused()
+            plugin.setup(
+                data_reader,
+                str(self.tmp_db),
+                consts,
+                query,
+                error_report,
+                self.exec_args,
+            )
+            plugins.append(plugin)
+
         return plugins
 
+    def _plan_queries(self, constraints: List["ConstraintDuckDB"]) -> tuple:
+        """
+        Group constraints with check "value" whose query is a single
+        expression over a single table. Every group with more than one
+        constraint is evaluated with one fused query.
+        Return a list of (constraints, fused query) and the list of
+        constraints to evaluate one by one.
+        """
+        if not self.exec_args.get("fuse", True):
+            return [], constraints
+
+        groups = {}
+        single = []
+        for const in constraints:
+            parsed = None
+            if const.check == CONSTRAINT_SQL_CHECK_VALUE:
+                parsed = parse_simple_query(const.query)
+            if parsed is None:
+                single.append(const)
+            else:
+                table = parsed["table"].lower()
+                groups.setdefault(table, []).append((const, parsed))
+
+        fused = []
+        for group in groups.values():
+            if len(group) == 1:
+                single.append(group[0][0])
+                continue
+            table = group[0][1]["table"]
+            query = build_fused_query(table, [pars for _, pars in group])
+            fused.append(([const for const, _ in group], query))
+
+        return fused, single
+
     def _setup_connection(self) -> None:
         """
         Setup db connection.
@@ -208,31 +344,149 @@ class ValidationBuilderDuckDB(ValidationPluginBuilder):
 
     def _register_resources(self, resource: "DataResource") -> None:
         """
-        Register resource in db.
+        Register resource in db. CSV and parquet files are registered
+        as views over the fetched files, so data are scanned directly
+        by DuckDB and never copied into the db (or copied by DuckDB
+        itself if materialized). Other formats are loaded through a
+        DataFrame reader and copied into a table.
         """
         store = self._get_resource_store(resource)
-        data_reader = self._get_reader(store)
-        df = self._get_data(data_reader, listify(resource.path))
+        paths = listify(resource.path)
+        file_reader = self._get_data_reader(BASE_FILE_READER, store)
+        files = [get_absolute_path(f) for f in file_reader.fetch_data(paths)]
+        scan = self._get_scan_function(files)
+        if scan is None:
+            self._create_table(resource, store, paths)
+            return
+
+        files = ", ".join([f"'{self._escape(f)}'" for f in files])
+        # Files of partitioned resources expose partitions as columns
+        hive = ", hive_partitioning=1" if resource.partitions is not None else ""
+        # DuckDB infers column types over the whole files
+        kind = "TABLE" if self.exec_args.get("materialize", False) else "VIEW"
         self.con.execute(
-            f"CREATE TABLE IF NOT EXISTS {resource.name} AS SELECT * FROM df;"
+            f"CREATE {kind} IF NOT EXISTS {resource.name} AS "
+            f"SELECT * FROM {scan}([{files}]{hive});"
         )
 
-    def _get_reader(self, store: "ArtifactStore") -> "NativeReader":
+    def _create_table(
+        self, resource: "DataResource", store: "ArtifactStore", paths: list
+    ) -> None:
+        """
+        Copy resource into a db table. Data are read and inserted in
+        batches, so resources larger than memory can be loaded.
+        """
+        data_reader = self._get_reader(store, resource.partitions is not None)
+        batch_size = self.exec_args.get("batch_size", DEFAULT_BATCH_SIZE)
+        try:
+            batches = data_reader.fetch_batches(paths, batch_size)
+            self._insert_batches(resource.name, data_reader, batches)
+        except NotImplementedError:
+            df = self._get_data(data_reader, paths)
+            self.con.execute(
+                f"CREATE TABLE IF NOT EXISTS {resource.name} AS SELECT * FROM df;"
+            )
+
+    def _insert_batches(
+        self, table: str, data_reader: "NativeReader", batches: Iterator[Any]
+    ) -> None:
+        """
+        Create a table from the first batch and append the others.
+        Column types are inferred batch by batch, so if a batch does
+        not fit the table (e.g. floats after integers), the table
+        columns are promoted before the batch is inserted.
+        """
+        schema = None
+        for batch in batches:
+            data = data_reader.to_arrow(batch)
+            if schema is None:
+                schema = data.schema
+                query = f"CREATE TABLE IF NOT EXISTS {table} AS SELECT * FROM dj_batch;"
+            elif not fits_schema(data.schema, schema):
+                promoted = promote_schema(schema, data.schema)
+                data = data.cast(promoted)
+                self._alter_columns(table, data, schema, promoted)
+                schema = promoted
+            self.con.register("dj_batch", self._cast_null_columns(data))
+            self.con.execute(query)
+            self.con.unregister("dj_batch")
+            query = f"INSERT INTO {table} SELECT * FROM dj_batch;"
+
+    def _alter_columns(
+        self, table: str, data: pa.Table, schema: pa.Schema, promoted: pa.Schema
+    ) -> None:
+        """
+        Change the type of the table columns promoted by a batch. The
+        DuckDB types are those of the batch cast to the promoted schema.
+        """
+        self.con.register("dj_batch", self._cast_null_columns(data))
+        types = self.con.execute("DESCRIBE SELECT * FROM dj_batch;").fetchall()
+        self.con.unregister("dj_batch")
+        for field, new_field, col in zip(schema, promoted, types):
+            if field.type != new_field.type:
+                self.con.execute(f'ALTER TABLE {table} ALTER "{col[0]}" TYPE {col[1]};')
+
+    @staticmethod
+    def _cast_null_columns(data: pa.Table) -> pa.Table:
+        """
+        Cast the columns without a type (all values null) of an Arrow
+        table to integers, the type DuckDB gives them, because DuckDB
+        can crash scanning Arrow null arrays.
+        """
+        for idx, field in enumerate(data.schema):
+            if pa.types.is_null(field.type):
+                column = pa.nulls(len(data), pa.int32())
+                data = data.set_column(idx, field.with_type(pa.int32()), column)
+        return data
+
+    @staticmethod
+    def _get_scan_function(files: List[str]) -> Optional[str]:
+        """
+        Return the DuckDB table function able to scan all files,
+        None if files formats are mixed or not supported.
+        """
+        scans = set()
+        for file in files:
+            ext = Path(file).suffix.lower()
+            if ext in CSV_EXTENSIONS:
+                scans.add("read_csv_auto")
+            elif ext in PARQUET_EXTENSIONS:
+                scans.add("read_parquet")
+            else:
+                return None
+        if len(scans) != 1:
+            return None
+        return scans.pop()
+
+    @staticmethod
+    def _escape(string: str) -> str:
+        """
+        Escape single quotes in SQL string literals.
+        """
+        return string.replace("'", "''")
+
+    def _get_reader(
+        self, store: "ArtifactStore", partitioned: bool = False
+    ) -> "NativeReader":
         """
         Get reader. Preference goes to polars, otherwise, use pandas.
         """
         try:
-            return self._get_data_reader(POLARS_DATAFRAME_FILE_READER, store)
+            return self._get_data_reader(
+                POLARS_DATAFRAME_FILE_READER, store, partitioned=partitioned
+            )
         except KeyError:
             self.logger.info(f"Polars not installed, using pandas.")
-            return self._get_data_reader(PANDAS_DATAFRAME_FILE_READER, store)
+            return self._get_data_reader(
+                PANDAS_DATAFRAME_FILE_READER, store, partitioned=partitioned
+            )
 
     @staticmethod
     def _get_data(data_reader: "NativeReader", paths: list) -> Any:
         """
         Fetch data from paths.
         """
-        dfs = [data_reader.fetch_data(pth) for pth in paths]
+        dfs = parallel_map(data_reader.fetch_data, paths, DEFAULT_READ_WORKERS)
         return data_reader.concat_data(dfs)
 
     def _tear_down_connection(self) -> None:
@@ -32,6 +32,7 @@ class ValidationPluginEvidently(Validation):
         self.resource = None
         self.reference_resource = None
         self.exec_multiprocess = True
+        self.exec_distributed = True
 
     def setup(
         self,
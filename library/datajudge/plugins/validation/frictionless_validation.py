@@ -31,6 +31,7 @@ class ValidationPluginFrictionless(Validation):
         self.resource = None
         self.schema = None
         self.exec_multiprocess = True
+        self.exec_distributed = True
 
     def setup(
         self,
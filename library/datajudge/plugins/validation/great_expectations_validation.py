@@ -33,6 +33,7 @@ class ValidationPluginGreatExpectations(Validation):
         super().__init__()
         self.resource = None
         self.exec_multiprocess = True
+        self.exec_distributed = True
 
     def setup(
         self,
@@ -162,7 +163,10 @@ class ValidationBuilderGreatExpectations(ValidationPluginBuilder):
                 if resource.name in const.resources:
                     store = self._get_resource_store(resource)
                     data_reader = self._get_data_reader(
-                        PANDAS_DATAFRAME_FILE_READER, store
+                        PANDAS_DATAFRAME_FILE_READER,
+                        store,
+                        partitioned=resource.partitions is not None,
+                        read_only=True,
                     )
                     plugin = ValidationPluginGreatExpectations()
                     plugin.setup(
@@ -2,29 +2,29 @@
 SQLAlchemy implementation of validation plugin.
 """
 from copy import deepcopy
-from typing import List, Any
+from typing import List
 
 import sqlalchemy
 
 from datajudge.metadata.datajudge_reports import DatajudgeReport
 from datajudge.plugins.utils.plugin_utils import exec_decorator, ValidationReport
-from datajudge.plugins.utils.sql_checks import evaluate_validity
+from datajudge.plugins.utils.sql_checks import (
+    evaluate_validity,
+)
 from datajudge.plugins.validation.validation_plugin import (
-    Validation,
+    SQLValidation,
     ValidationPluginBuilder,
 )
 from datajudge.utils.commons import (
     PANDAS_DATAFRAME_SQL_READER,
     LIBRARY_SQLALCHEMY,
     STORE_SQL,
-    CONSTRAINT_SQL_CHECK_ROWS,
-    CONSTRAINT_SQL_CHECK_VALUE,
 )
 from datajudge.utils.exceptions import ValidationError
 from datajudge.utils.utils import flatten_list
 
 
-class ValidationPluginSqlAlchemy(Validation):
+class ValidationPluginSqlAlchemy(SQLValidation):
     """
     SQLAlchemy implementation of validation plugin.
     """
@@ -32,6 +32,7 @@ class ValidationPluginSqlAlchemy(Validation):
     def __init__(self) -> None:
         super().__init__()
         self.exec_multiprocess = True
+        self.exec_distributed = True
 
     def setup(
         self,
@@ -54,10 +55,9 @@ class ValidationPluginSqlAlchemy(Validation):
         Validate a Data Resource.
         """
         try:
-            data = self.data_reader.fetch_data(
+            value, data = self._fetch_result(
                 self.constraint.name, self.constraint.query
             )
-            value = self._filter_result(data)
             valid, errors = evaluate_validity(
                 value, self.constraint.expect, self.constraint.value
             )
@@ -66,21 +66,6 @@ class ValidationPluginSqlAlchemy(Validation):
         except Exception as ex:
             raise ex
 
-    def _filter_result(self, data: Any) -> Any:
-        """
-        Return value or size of DataFrame for SQL checks.
-        """
-        if self.constraint.check == CONSTRAINT_SQL_CHECK_VALUE:
-            return self.data_reader.return_first_value(data)
-        elif self.constraint.check == CONSTRAINT_SQL_CHECK_ROWS:
-            return self.data_reader.return_length(data)
-
-    def _shorten_data(self, data: Any) -> Any:
-        """
-        Return a short version of data.
-        """
-        return self.data_reader.return_head(data)
-
     @exec_decorator
     def render_datajudge(self, result: "Result") -> DatajudgeReport:
         """
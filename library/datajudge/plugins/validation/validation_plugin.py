@@ -5,7 +5,10 @@ from abc import ABCMeta, abstractmethod
 from typing import Any, List
 
 from datajudge.plugins.base_plugin import Plugin, PluginBuilder
+from datajudge.plugins.utils.sql_checks import ROWS_SAMPLE
 from datajudge.utils.commons import (
+    CONSTRAINT_SQL_CHECK_ROWS,
+    CONSTRAINT_SQL_CHECK_VALUE,
     RESULT_DATAJUDGE,
     RESULT_LIBRARY,
     RESULT_RENDERED,
@@ -81,6 +84,39 @@ class Validation(Plugin, metaclass=ABCMeta):
         return {"count": count, "records": records}
 
 
+class SQLValidation(Validation, metaclass=ABCMeta):
+    """
+    Validation plugin that executes SQL checks over a Resource.
+    """
+
+    def _fetch_result(self, src: str, query: str) -> tuple:
+        """
+        Return the value to check and a sample of the query result.
+        For checks on rows, the rows are counted by the database and
+        only a sample of ROWS_SAMPLE rows is fetched, so memory stays
+        bounded whatever the size of the query result.
+        """
+        if self.constraint.check == CONSTRAINT_SQL_CHECK_ROWS:
+            return self.data_reader.fetch_rows(src, query, ROWS_SAMPLE)
+        data = self.data_reader.fetch_data(src, query)
+        return self._filter_result(data), data
+
+    def _filter_result(self, data: Any) -> Any:
+        """
+        Return value or size of DataFrame for SQL checks.
+        """
+        if self.constraint.check == CONSTRAINT_SQL_CHECK_VALUE:
+            return self.data_reader.return_first_value(data)
+        elif self.constraint.check == CONSTRAINT_SQL_CHECK_ROWS:
+            return self.data_reader.return_length(data)
+
+    def _shorten_data(self, data: Any) -> Any:
+        """
+        Return a short version of data.
+        """
+        return self.data_reader.return_head(data)
+
+
 class ValidationPluginBuilder(PluginBuilder):
     """
     Validation plugin builder.
@@ -0,0 +1,147 @@
+"""
+Data cache module.
+"""
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Optional
+
+from datajudge.utils.logger import LOGGER
+
+
+class DataCache:
+    """
+    Run-scoped cache of materialized data.
+
+    The DataCache keeps track of the objects produced by the
+    DataReaders (e.g. parsed DataFrames) so that a resource
+    is fetched and parsed only once per run, whatever the number
+    of plugins that need it. Entries are evicted in LRU order
+    once the memory budget is exceeded.
+
+    Attributes
+    ----------
+    max_size : int, default = None
+        Memory budget in bytes. If None, the cache is unbounded.
+        If 0, the cache is disabled.
+    disk : DiskCache, default = None
+        Cache that persists parsed data across runs.
+
+    """
+
+    def __init__(
+        self, max_size: Optional[int] = None, disk: Optional["DiskCache"] = None
+    ) -> None:
+        self.max_size = max_size
+        self.disk = disk
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._key_locks = {}
+        self.logger = LOGGER
+
+    @staticmethod
+    def get_key(reader: "DataReader", src: Any) -> tuple:
+        """
+        Return the cache key for a resource read by a reader.
+        Readers of partitioned resources add partition columns.
+        """
+        store = getattr(reader.store, "name", None)
+        partitioned = getattr(reader, "partitioned", False)
+        return (type(reader).__name__, store, str(src), partitioned)
+
+    def get_or_fetch(
+        self,
+        key: tuple,
+        fetch_fnc: Callable,
+        size_fnc: Callable,
+    ) -> Any:
+        """
+        Return a cached object or fetch it and cache it.
+        Concurrent requests for the same key wait for the
+        first fetch instead of parsing data twice.
+        """
+        if self.max_size == 0:
+            return fetch_fnc()
+
+        with self._get_key_lock(key):
+            obj = self.get(key)
+            if obj is not None:
+                return obj
+            obj = fetch_fnc()
+            self.add(key, obj, size_fnc(obj))
+            return obj
+
+    def get(self, key: tuple) -> Any:
+        """
+        Return a cached object, None if not present.
+        """
+        with self._lock:
+            try:
+                obj, _ = self._entries[key]
+            except KeyError:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return obj
+
+    def add(self, key: tuple, obj: Any, size: int) -> None:
+        """
+        Add an object to the cache, evicting least recently
+        used entries if the memory budget is exceeded.
+        """
+        if self.max_size is not None and size > self.max_size:
+            self.logger.info(
+                f"Object of {size} bytes exceeds cache budget, not cached."
+            )
+            return
+        with self._lock:
+            if key in self._entries:
+                return
+            self._entries[key] = (obj, size)
+            self.size += size
+            self._evict()
+
+    def _evict(self) -> None:
+        """
+        Evict least recently used entries until the cache
+        fits the memory budget.
+        """
+        if self.max_size is None:
+            return
+        while self.size > self.max_size and self._entries:
+            key, (_, size) = self._entries.popitem(last=False)
+            self.size -= size
+            self.logger.info(f"Evicted {key} from data cache ({size} bytes).")
+
+    def _get_key_lock(self, key: tuple) -> threading.Lock:
+        """
+        Return the lock associated with a key.
+        """
+        with self._lock:
+            return self._key_locks.setdefault(key, threading.Lock())
+
+    def clean_all(self) -> None:
+        """
+        Remove all objects from cache.
+        """
+        with self._lock:
+            self._entries = OrderedDict()
+            self._key_locks = {}
+            self.size = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: tuple) -> bool:
+        return key in self._entries
+
+    def __getstate__(self) -> dict:
+        # Cached objects and locks are not shipped to other processes,
+        # every process starts with an empty cache with the same budget.
+        return {"max_size": self.max_size, "disk": self.disk}
+
+    def __setstate__(self, state: dict) -> None:
+        self.__init__(state["max_size"], state["disk"])
@@ -0,0 +1,62 @@
+"""
+Disk cache module.
+"""
+import hashlib
+import json
+from functools import partial
+from typing import List, Optional
+
+from datajudge.utils.file_cache import FileCache
+from datajudge.utils.io_utils import write_arrow_ipc
+
+# Extension of the cached files
+CACHE_EXTENSION = ".arrow"
+
+
+class DiskCache(FileCache):
+    """
+    Cross-run cache of parsed data.
+
+    The DiskCache persists the data parsed by the DataReaders as
+    Arrow IPC files, keyed by source, version of the source
+    (e.g. ETag or modification time) and reader. Later runs
+    memory-map those files instead of fetching and parsing the
+    sources again. Files are evicted in LRU order, by access time,
+    once the disk budget is exceeded. The state of the cache is
+    the directory itself, so it can be shared by many processes.
+
+    Attributes
+    ----------
+    path : str
+        Cache directory.
+    max_size : int, default = None
+        Disk budget in bytes. If None, the cache is unbounded.
+
+    """
+
+    @staticmethod
+    def get_key(reader: "DataReader", src: str, versions: List[str]) -> str:
+        """
+        Return the cache key for a version of a resource read by a reader.
+        """
+        reader_type = f"{type(reader).__module__}.{type(reader).__name__}"
+        uri = getattr(reader.store, "artifact_uri", None)
+        partitioned = getattr(reader, "partitioned", False)
+        key = json.dumps([reader_type, uri, str(src), partitioned, versions])
+        return hashlib.sha256(key.encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Return the path of a cached file, None if not present.
+        """
+        return super().get(key, CACHE_EXTENSION)
+
+    def add(self, key: str, table: "pa.Table") -> str:
+        """
+        Write an Arrow table in the cache and return its path,
+        evicting least recently used files if the disk budget
+        is exceeded.
+        """
+        path = self._write(key, CACHE_EXTENSION, partial(write_arrow_ipc, table))
+        self._evict(keep=path)
+        return path
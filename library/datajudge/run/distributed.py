@@ -0,0 +1,244 @@
+"""
+Distributed execution module.
+
+Plugins are shipped to worker daemons as pickled work units over
+an authenticated socket connection (multiprocessing.connection).
+A worker daemon executes the plugins in a local pool of processes,
+so data are fetched from the artifact stores by the workers.
+Payloads are pickled, so workers must be reachable only on trusted
+networks and must share the same authkey with the executor.
+"""
+import argparse
+import concurrent.futures
+import itertools
+import os
+import socket
+import threading
+from abc import ABCMeta, abstractmethod
+from multiprocessing.connection import Client, Listener
+from typing import Any, Callable, List, Optional, Tuple, Union
+
+from datajudge.run.worker_pool import WorkerPool
+from datajudge.utils.exceptions import RunError
+from datajudge.utils.logger import LOGGER
+
+STATUS_OK = "ok"
+STATUS_KO = "ko"
+
+ENV_AUTHKEY = "DATAJUDGE_WORKER_AUTHKEY"
+
+
+def parse_address(address: Union[str, tuple]) -> Tuple[str, int]:
+    """
+    Return a (host, port) tuple from a "host:port" string.
+    """
+    if isinstance(address, tuple):
+        return address
+    host, port = address.rsplit(":", 1)
+    return host, int(port)
+
+
+class DistributedExecutor(metaclass=ABCMeta):
+    """
+    Distributed executor abstract class.
+
+    A DistributedExecutor ships work units to remote workers
+    and returns futures of their results.
+    """
+
+    @abstractmethod
+    def submit(self, fnc: Callable, *args) -> concurrent.futures.Future:
+        """
+        Submit a work unit to a remote worker.
+        """
+
+    @abstractmethod
+    def shutdown(self) -> None:
+        """
+        Release executor resources.
+        """
+
+
+class SocketExecutor(DistributedExecutor):
+    """
+    Distributed executor that sends work units to WorkerDaemons.
+
+    Work units are dispatched in round robin. If a worker is not
+    reachable, the work unit is sent to the next one.
+
+    Attributes
+    ----------
+    workers : list
+        Addresses of the workers, as "host:port" or (host, port).
+    authkey : bytes
+        Key shared with the workers to authenticate connections.
+    max_tasks : int, default = 4
+        Maximum number of concurrent work units per worker.
+
+    """
+
+    def __init__(
+        self,
+        workers: List[Union[str, tuple]],
+        authkey: bytes,
+        max_tasks: int = 4,
+    ) -> None:
+        if not workers:
+            raise RunError("At least one worker address is required.")
+        self.workers = [parse_address(w) for w in workers]
+        self.authkey = authkey
+        self._pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_tasks * len(self.workers)
+        )
+        self._cycle = itertools.cycle(range(len(self.workers)))
+        self._lock = threading.Lock()
+        self.logger = LOGGER
+
+    def submit(self, fnc: Callable, *args) -> concurrent.futures.Future:
+        """
+        Submit a work unit to a remote worker.
+        """
+        with self._lock:
+            start = next(self._cycle)
+        return self._pool.submit(self._send_task, start, fnc, args)
+
+    def _send_task(self, start: int, fnc: Callable, args: tuple) -> Any:
+        """
+        Send a work unit to a worker and wait for its result.
+        """
+        num = len(self.workers)
+        for idx in range(start, start + num):
+            address = self.workers[idx % num]
+            try:
+                conn = Client(address, authkey=self.authkey)
+            except OSError:
+                self.logger.info(f"Worker {address} not reachable.")
+                continue
+            with conn:
+                conn.send((fnc, args))
+                status, obj = conn.recv()
+            if status == STATUS_KO:
+                raise RunError(f"Work unit failed on worker {address}: {obj}")
+            return obj
+        raise RunError("No worker reachable.")
+
+    def shutdown(self) -> None:
+        """
+        Wait for pending work units and release threads.
+        """
+        self._pool.shutdown(wait=True)
+
+
+class WorkerDaemon:
+    """
+    Worker daemon that executes work units received from a
+    SocketExecutor in a local pool of processes.
+
+    Attributes
+    ----------
+    address : tuple
+        Address (host, port) to listen on. With port 0,
+        a free port is chosen.
+    authkey : bytes
+        Key shared with the executors to authenticate connections.
+    num_worker : int, default = None
+        Number of worker processes. If None, the number of CPUs.
+
+    """
+
+    def __init__(
+        self,
+        address: Union[str, tuple],
+        authkey: bytes,
+        num_worker: Optional[int] = None,
+    ) -> None:
+        self._listener = Listener(parse_address(address), authkey=authkey)
+        self.address = self._listener.address
+        self._pool = WorkerPool(num_worker or os.cpu_count())
+        self._thread = None
+        self._running = False
+        self.logger = LOGGER
+
+    def start(self) -> None:
+        """
+        Start serving work units in a background thread.
+        """
+        self._running = True
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+        self._thread.start()
+        self.logger.info(f"Worker daemon listening on {self.address}.")
+
+    def serve_forever(self) -> None:
+        """
+        Serve work units until shutdown.
+        """
+        self.start()
+        self._thread.join()
+
+    def _serve(self) -> None:
+        """
+        Accept connections and handle each one in a thread.
+        """
+        while self._running:
+            try:
+                conn = self._listener.accept()
+            except Exception as ex:
+                if not self._running:
+                    break
+                self.logger.info(f"Connection refused: {ex}")
+                continue
+            threading.Thread(target=self._handle, args=(conn,), daemon=True).start()
+
+    def _handle(self, conn: "Connection") -> None:
+        """
+        Execute a work unit and send back its result.
+        """
+        with conn:
+            try:
+                fnc, args = conn.recv()
+                executor = self._pool.get_executor()
+                result = (STATUS_OK, executor.submit(fnc, *args).result())
+            except Exception as ex:
+                result = (STATUS_KO, repr(ex))
+            try:
+                conn.send(result)
+            except Exception as ex:
+                conn.send((STATUS_KO, repr(ex)))
+
+    def shutdown(self) -> None:
+        """
+        Stop listening and shut down worker processes.
+        """
+        self._running = False
+        if self._thread is not None:
+            # Wake up the thread blocked on accept
+            try:
+                socket.create_connection(self.address).close()
+            except OSError:
+                pass
+            self._thread.join()
+        self._listener.close()
+        self._pool.shutdown()
+
+
+def main() -> None:
+    """
+    Start a worker daemon from command line.
+    """
+    parser = argparse.ArgumentParser(description="Datajudge worker daemon.")
+    parser.add_argument("--host", default="localhost")
+    parser.add_argument("--port", type=int, default=6000)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+    authkey = os.environ.get(ENV_AUTHKEY)
+    if not authkey:
+        raise RunError(f"Set the worker authkey in {ENV_AUTHKEY}.")
+    daemon = WorkerDaemon((args.host, args.port), authkey.encode(), args.workers)
+    try:
+        daemon.serve_forever()
+    except KeyboardInterrupt:
+        daemon.shutdown()
+
+
+if __name__ == "__main__":
+    main()
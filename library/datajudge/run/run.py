@@ -197,6 +197,12 @@ class Run:
         """
         self.run_info.run_libraries = self._run_handler.get_libraries()
 
+    def _get_durations(self) -> None:
+        """
+        Return the wall time spent by the run executing plugins.
+        """
+        self.run_info.run_durations = self._run_handler.get_durations()
+
     # Inference
 
     def infer_wrapper(self, parallel: bool = False, num_worker: int = 10) -> List[Any]:
@@ -577,6 +583,7 @@ class Run:
             self.run_info.end_status = STATUS_ERROR
 
         self._get_libraries()
+        self._get_durations()
         self.run_info.finished = get_time()
         self._log_run()
         LOGGER.info("Run finished. Clean up of temp resources.")
@@ -2,12 +2,23 @@
 Run handler module.
 """
 import concurrent.futures
-from typing import Any, List
+import shutil
+import tempfile
+import time
+from copy import deepcopy
+from functools import partial
+from pathlib import Path
+from typing import Any, List, Optional
 
 from datajudge.data_reader.utils import build_reader
 from datajudge.plugins.plugin_factory import builder_factory
+from datajudge.run.data_cache import DataCache
+from datajudge.run.disk_cache import DiskCache
+from datajudge.run.worker_pool import WorkerPool
 from datajudge.utils.commons import (
     BASE_FILE_READER,
+    DEFAULT_READ_WORKERS,
+    DISK_CACHE_DIRECTORY,
     OPERATION_INFERENCE,
     OPERATION_PROFILING,
     OPERATION_VALIDATION,
@@ -17,9 +28,23 @@ from datajudge.utils.commons import (
     RESULT_WRAPPED,
 )
 from datajudge.utils.exceptions import RunError
-from datajudge.utils.file_utils import get_absolute_path
+from datajudge.utils.file_utils import get_absolute_path, get_user_cache_dir
+from datajudge.utils.logger import LOGGER
+from datajudge.utils.glob_utils import (
+    get_glob_base,
+    is_expandable,
+    is_glob,
+    is_recursive_glob,
+    match_glob,
+)
+from datajudge.utils.partition_utils import (
+    filter_partitions,
+    is_data_file,
+    parse_partitions,
+)
+from datajudge.utils.sampling_utils import get_sample_args
 from datajudge.utils.uri_utils import get_name_from_uri
-from datajudge.utils.utils import flatten_list, listify
+from datajudge.utils.utils import flatten_list, listify, parallel_map
 
 
 class RunHandlerRegistry:
@@ -75,10 +100,29 @@ class RunHandler:
 
     """
 
-    def __init__(self, config: "RunConfig", store_handler: "StoreHandler") -> None:
+    def __init__(
+        self,
+        config: "RunConfig",
+        store_handler: "StoreHandler",
+        worker_pool: Optional[WorkerPool] = None,
+        executor: Optional["DistributedExecutor"] = None,
+    ) -> None:
         self._config = config
         self._store_handler = store_handler
         self._registry = RunHandlerRegistry()
+        disk = None
+        if config.diskCache:
+            path = get_user_cache_dir(DISK_CACHE_DIRECTORY)
+            disk = DiskCache(path, config.diskCacheSize)
+        self._cache = DataCache(config.cacheSize, disk)
+        self._durations = {}
+        self._shared = {}
+        self._shared_dir = None
+
+        # If no shared pool is provided, the run owns its pool
+        self._own_pool = worker_pool is None
+        self._worker_pool = WorkerPool() if worker_pool is None else worker_pool
+        self._executor = executor
 
     def infer(
         self,
@@ -89,10 +133,12 @@ class RunHandler:
         """
         Wrapper for plugins infer methods.
         """
+        resources = self._resolve_resources(resources)
         builders = builder_factory(
             self._config.inference,
             OPERATION_INFERENCE,
             self._store_handler.get_all_art_stores(),
+            self._cache,
         )
         plugins = self._create_plugins(builders, resources)
         self._scheduler(plugins, OPERATION_INFERENCE, parallel, num_worker)
@@ -110,11 +156,13 @@ class RunHandler:
         Wrapper for plugins validate methods.
         """
         self._parse_report_arg(error_report)
+        resources = self._resolve_resources(resources)
         constraints = listify(constraints)
         builders = builder_factory(
             self._config.validation,
             OPERATION_VALIDATION,
             self._store_handler.get_all_art_stores(),
+            self._cache,
         )
         plugins = self._create_plugins(builders, resources, constraints, error_report)
         self._scheduler(plugins, OPERATION_VALIDATION, parallel, num_worker)
@@ -140,15 +188,68 @@ class RunHandler:
         """
         Wrapper for plugins profile methods.
         """
+        resources = self._resolve_resources(resources)
         builders = builder_factory(
             self._config.profiling,
             OPERATION_PROFILING,
             self._store_handler.get_all_art_stores(),
+            self._cache,
         )
         plugins = self._create_plugins(builders, resources)
         self._scheduler(plugins, OPERATION_PROFILING, parallel, num_worker)
         self._destroy_builders(builders)
 
+    def _resolve_resources(
+        self, resources: List["DataResource"]
+    ) -> List["DataResource"]:
+        """
+        Replace globs, prefixes and partitioned directories in
+        the path of resources with the files they match. Files of
+        partitions that do not match the resource filter are pruned,
+        so they are never fetched and parsed.
+        """
+        resolved = []
+        for res in listify(resources):
+            paths = listify(res.path)
+            partitioned = res.partitions is not None
+            if not partitioned and not any(map(is_expandable, paths)):
+                resolved.append(res)
+                continue
+            store = self._store_handler.get_art_store(res.store)
+            fnc = partial(self._expand_path, store, partitioned=partitioned)
+            files = flatten_list(parallel_map(fnc, paths, DEFAULT_READ_WORKERS))
+            if partitioned:
+                files = filter_partitions(files, res.partitions)
+            if not files:
+                raise RunError(f"No file matches the path of resource {res.name}.")
+            LOGGER.info(f"Resource {res.name}: {len(files)} files selected.")
+            res = deepcopy(res)
+            res.path = files
+            resolved.append(res)
+        return resolved
+
+    @staticmethod
+    def _expand_path(store: "ArtifactStore", path: str, partitioned: bool) -> List[str]:
+        """
+        Return the files matched by a glob, a prefix or a partitioned
+        directory. Paths of stores that cannot list files (e.g. HTTP
+        URLs with a query string) are kept as they are.
+        """
+        if not partitioned and not is_expandable(path):
+            return [path]
+        try:
+            if is_glob(path):
+                base = get_glob_base(path)
+                files = store.list_files(base, is_recursive_glob(path))
+                files = [f for f in files if match_glob(f, path)]
+            else:
+                files = store.list_files(path)
+        except NotImplementedError as ex:
+            if partitioned:
+                raise RunError(f"Unable to list partitions of {path}. {ex}")
+            return [path]
+        return [f for f in files if is_data_file(f)]
+
     @staticmethod
     def _create_plugins(builders: "PluginBuilder", *args) -> List["Plugin"]:
         """
@@ -167,19 +268,25 @@ class RunHandler:
         distributed = []
         sequential = []
         for plugin in plugins:
-            if plugin.exec_multiprocess and parallel:
+            if plugin.exec_distributed and parallel and self._executor is not None:
+                distributed.append(plugin)
+            elif plugin.exec_multiprocess and parallel:
                 multiprocess.append(plugin)
             elif plugin.exec_multithread and parallel:
                 multithreading.append(plugin)
-            elif plugin.exec_distributed and parallel:
-                distributed.append(plugin)
             else:
                 sequential.append(plugin)
 
-        # Revisite this
-        self._sequential_execute(sequential, ops)
-        self._pool_execute_multithread(multithreading, ops, num_worker)
-        self._pool_execute_multiprocess(multiprocess, ops, num_worker)
+        start = time.perf_counter()
+        if multiprocess or multithreading or distributed:
+            self._concurrent_execute(
+                sequential, multithreading, multiprocess, distributed, ops, num_worker
+            )
+        else:
+            self._sequential_execute(sequential, ops)
+        duration = round(time.perf_counter() - start, 2)
+        self._durations[ops] = self._durations.get(ops, 0) + duration
+        LOGGER.info(f"Executed {len(plugins)} {ops} plugins in {duration} seconds.")
 
     def _sequential_execute(self, plugins: List["Plugin"], ops: str) -> None:
         """
@@ -189,27 +296,77 @@ class RunHandler:
             data = self._execute(plugin)
             self._register_results(ops, data)
 
-    def _pool_execute_multiprocess(
-        self, plugins: List["Plugin"], ops: str, num_worker: int
-    ) -> None:
-        """
-        Instantiate a concurrent.future.ProcessPoolExecutor pool to
-        execute operations in multiprocessing.
-        """
-        with concurrent.futures.ProcessPoolExecutor(max_workers=num_worker) as pool:
-            for data in pool.map(self._execute, plugins):
-                self._register_results(ops, data)
-
-    def _pool_execute_multithread(
-        self, plugins: List["Plugin"], ops: str, num_worker: int
+    def _concurrent_execute(
+        self,
+        sequential: List["Plugin"],
+        multithreading: List["Plugin"],
+        multiprocess: List["Plugin"],
+        distributed: List["Plugin"],
+        ops: str,
+        num_worker: int,
     ) -> None:
         """
-        Instantiate a concurrent.future.ThreadPoolExecutor pool to
-        execute operations in multithreading.
-        """
-        with concurrent.futures.ThreadPoolExecutor(max_workers=num_worker) as pool:
-            for data in pool.map(self._execute, plugins):
-                self._register_results(ops, data)
+        Execute all the groups of plugins at the same time.
+        Distributed plugins are submitted to the remote workers,
+        multiprocess plugins to the worker pool, multithread plugins
+        to a thread pool and sequential plugins to a single thread,
+        so they still run one at a time.
+        Results are registered as soon as they are available.
+        """
+        futures = []
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=num_worker
+        ) as thread_pool, concurrent.futures.ThreadPoolExecutor(
+            max_workers=1
+        ) as sequential_pool:
+            if multiprocess:
+                self._share_data(multiprocess)
+                process_pool = self._worker_pool.get_executor(num_worker)
+                futures.extend(
+                    process_pool.submit(self._execute, p) for p in multiprocess
+                )
+            futures.extend(self._executor.submit(self._execute, p) for p in distributed)
+            futures.extend(thread_pool.submit(self._execute, p) for p in multithreading)
+            futures.extend(sequential_pool.submit(self._execute, p) for p in sequential)
+            for future in concurrent.futures.as_completed(futures):
+                self._register_results(ops, future.result())
+
+    def _share_data(self, plugins: List["Plugin"]) -> None:
+        """
+        Load once the resources read by more than one multiprocess
+        plugin and share them through memory-mapped Arrow IPC files,
+        so that worker processes do not fetch and parse them again.
+        """
+        groups = {}
+        for plugin in plugins:
+            reader = getattr(plugin, "data_reader", None)
+            resource = getattr(plugin, "resource", None)
+            if reader is None or resource is None or not reader.shareable:
+                continue
+            if get_sample_args(plugin.exec_args):
+                # Samples are streamed, resources are never loaded whole
+                continue
+            key = DataCache.get_key(reader, resource.path)
+            groups.setdefault(key, []).append((reader, resource.path))
+
+        for key, group in groups.items():
+            if len(group) < 2 and key not in self._shared:
+                continue
+            path = self._shared.get(key)
+            write = path is None
+            if write:
+                if self._shared_dir is None:
+                    self._shared_dir = tempfile.mkdtemp(prefix="datajudge_")
+                path = str(Path(self._shared_dir, f"{len(self._shared)}.arrow"))
+            try:
+                for reader, src in group:
+                    reader.share_data(src, path, write)
+                    write = False
+            except Exception as ex:
+                # Plugins will fetch data by themselves
+                LOGGER.info(f"Unable to share resource {key[2]}: {ex}")
+                continue
+            self._shared[key] = path
 
     @staticmethod
     def _execute(plugin: "Plugin") -> dict:
@@ -336,6 +493,13 @@ class RunHandler:
             )
         )
 
+    def get_durations(self) -> dict:
+        """
+        Return the wall time in seconds spent executing
+        plugins for every operation.
+        """
+        return dict(self._durations)
+
     def get_libraries(self) -> List[dict]:
         """
         Return libraries used by run.
@@ -368,17 +532,28 @@ class RunHandler:
         """
         Persist input data as artifact.
         """
-        for res in resources:
+        for res in self._resolve_resources(resources):
             store = self._store_handler.get_art_store(res.store)
             data_reader = build_reader(BASE_FILE_READER, store)
             for path in listify(res.path):
                 tmp_pth = data_reader.fetch_data(path)
                 tmp_pth = get_absolute_path(tmp_pth)
                 filename = get_name_from_uri(tmp_pth)
+                # Files of different partitions may share the name
+                if res.partitions is not None:
+                    parts = [f"{k}={v}" for k, v in parse_partitions(path).items()]
+                    filename = "_".join([*parts, filename])
                 self.persist_artifact(tmp_pth, dst, filename, {})
 
     def clean_all(self) -> None:
         """
         Clean up.
         """
+        self._cache.clean_all()
         self._store_handler.clean_all()
+        if self._shared_dir is not None:
+            shutil.rmtree(self._shared_dir, ignore_errors=True)
+            self._shared_dir = None
+            self._shared = {}
+        if self._own_pool:
+            self._worker_pool.shutdown()
@@ -25,6 +25,8 @@ class RunInfo:
         URI that point to the artifact store.
     resources_uri : str
         URI that point to the resource.
+    run_durations : dict
+        Wall time in seconds spent executing plugins per operation.
 
     Methods
     -------
@@ -46,6 +48,7 @@ class RunInfo:
         self.run_id = run_id
         self.run_config = run_config
         self.run_libraries = None
+        self.run_durations = None
         self.run_metadata_uri = run_metadata_uri
         self.run_artifacts_uri = run_artifacts_uri
 
@@ -66,6 +69,7 @@ class RunInfo:
             "runId": self.run_id,
             "runConfig": self.run_config.dict(exclude_none=True),
             "runLibraries": self.run_libraries,
+            "runDurations": self.run_durations,
             "runMetadataUri": self.run_metadata_uri,
             "runArtifactsUri": self.run_artifacts_uri,
             "resources": [i.dict(exclude_none=True) for i in self.resources],
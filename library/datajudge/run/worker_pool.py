@@ -0,0 +1,95 @@
+"""
+Worker pool module.
+"""
+import concurrent.futures
+import os
+import threading
+from typing import Optional
+
+from datajudge.utils.logger import LOGGER
+
+
+def _warm_up() -> None:
+    """
+    Import plugins and their libraries in a worker process.
+    """
+    # pylint: disable=import-outside-toplevel,unused-import
+    import datajudge.plugins.registry  # noqa: F401
+
+
+def _noop() -> None:
+    """
+    Task used to spawn worker processes.
+    """
+
+
+class WorkerPool:
+    """
+    Long-lived pool of worker processes.
+
+    The WorkerPool wraps a ProcessPoolExecutor that is created
+    on first use and reused by every run that shares the pool,
+    so worker processes are spawned and plugin libraries are
+    imported only once. The executor is recreated only if more
+    workers are requested or if it breaks.
+
+    Attributes
+    ----------
+    max_workers : int, default = None
+        Number of worker processes. If None, the pool grows to
+        the number of workers requested by the runs.
+
+    """
+
+    def __init__(self, max_workers: Optional[int] = None) -> None:
+        self.max_workers = max_workers
+        self._executor = None
+        self._size = 0
+        self._lock = threading.Lock()
+        self.logger = LOGGER
+
+    def get_executor(
+        self, num_worker: Optional[int] = None
+    ) -> concurrent.futures.ProcessPoolExecutor:
+        """
+        Return the pool executor, creating it if needed.
+        """
+        size = self.max_workers or num_worker or os.cpu_count()
+        with self._lock:
+            if self._executor is not None and (
+                getattr(self._executor, "_broken", False) or size > self._size
+            ):
+                self._executor.shutdown(wait=True)
+                self._executor = None
+            if self._executor is None:
+                self.logger.info(f"Starting worker pool with {size} workers.")
+                self._executor = concurrent.futures.ProcessPoolExecutor(
+                    max_workers=size, initializer=_warm_up
+                )
+                self._size = size
+            return self._executor
+
+    def start(self, num_worker: Optional[int] = None) -> None:
+        """
+        Spawn all the workers in advance.
+        """
+        executor = self.get_executor(num_worker)
+        futures = [executor.submit(_noop) for _ in range(self._size)]
+        concurrent.futures.wait(futures)
+
+    def shutdown(self) -> None:
+        """
+        Shut down the worker processes.
+        """
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+                self._size = 0
+
+    def __getstate__(self) -> dict:
+        # Executors cannot be shipped to other processes.
+        return {"max_workers": self.max_workers}
+
+    def __setstate__(self, state: dict) -> None:
+        self.__init__(state["max_workers"])
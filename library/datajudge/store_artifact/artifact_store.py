@@ -1,25 +1,41 @@
 """
 Abstract class for artifact store.
 """
+import hashlib
+import json
+import os
 from abc import ABCMeta, abstractmethod
-from typing import IO, Any, Optional, Union
+from contextlib import contextmanager
+from functools import partial
+from pathlib import Path
+from typing import IO, Any, Iterator, List, Optional, Union
 
 from datajudge.utils.commons import (
     DATAREADER_BUFFER,
     DATAREADER_FILE,
     DATAREADER_NATIVE,
+    DEFAULT_MAX_IN_MEMORY_SIZE,
+    REGISTRY_DIRECTORY,
 )
+from datajudge.utils.file_utils import check_dir, clean_all, get_path, lock_file
+from datajudge.utils.io_utils import write_json
 from datajudge.utils.logger import LOGGER
-from datajudge.utils.uri_utils import rebuild_uri
+from datajudge.utils.uri_utils import get_uri_path, rebuild_uri
+from datajudge.utils.utils import get_uiid
 
 
 class ResourceRegistry:
     """
     Generic registry object to keep track of resources.
+
+    If a directory is given, registrations are also written there,
+    so copies of the registry in other processes (e.g. stores pickled
+    into pool workers) share them.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, path: Optional[str] = None) -> None:
         self.registry = {}
+        self.path = path
 
     def register(self, res_name: str, tmp_path: str) -> None:
         """
@@ -27,6 +43,8 @@ class ResourceRegistry:
         """
         if res_name not in self.registry:
             self.registry[res_name] = tmp_path
+            if self.path is not None:
+                self._write_entry(res_name, tmp_path)
 
     def get_resource(self, res_name: str) -> str:
         """
@@ -35,13 +53,60 @@ class ResourceRegistry:
         try:
             return self.registry[res_name]
         except KeyError:
+            pass
+        if self.path is None:
             return None
+        tmp_path = self._read_entry(res_name)
+        if tmp_path is not None:
+            self.registry[res_name] = tmp_path
+        return tmp_path
+
+    @contextmanager
+    def lock(self, res_name: str) -> Iterator[None]:
+        """
+        Hold an exclusive lock on a resource, so that only one
+        process (or thread) fetches it.
+        """
+        if self.path is None:
+            yield
+            return
+        with lock_file(self._get_entry_path(res_name) + ".lock"):
+            yield
+
+    def _write_entry(self, res_name: str, tmp_path: str) -> None:
+        """
+        Write a registration in the registry directory.
+        """
+        path = self._get_entry_path(res_name)
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        tmp = f"{path}.{get_uiid()}.tmp"
+        write_json({"path": tmp_path}, tmp)
+        os.replace(tmp, path)
+
+    def _read_entry(self, res_name: str) -> Optional[str]:
+        """
+        Read a registration from the registry directory.
+        """
+        try:
+            with open(self._get_entry_path(res_name), encoding="utf-8") as file:
+                return json.load(file)["path"]
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def _get_entry_path(self, res_name: str) -> str:
+        """
+        Return the path of the registration of a resource.
+        """
+        digest = hashlib.sha256(res_name.encode()).hexdigest()
+        return str(Path(self.path, digest))
 
     def clean_all(self) -> None:
         """
         Remove resource from registry.
         """
         self.registry = {}
+        if self.path is not None and check_dir(self.path):
+            clean_all(self.path)
 
 
 class ArtifactStore(metaclass=ABCMeta):
@@ -69,6 +134,15 @@ class ArtifactStore(metaclass=ABCMeta):
     NATIVE = DATAREADER_NATIVE
     BUFFER = DATAREADER_BUFFER
 
+    # Stores that download whole objects in memory. DataFrame
+    # readers fetch them as buffers instead of temporary files,
+    # if they are not larger than max_in_memory_size.
+    fetch_in_memory = False
+
+    # Remote stores whose downloads are kept in the download
+    # cache, if the client has one
+    cache_downloads = False
+
     def __init__(
         self,
         name: str,
@@ -84,7 +158,13 @@ class ArtifactStore(metaclass=ABCMeta):
         self.temp_dir = temp_dir
         self.config = config
         self.is_default = is_default
-        self.resource_paths = ResourceRegistry()
+        # Stores that download resources share their registry with
+        # the processes that receive a copy of the store
+        registry_dir = None
+        if self.cache_downloads:
+            registry_dir = get_path(temp_dir, REGISTRY_DIRECTORY)
+        self.resource_paths = ResourceRegistry(registry_dir)
+        self.download_cache = None
         self.logger = LOGGER
 
     @abstractmethod
@@ -99,9 +179,41 @@ class ArtifactStore(metaclass=ABCMeta):
         """
         Return the temporary path where a resource it is stored.
         """
-        return self._get_resource(
-            f"{src}_{self.FILE}"
-        ) or self._get_and_register_artifact(src, self.FILE)
+        key = f"{src}_{self.FILE}"
+        path = self._get_resource(key)
+        if path:
+            return path
+        # Processes and threads sharing the store download a resource once
+        with self.resource_paths.lock(key):
+            path = self._get_resource(key)
+            if path:
+                return path
+            if self.cache_downloads and self.download_cache is not None:
+                return self._fetch_cached_file(src)
+            return self._get_and_register_artifact(src, self.FILE)
+
+    def _fetch_cached_file(self, src: str) -> str:
+        """
+        Return the temporary path of a resource from the download
+        cache. The resource is downloaded if the current version is
+        not cached, otherwise the cached file is linked in the
+        temporary directory, so the run keeps it if it is evicted.
+        Resources without a version are not cached.
+        """
+        version = self.get_version(src)
+        if version is None:
+            return self._get_and_register_artifact(src, self.FILE)
+        key = self.download_cache.get_key(self, src, version)
+        suffix = Path(get_uri_path(src)).suffix
+        dst = get_path(self.temp_dir, f"{key}{suffix}")
+        path = self.download_cache.fetch(
+            key,
+            suffix,
+            partial(self._get_and_register_artifact, src, self.FILE),
+            dst,
+        )
+        self._register_resource(f"{src}_{self.FILE}", path)
+        return path
 
     def fetch_native(self, src: str) -> str:
         """
@@ -113,11 +225,62 @@ class ArtifactStore(metaclass=ABCMeta):
 
     def fetch_buffer(self, src: str) -> IO:
         """
-        Return a buffered resource.
+        Return a buffered resource. Buffers are consumed by readers,
+        so they are not registered and every call fetches the resource.
         """
-        return self._get_resource(
-            f"{src}_{self.BUFFER}"
-        ) or self._get_and_register_artifact(src, self.BUFFER)
+        return self._get_and_register_artifact(src, self.BUFFER)
+
+    def fits_in_memory(self, src: str) -> bool:
+        """
+        Check if a resource can be fetched as a buffer, i.e. the store
+        downloads whole objects in memory and the resource is not larger
+        than the max_in_memory_size key of the store config. Resources
+        of unknown size are fetched as files.
+        """
+        if not self.fetch_in_memory:
+            return False
+        size = self.get_size(src)
+        cfg = self.config or {}
+        max_size = int(cfg.get("max_in_memory_size", DEFAULT_MAX_IN_MEMORY_SIZE))
+        return size is not None and size <= max_size
+
+    def get_size(self, src: str) -> Optional[int]:
+        """
+        Return the size in bytes of a resource, None if the
+        store cannot provide it.
+        """
+        return None
+
+    def get_version(self, src: str) -> Optional[str]:
+        """
+        Return an identifier of the current version of a resource
+        (e.g. an ETag), None if the store cannot provide it.
+        """
+        return None
+
+    def fetch_tail(self, src: str, length: int) -> Optional[bytes]:
+        """
+        Return the last bytes of a resource with a ranged read,
+        None if the store does not support ranged reads.
+        """
+        return None
+
+    def open_file(self, src: str) -> Optional[IO]:
+        """
+        Return a seekable binary file that reads a resource with
+        ranged requests, None if the store does not support them.
+        """
+        return None
+
+    def list_files(self, src: str, recursive: bool = True) -> List[str]:
+        """
+        Return the files under a directory (or prefix) of the store,
+        with the same form of src. If recursive is False,
+        subdirectories are not listed.
+        """
+        raise NotImplementedError(
+            f"Store {self.name} does not support listing directories."
+        )
 
     @abstractmethod
     def _get_and_register_artifact(self, src: str, fetch_mode: str) -> str:
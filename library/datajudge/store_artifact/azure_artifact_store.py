@@ -5,9 +5,12 @@ import json
 from datetime import datetime, timedelta
 from io import BytesIO, StringIO
 from pathlib import Path
-from typing import IO, Any
+from typing import IO, Any, List, Optional
 
+from azure.core import MatchConditions
+from azure.core.exceptions import ResourceModifiedError, ResourceNotFoundError
 from azure.storage.blob import (
+    BlobPrefix,
     BlobSasPermissions,
     BlobServiceClient,
     ContainerClient,
@@ -15,14 +18,22 @@ from azure.storage.blob import (
 )
 
 from datajudge.store_artifact.artifact_store import ArtifactStore
-from datajudge.utils.file_utils import check_make_dir, check_path, get_path
-from datajudge.utils.io_utils import wrap_string, write_bytes, write_bytesio
+from datajudge.utils.commons import DEFAULT_RANGE_SIZE, DEFAULT_READ_WORKERS
+from datajudge.utils.exceptions import StoreError
+from datajudge.utils.file_utils import check_path, get_path
+from datajudge.utils.glob_utils import join_path
+from datajudge.utils.io_utils import (
+    open_ranged,
+    wrap_string,
+    write_bytes,
+    write_bytesio,
+)
 from datajudge.utils.uri_utils import (
     build_key,
-    get_name_from_uri,
     get_uri_netloc,
     get_uri_path,
 )
+from datajudge.utils.utils import flatten_list, parallel_map
 
 
 class AzureArtifactStore(ArtifactStore):
@@ -33,6 +44,9 @@ class AzureArtifactStore(ArtifactStore):
 
     """
 
+    fetch_in_memory = True
+    cache_downloads = True
+
     def persist_artifact(
         self, src: Any, dst: str, src_name: str, metadata: dict
     ) -> None:
@@ -88,8 +102,79 @@ class AzureArtifactStore(ArtifactStore):
             self._register_resource(f"{src}_{fetch_mode}", filepath)
             return filepath
 
+        # Get file from remote in a buffer
         if fetch_mode == self.BUFFER:
-            raise NotImplementedError
+            return BytesIO(self._get_data(client, key))
+
+    def fetch_tail(self, src: str, length: int) -> Optional[bytes]:
+        """
+        Return the last bytes of a blob.
+        """
+        blob = self._get_client().get_blob_client(get_uri_path(src))
+        size = blob.get_blob_properties().size
+        offset = max(size - length, 0)
+        return blob.download_blob(offset=offset, length=size - offset).readall()
+
+    def open_file(self, src: str) -> IO:
+        """
+        Return a seekable file that reads a blob with ranged
+        downloads. Every request must match the ETag the blob
+        had when it was opened.
+        """
+        client = self._get_client()
+        self._check_access_to_storage(client)
+        blob = client.get_blob_client(get_uri_path(src))
+        props = blob.get_blob_properties()
+        self.logger.info(f"Reading resource {src} from store {self.name}")
+
+        def _fetch_range(start: int, length: int) -> bytes:
+            try:
+                return blob.download_blob(
+                    offset=start,
+                    length=length,
+                    etag=props.etag,
+                    match_condition=MatchConditions.IfNotModified,
+                ).readall()
+            except ResourceModifiedError as ex:
+                raise StoreError(f"Unable to read {src}, blob changed? {ex}")
+
+        return open_ranged(_fetch_range, props.size, DEFAULT_RANGE_SIZE)
+
+    def get_version(self, src: str) -> Optional[str]:
+        """
+        Return the ETag of a blob.
+        """
+        client = self._get_client()
+        try:
+            props = client.get_blob_client(get_uri_path(src)).get_blob_properties()
+        except ResourceNotFoundError:
+            return None
+        return props.etag
+
+    def list_files(self, src: str, recursive: bool = True) -> List[str]:
+        """
+        Return the blobs under a prefix, with the same
+        scheme and container of the prefix. Subprefixes
+        are listed concurrently.
+        """
+        client = self._get_client()
+        prefix = get_uri_path(src).strip("/")
+        prefix = f"{prefix}/" if prefix else ""
+        names, prefixes = [], []
+        for item in client.walk_blobs(name_starts_with=prefix, delimiter="/"):
+            if isinstance(item, BlobPrefix):
+                prefixes.append(item.name)
+            else:
+                names.append(item.name)
+        if recursive:
+
+            def fnc(pfx: str) -> List[str]:
+                return [b.name for b in client.list_blobs(name_starts_with=pfx)]
+
+            names.extend(
+                flatten_list(parallel_map(fnc, prefixes, DEFAULT_READ_WORKERS))
+            )
+        return sorted(join_path(src, name[len(prefix) :]) for name in names)
 
     def _get_client(self) -> ContainerClient:
         """
@@ -169,8 +254,9 @@ class AzureArtifactStore(ArtifactStore):
         """
         Store data locally in temporary folder and return tmp path.
         """
-        check_make_dir(self.temp_dir)
-        name = get_name_from_uri(key)
-        filepath = get_path(self.temp_dir, name)
+        # Keep directories, so files of partitioned
+        # resources with the same name do not collide
+        filepath = get_path(self.temp_dir, key.lstrip("/"))
+        Path(filepath).parent.mkdir(parents=True, exist_ok=True)
         write_bytes(obj, filepath)
         return filepath
@@ -0,0 +1,100 @@
+"""
+Download cache module.
+"""
+import hashlib
+import json
+import os
+from functools import partial
+from pathlib import Path
+from typing import Callable, Optional
+
+from datajudge.utils.file_cache import FileCache
+from datajudge.utils.file_utils import link_file, lock_file
+from datajudge.utils.utils import get_uiid
+
+# Subdirectory of the lock files
+LOCK_DIRECTORY = ".locks"
+
+
+class DownloadCache(FileCache):
+    """
+    Cross-run cache of downloaded files.
+
+    The DownloadCache keeps the files downloaded by the ArtifactStores,
+    keyed by store, URI and version of the remote resource (e.g. ETag
+    or last modification date). Stores revalidate the version with a
+    metadata request on every fetch, so a changed resource is
+    downloaded again. Downloads of a key are serialized with file
+    locks, so concurrent processes download a resource only once.
+    Files are evicted in LRU order, by access time, once the disk
+    budget is exceeded. Callers get their own link of a cached file,
+    which outlives its eviction.
+
+    Attributes
+    ----------
+    path : str
+        Cache directory.
+    max_size : int, default = None
+        Disk budget in bytes. If None, the cache is unbounded.
+
+    """
+
+    @staticmethod
+    def get_key(store: "ArtifactStore", src: str, version: str) -> str:
+        """
+        Return the cache key for a version of a resource of a store.
+        """
+        key = json.dumps([store.store_type, store.artifact_uri, str(src), version])
+        return hashlib.sha256(key.encode()).hexdigest()
+
+    def fetch(
+        self, key: str, suffix: str, fetch_fnc: Callable[[], str], dst: str
+    ) -> str:
+        """
+        Return a local path with the content of a cached file. Cached
+        files are linked to dst, so eviction never removes a file
+        while the caller uses it. If not present, the file is
+        downloaded with fetch_fnc, which returns a local path owned
+        by the caller, and added to the cache.
+        """
+        path = self._link_cached(key, suffix, dst)
+        if path is not None:
+            return path
+        with lock_file(self._get_lock_path(key)):
+            # Another process may have downloaded the file meanwhile
+            path = self._link_cached(key, suffix, dst)
+            if path is None:
+                path = fetch_fnc()
+                self._evict(keep=self.add(key, suffix, path))
+        return path
+
+    def add(self, key: str, suffix: str, src: str) -> str:
+        """
+        Add a local file to the cache and return the cached path.
+        The file is linked if possible, copied otherwise.
+        """
+        return self._write(key, suffix, partial(link_file, src))
+
+    def _link_cached(self, key: str, suffix: str, dst: str) -> Optional[str]:
+        """
+        Link a cached file to dst and return dst, None if the
+        file is not cached.
+        """
+        path = self.get(key, suffix)
+        if path is None:
+            return None
+        Path(dst).parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = f"{dst}.{get_uiid()}.tmp"
+        try:
+            link_file(path, tmp_path)
+        except FileNotFoundError:
+            # Evicted by another process meanwhile
+            return None
+        os.replace(tmp_path, dst)
+        return dst
+
+    def _get_lock_path(self, key: str) -> str:
+        """
+        Return the path of the lock file of a key.
+        """
+        return str(self.path / LOCK_DIRECTORY / key)
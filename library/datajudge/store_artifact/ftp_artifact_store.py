@@ -3,21 +3,24 @@ Implementation of FTP artifact store.
 """
 import ftplib
 import json
+import threading
 from contextlib import contextmanager
 from ftplib import FTP
 from io import BytesIO, StringIO
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, List, Optional, Tuple
 
 from datajudge.store_artifact.artifact_store import ArtifactStore
-from datajudge.utils.file_utils import check_make_dir, check_path, get_path
+from datajudge.utils.commons import DEFAULT_READ_WORKERS
+from datajudge.utils.file_utils import check_path, get_path
+from datajudge.utils.glob_utils import join_path
 from datajudge.utils.io_utils import wrap_string, write_bytes, write_bytesio
 from datajudge.utils.uri_utils import (
     build_key,
-    get_name_from_uri,
     get_uri_path,
     parse_uri,
 )
+from datajudge.utils.utils import parallel_map
 
 
 class FTPArtifactStore(ArtifactStore):
@@ -28,6 +31,9 @@ class FTPArtifactStore(ArtifactStore):
 
     """
 
+    fetch_in_memory = True
+    cache_downloads = True
+
     def __init__(
         self,
         name: str,
@@ -37,8 +43,8 @@ class FTPArtifactStore(ArtifactStore):
         config: Optional[dict] = None,
     ) -> None:
         super().__init__(name, store_type, artifact_uri, temp_dir, config)
+        parsed = parse_uri(self.artifact_uri)
         if self.config is None:
-            parsed = parse_uri(self.artifact_uri)
             self.config = {
                 "host": "localhost" if parsed.hostname is None else parsed.hostname,
                 "port": 21 if parsed.port is None else parsed.port,
@@ -48,6 +54,9 @@ class FTPArtifactStore(ArtifactStore):
 
         self.path = parsed.path
 
+        # FTP connections are reused by each thread
+        self._local = threading.local()
+
     def persist_artifact(
         self, src: Any, dst: str, src_name: str, metadata: Optional[dict] = None
     ) -> None:
@@ -102,8 +111,64 @@ class FTPArtifactStore(ArtifactStore):
             self._register_resource(f"{src}_{fetch_mode}", filepath)
             return filepath
 
+        # Get file from remote in a buffer
         if fetch_mode == self.BUFFER:
-            raise NotImplementedError
+            return BytesIO(self._get_data(key))
+
+    def get_size(self, src: str) -> Optional[int]:
+        """
+        Return the size of a remote file, None if the
+        server does not support SIZE.
+        """
+        with self._get_client() as ftp:
+            try:
+                return ftp.size(get_uri_path(src))
+            except ftplib.all_errors:
+                return None
+
+    def get_version(self, src: str) -> Optional[str]:
+        """
+        Return size and modification time of a remote file,
+        None if the server does not support MDTM or SIZE.
+        """
+        key = get_uri_path(src)
+        with self._get_client() as ftp:
+            try:
+                mdtm = ftp.sendcmd("MDTM " + key).split()[-1]
+                size = ftp.size(key)
+            except ftplib.all_errors:
+                return None
+        if size is None:
+            return None
+        return f"{size}-{mdtm}"
+
+    def list_files(self, src: str, recursive: bool = True) -> List[str]:
+        """
+        Return the files under a remote directory, with the same
+        form of src. Subdirectories are listed concurrently.
+        """
+        files, dirs = self._list_dir(get_uri_path(src))
+        while recursive and dirs:
+            results = parallel_map(self._list_dir, dirs, DEFAULT_READ_WORKERS)
+            dirs = []
+            for sub_files, sub_dirs in results:
+                files.extend(sub_files)
+                dirs.extend(sub_dirs)
+        key = get_uri_path(src)
+        return sorted(join_path(src, f[len(key) :].lstrip("/")) for f in files)
+
+    def _list_dir(self, path: str) -> Tuple[List[str], List[str]]:
+        """
+        Return files and subdirectories of a remote directory.
+        """
+        files, dirs = [], []
+        with self._get_client() as ftp:
+            for name, facts in ftp.mlsd(path, facts=["type"]):
+                if facts.get("type") == "file":
+                    files.append(join_path(path, name))
+                elif facts.get("type") == "dir":
+                    dirs.append(join_path(path, name))
+        return files, dirs
 
     def _check_access_to_storage(self, dst: str, write: bool = False) -> None:
         """
@@ -122,14 +187,63 @@ class FTPArtifactStore(ArtifactStore):
     @contextmanager
     def _get_client(self):
         """
-        Yield an FTP client.
+        Yield an FTP client. Each thread reuses its connection, in
+        the login directory, until it fails.
+        """
+        ftp = getattr(self._local, "ftp", None)
+        if ftp is not None:
+            try:
+                ftp.cwd(self._local.home)
+            except ftplib.all_errors:
+                # Stale connection, open a new one
+                self._close_client()
+                ftp = None
+        if ftp is None:
+            ftp = self._connect()
+        yield ftp
+
+    def _connect(self) -> FTP:
+        """
+        Open and register the connection of the current thread.
         """
         ftp = FTP()
         ftp.connect(self.config["host"], self.config["port"])
         ftp.login(self.config["user"], self.config["password"])
-        yield ftp
-        ftp.close()
-        del ftp
+        self._local.ftp = ftp
+        self._local.home = ftp.pwd()
+        return ftp
+
+    def _close_client(self) -> None:
+        """
+        Close the connection of the current thread.
+        """
+        ftp = getattr(self._local, "ftp", None)
+        self._local.ftp = None
+        if ftp is not None:
+            try:
+                ftp.close()
+            except ftplib.all_errors:
+                pass
+
+    def clean_paths(self) -> None:
+        """
+        Delete all temporary paths references and close
+        the connection of the current thread.
+        """
+        super().clean_paths()
+        self._close_client()
+
+    def __getstate__(self) -> dict:
+        """
+        Connections are not pickled.
+        """
+        state = self.__dict__.copy()
+        del state["_local"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._local = threading.local()
 
     def _mkdir(self, path):
         """
@@ -158,8 +272,8 @@ class FTPArtifactStore(ArtifactStore):
         """
         Store data locally in temporary folder and return tmp path.
         """
-        check_make_dir(self.temp_dir)
-        name = get_name_from_uri(key)
-        filepath = get_path(self.temp_dir, name)
+        # Keep directories, so files with the same name do not collide
+        filepath = get_path(self.temp_dir, key.lstrip("/"))
+        Path(filepath).parent.mkdir(parents=True, exist_ok=True)
         write_bytes(obj, filepath)
         return filepath
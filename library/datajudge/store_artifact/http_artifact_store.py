@@ -1,7 +1,8 @@
 """
 Implementation of REST artifact store.
 """
-from typing import Any
+from io import BytesIO
+from typing import Any, Optional
 
 import requests
 from requests.models import HTTPError
@@ -20,6 +21,9 @@ class HTTPArtifactStore(ArtifactStore):
 
     """
 
+    fetch_in_memory = True
+    cache_downloads = True
+
     def persist_artifact(
         self, src: Any, dst: str, src_name: str, metadata: dict
     ) -> None:
@@ -50,8 +54,61 @@ class HTTPArtifactStore(ArtifactStore):
             self._register_resource(f"{src}_{fetch_mode}", filepath)
             return filepath
 
+        # Get file from remote in a buffer
         if fetch_mode == self.BUFFER:
-            raise NotImplementedError
+            return BytesIO(self._get_data(key))
+
+    def fetch_tail(self, src: str, length: int) -> Optional[bytes]:
+        """
+        Return the last bytes of a remote file, None if
+        the server does not support ranged requests.
+        """
+        kwargs = self._parse_auth()
+        headers = {**kwargs.pop("headers", {}), "Range": f"bytes=-{length}"}
+        with requests.get(
+            rebuild_uri(src), timeout=60, headers=headers, stream=True, **kwargs
+        ) as res:
+            # Servers that ignore the range send the whole file
+            if res.status_code != 206:
+                return None
+            return res.content
+
+    def get_size(self, src: str) -> Optional[int]:
+        """
+        Return the Content-Length of a remote file.
+        """
+        headers = self._get_headers(src)
+        if headers is None or headers.get("Content-Length") is None:
+            return None
+        return int(headers["Content-Length"])
+
+    def get_version(self, src: str) -> Optional[str]:
+        """
+        Return the ETag of a remote file, or its last
+        modification date if the server sends no ETag.
+        """
+        headers = self._get_headers(src)
+        if headers is None:
+            return None
+        return headers.get("ETag") or headers.get("Last-Modified")
+
+    def _get_headers(self, src: str) -> Optional[dict]:
+        """
+        Return the headers of a HEAD request on a remote
+        file, None if the request fails.
+        """
+        try:
+            res = requests.head(
+                rebuild_uri(src),
+                timeout=60,
+                allow_redirects=True,
+                **self._parse_auth(),
+            )
+        except requests.RequestException:
+            return None
+        if not res.ok:
+            return None
+        return res.headers
 
     def _check_access_to_storage(self, dst: str) -> None:
         """
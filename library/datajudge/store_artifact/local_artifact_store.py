@@ -1,9 +1,10 @@
 """
 LocalArtifactStore module.
 """
+import os
 from io import BytesIO, StringIO
 from pathlib import Path
-from typing import Any
+from typing import Any, List, Optional
 
 from datajudge.store_artifact.artifact_store import ArtifactStore
 from datajudge.utils.file_utils import (
@@ -13,6 +14,7 @@ from datajudge.utils.file_utils import (
     get_path,
     make_dir,
 )
+from datajudge.utils.glob_utils import join_path
 from datajudge.utils.io_utils import write_json, write_object
 
 
@@ -99,10 +101,40 @@ class LocalArtifactStore(ArtifactStore):
             self._register_resource(f"{src}_{fetch_mode}", src)
             return src
 
+        # Return file content in a buffer
         if fetch_mode == self.BUFFER:
-            raise NotImplementedError(
-                "File fetch using buffers is not yet implemented."
-            )
+            return BytesIO(Path(src).read_bytes())
+
+    def get_version(self, src: str) -> Optional[str]:
+        """
+        Return size and modification time of a file.
+        """
+        try:
+            stat = Path(src).stat()
+        except OSError:
+            return None
+        return f"{stat.st_size}-{stat.st_mtime_ns}"
+
+    def list_files(self, src: str, recursive: bool = True) -> List[str]:
+        """
+        Return the files under a local directory.
+        """
+        files = []
+        dirs = [src]
+        while dirs:
+            path = dirs.pop()
+            try:
+                entries = list(os.scandir(path or "."))
+            except FileNotFoundError:
+                continue
+            for entry in entries:
+                entry_path = join_path(path, entry.name)
+                if entry.is_dir():
+                    if recursive:
+                        dirs.append(entry_path)
+                elif entry.is_file():
+                    files.append(entry_path)
+        return sorted(files)
 
     def _check_access_to_storage(self, dst: str, write: bool = False) -> None:
         """
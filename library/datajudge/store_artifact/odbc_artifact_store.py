@@ -2,15 +2,16 @@
 Implementation of ODBC artifact store.
 """
 # pylint: disable=import-error
-from typing import Any
+from io import BytesIO
+from typing import IO, Any, Union
 
-import pyarrow as pa
-import pyarrow.parquet as pq
 import pyodbc
 
 from datajudge.store_artifact.artifact_store import ArtifactStore
+from datajudge.utils.commons import DEFAULT_BATCH_SIZE
 from datajudge.utils.exceptions import StoreError
 from datajudge.utils.file_utils import check_make_dir, get_path
+from datajudge.utils.sql_utils import write_parquet
 from datajudge.utils.uri_utils import get_uri_netloc
 
 
@@ -54,9 +55,14 @@ class ODBCArtifactStore(ArtifactStore):
             connection.close()
             return filepath
 
+        # Get table from remote as parquet in a buffer
         if fetch_mode == self.BUFFER:
+            obj = self._get_data(connection, table_name)
+            buffer = BytesIO()
+            self._write_table(obj, buffer)
             connection.close()
-            raise NotImplementedError
+            buffer.seek(0)
+            return buffer
 
     def _check_access_to_storage(self, connection: pyodbc.Connection) -> None:
         """
@@ -114,18 +120,9 @@ class ODBCArtifactStore(ArtifactStore):
         return filepath
 
     @staticmethod
-    def _write_table(query_result: Any, filepath: str) -> None:
+    def _write_table(query_result: Any, filepath: Union[str, IO]) -> None:
         """
-        Write a query result as file.
+        Write a query result as parquet in a file or a buffer.
         """
         header = [col[0] for col in query_result.description]
-        arrays = []
-        while True:
-            res = query_result.fetchmany(1024)
-            if res:
-                for row in res:
-                    arrays.append(dict(zip(header, row)))
-            else:
-                tab = pa.Table.from_pylist(arrays)
-                pq.write_table(tab, filepath)
-                break
+        write_parquet(query_result, header, filepath, DEFAULT_BATCH_SIZE)
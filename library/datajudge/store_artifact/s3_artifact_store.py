@@ -3,27 +3,46 @@ Implementation of S3 artifact store.
 """
 # pylint: disable=unused-import
 import json
+import os
+import threading
+import time
 from io import BytesIO, StringIO
 from pathlib import Path
-from typing import IO, Any, Type
+from typing import IO, Any, List, Optional, Tuple, Type
 
 import boto3
 import botocore.client
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
 from datajudge.store_artifact.artifact_store import ArtifactStore
+from datajudge.utils.commons import (
+    DEFAULT_READ_WORKERS,
+    S3_MAX_CONCURRENCY,
+    S3_MAX_POOL_CONNECTIONS,
+    S3_PART_SIZE,
+)
 from datajudge.utils.exceptions import StoreError
-from datajudge.utils.file_utils import check_make_dir, check_path, get_path
-from datajudge.utils.io_utils import wrap_string, write_bytes, write_bytesio
+from datajudge.utils.file_utils import check_path, get_path
+from datajudge.utils.glob_utils import join_path
+from datajudge.utils.io_utils import (
+    open_ranged,
+    wrap_string,
+    write_bytes,
+    write_bytesio,
+)
 from datajudge.utils.uri_utils import (
     build_key,
-    get_name_from_uri,
     get_uri_netloc,
     get_uri_path,
 )
+from datajudge.utils.utils import flatten_list, parallel_map
 
 S3Client = Type["botocore.client.S3"]
 
+# Store config keys that tune downloads and are not passed to boto
+TRANSFER_ARGS = ("part_size", "max_concurrency")
+
 
 class S3ArtifactStore(ArtifactStore):
     """
@@ -33,6 +52,30 @@ class S3ArtifactStore(ArtifactStore):
 
     """
 
+    fetch_in_memory = True
+    cache_downloads = True
+
+    def __init__(
+        self,
+        name: str,
+        store_type: str,
+        artifact_uri: str,
+        temp_dir: str,
+        config: Optional[dict] = None,
+        is_default: bool = False,
+    ) -> None:
+        super().__init__(name, store_type, artifact_uri, temp_dir, config, is_default)
+        # The client is built once and shared by all threads,
+        # bucket access is checked once per store lifetime
+        self._client = None
+        self._lock = threading.Lock()
+        self._checked_buckets = set()
+        # Objects larger than a part are downloaded with
+        # concurrent ranged requests
+        cfg = self.config or {}
+        self.part_size = int(cfg.get("part_size", S3_PART_SIZE))
+        self.max_concurrency = int(cfg.get("max_concurrency", S3_MAX_CONCURRENCY))
+
     def persist_artifact(
         self, src: Any, dst: str, src_name: str, metadata: dict
     ) -> None:
@@ -103,7 +146,7 @@ class S3ArtifactStore(ArtifactStore):
             The mode for fetching the artifact. It can be one of the following:
                 * self.NATIVE : Returns a presigned URL.
                 * self.FILE : Gets the file from remote and stores it locally.
-                * self.BUFFER : Not implemented.
+                * self.BUFFER : Gets the file from remote in a buffer.
 
         Raises:
         -------
@@ -113,12 +156,13 @@ class S3ArtifactStore(ArtifactStore):
         Returns:
         --------
         str
-            Returns a presigned URL (if fetch_mode is self.NATIVE) or the file path (if fetch_mode is self.FILE).
+            Returns a presigned URL (if fetch_mode is self.NATIVE), the file path (if fetch_mode is self.FILE)
+            or a buffer (if fetch_mode is self.BUFFER).
         """
         client = self._get_client()
         bucket = get_uri_netloc(self.artifact_uri)
         self._check_access_to_storage(client, bucket)
-        key = get_uri_path(src)
+        key = self._get_key(src)
 
         # Log the information about the resource being fetched
         self.logger.info(f"Fetching resource {src} from store {self.name}")
@@ -131,31 +175,134 @@ class S3ArtifactStore(ArtifactStore):
 
         # Get the file from S3 and save it locally
         elif fetch_mode == self.FILE:
-            obj = self._get_data(client, bucket, key)
-            filepath = self._store_data(obj, key)
+            filepath = self._download_file(client, bucket, key)
             self._register_resource(f"{src}_{fetch_mode}", filepath)
             return filepath
 
+        # Get the file from S3 in a buffer
         elif fetch_mode == self.BUFFER:
-            raise NotImplementedError
+            return BytesIO(self._get_data(client, bucket, key))
 
         else:
             raise NotImplementedError
 
+    def fetch_tail(self, src: str, length: int) -> Optional[bytes]:
+        """
+        Return the last bytes of an object.
+        """
+        client = self._get_client()
+        bucket = get_uri_netloc(self.artifact_uri)
+        key = self._get_key(src)
+        obj = client.get_object(Bucket=bucket, Key=key, Range=f"bytes=-{length}")
+        return obj["Body"].read()
+
+    def open_file(self, src: str) -> IO:
+        """
+        Return a seekable file that reads an object with ranged
+        GETs. Every request must match the ETag the object had
+        when it was opened.
+        """
+        client = self._get_client()
+        bucket = get_uri_netloc(self.artifact_uri)
+        self._check_access_to_storage(client, bucket)
+        key = self._get_key(src)
+        head = client.head_object(Bucket=bucket, Key=key)
+        etag = head["ETag"]
+        self.logger.info(f"Reading resource {src} from store {self.name}")
+
+        def _fetch_range(start: int, length: int) -> bytes:
+            try:
+                obj = client.get_object(
+                    Bucket=bucket,
+                    Key=key,
+                    Range=f"bytes={start}-{start + length - 1}",
+                    IfMatch=etag,
+                )
+            except ClientError as ex:
+                raise StoreError(f"Unable to read {src}, object changed? {ex}")
+            return obj["Body"].read()
+
+        return open_ranged(_fetch_range, head["ContentLength"], self.part_size)
+
+    def get_version(self, src: str) -> Optional[str]:
+        """
+        Return the ETag of an object.
+        """
+        client = self._get_client()
+        bucket = get_uri_netloc(self.artifact_uri)
+        try:
+            obj = client.head_object(Bucket=bucket, Key=self._get_key(src))
+        except ClientError:
+            return None
+        return obj.get("ETag")
+
+    def list_files(self, src: str, recursive: bool = True) -> List[str]:
+        """
+        Return the objects under a prefix, with the same
+        scheme and bucket of the prefix. Subprefixes are
+        listed concurrently.
+        """
+        client = self._get_client()
+        bucket = get_uri_netloc(self.artifact_uri)
+        prefix = get_uri_path(src).strip("/")
+        prefix = f"{prefix}/" if prefix else ""
+        keys, prefixes = self._list_objects(client, bucket, prefix, "/")
+        if recursive:
+
+            def fnc(pfx: str) -> List[str]:
+                return self._list_objects(client, bucket, pfx)[0]
+
+            keys.extend(flatten_list(parallel_map(fnc, prefixes, DEFAULT_READ_WORKERS)))
+        return sorted(join_path(src, key[len(prefix) :]) for key in keys)
+
+    @staticmethod
+    def _list_objects(
+        client: S3Client, bucket: str, prefix: str, delimiter: str = ""
+    ) -> Tuple[List[str], List[str]]:
+        """
+        Return keys and common prefixes under a prefix.
+        """
+        keys, prefixes = [], []
+        paginator = client.get_paginator("list_objects_v2")
+        pages = paginator.paginate(Bucket=bucket, Prefix=prefix, Delimiter=delimiter)
+        for page in pages:
+            keys.extend(obj["Key"] for obj in page.get("Contents", []))
+            prefixes.extend(pre["Prefix"] for pre in page.get("CommonPrefixes", []))
+        return keys, prefixes
+
     def _get_client(self) -> S3Client:
         """
-        Return a boto client.
+        Return a boto client. The client is created on first use
+        and reused afterwards, since boto clients are thread-safe.
 
         Returns:
         --------
         S3Client
             Returns a client object that interacts with the S3 storage service.
         """
-        return boto3.client("s3", **self.config)
+        if self._client is None:
+            with self._lock:
+                if self._client is None:
+                    self._client = self._build_client()
+        return self._client
+
+    def _build_client(self) -> S3Client:
+        """
+        Build a boto client with a connection pool large enough
+        for concurrent reads. Sessions are not thread-safe, so each
+        store uses its own.
+        """
+        args = {k: v for k, v in (self.config or {}).items() if k not in TRANSFER_ARGS}
+        config = Config(max_pool_connections=S3_MAX_POOL_CONNECTIONS)
+        if isinstance(args.get("config"), Config):
+            config = config.merge(args["config"])
+        args["config"] = config
+        return boto3.session.Session().client("s3", **args)
 
     def _check_access_to_storage(self, client: S3Client, bucket: str) -> None:
         """
         Check if the S3 bucket is accessible by sending a head_bucket request.
+        Access is checked once, successful checks are remembered.
 
         Parameters:
         -----------
@@ -174,10 +321,34 @@ class S3ArtifactStore(ArtifactStore):
             If access to the specified bucket is not available.
 
         """
+        if bucket in self._checked_buckets:
+            return
         try:
             client.head_bucket(Bucket=bucket)
         except ClientError:
             raise StoreError("No access to s3 bucket!")
+        self._checked_buckets.add(bucket)
+
+    def __getstate__(self) -> dict:
+        """
+        Clients and locks are not pickled.
+        """
+        state = self.__dict__.copy()
+        state["_client"] = None
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _get_key(src: str) -> str:
+        """
+        Return the key of an object from a key or a full
+        s3://bucket/key URI. S3 keys have no leading "/".
+        """
+        return get_uri_path(src).lstrip("/")
 
     @staticmethod
     def _get_presigned_url(client: S3Client, bucket: str, src: str) -> str:
@@ -284,6 +455,84 @@ class S3ArtifactStore(ArtifactStore):
         obj = client.get_object(Bucket=bucket, Key=key)
         return obj["Body"].read()
 
+    def _download_file(self, client: S3Client, bucket: str, key: str) -> str:
+        """
+        Download an object in the temporary directory and return the file path.
+
+        The file is preallocated and the object is fetched in parts
+        with concurrent ranged requests, each streamed to its offset,
+        so memory is bounded by the part size. Every request must
+        match the ETag of the object and the downloaded size is checked.
+
+        Parameters
+        ----------
+        client : S3Client
+            An instance of the S3 Client used for downloading the object.
+        bucket : str
+            The name of the S3 bucket where the object resides.
+        key : str
+            The key under which the object is stored in the specified bucket.
+
+        Returns
+        -------
+        str
+            Path of the stored data file.
+
+        Raises
+        ------
+        StoreError
+            If the object changes during the download or it is incomplete.
+        """
+        head = client.head_object(Bucket=bucket, Key=key)
+        size, etag = head["ContentLength"], head["ETag"]
+
+        filepath = get_path(self.temp_dir, key)
+        Path(filepath).parent.mkdir(parents=True, exist_ok=True)
+        with open(filepath, "wb") as file:
+            file.truncate(size)
+
+        part_size = max(self.part_size, 1)
+        ranges = [(i, min(i + part_size, size) - 1) for i in range(0, size, part_size)]
+        progress = {"bytes": 0, "parts": 0}
+        lock = threading.Lock()
+
+        def _fetch_part(part: Tuple[int, int]) -> None:
+            start, end = part
+            try:
+                obj = client.get_object(
+                    Bucket=bucket, Key=key, Range=f"bytes={start}-{end}", IfMatch=etag
+                )
+            except ClientError as ex:
+                raise StoreError(f"Unable to fetch {key}, object changed? {ex}")
+            written = 0
+            with open(filepath, "r+b") as file:
+                file.seek(start)
+                for chunk in obj["Body"].iter_chunks():
+                    file.write(chunk)
+                    written += len(chunk)
+            if written != end - start + 1:
+                raise StoreError(f"Incomplete part {start}-{end} of {key}.")
+            with lock:
+                progress["bytes"] += written
+                progress["parts"] += 1
+                self.logger.debug(
+                    f"Fetched part {progress['parts']}/{len(ranges)} of {key}, "
+                    f"{progress['bytes']}/{size} bytes"
+                )
+
+        start_time = time.perf_counter()
+        parallel_map(_fetch_part, ranges, self.max_concurrency)
+        elapsed = time.perf_counter() - start_time
+
+        if os.path.getsize(filepath) != size or progress["bytes"] != size:
+            raise StoreError(f"Size mismatch for {key}, expected {size} bytes.")
+        throughput = size / 1024**2 / elapsed if elapsed else 0.0
+        self.logger.info(
+            f"Fetched {key} ({size} bytes, {len(ranges)} parts) "
+            f"in {elapsed:.2f}s, {throughput:.2f} MB/s"
+        )
+        return filepath
+
     def _store_data(self, obj: bytes, key: str) -> str:
         """
         Store binary data in a temporary directory and return the file path.
@@ -300,8 +549,9 @@ class S3ArtifactStore(ArtifactStore):
         str
             Path of the stored data file.
         """
-        check_make_dir(self.temp_dir)
-        name = get_name_from_uri(key)
-        filepath = get_path(self.temp_dir, name)
+        # Keep directories, so files of partitioned
+        # resources with the same name do not collide
+        filepath = get_path(self.temp_dir, key.lstrip("/"))
+        Path(filepath).parent.mkdir(parents=True, exist_ok=True)
         write_bytes(obj, filepath)
         return filepath
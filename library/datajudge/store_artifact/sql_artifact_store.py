@@ -1,18 +1,19 @@
 """
 Implementation of SQL artifact store.
 """
-from typing import Any, Optional
+from io import BytesIO
+from typing import IO, Any, Optional, Union
 
-import pyarrow as pa
-import pyarrow.parquet as pq
-from sqlalchemy import MetaData, Table, create_engine
-from sqlalchemy.engine import Engine
+from sqlalchemy import MetaData, Table
+from sqlalchemy.engine import Connection, Engine
 from sqlalchemy.engine.cursor import CursorResult
 from sqlalchemy.exc import SQLAlchemyError
 
 from datajudge.store_artifact.artifact_store import ArtifactStore
+from datajudge.utils.commons import DEFAULT_BATCH_SIZE
 from datajudge.utils.exceptions import StoreError
 from datajudge.utils.file_utils import check_make_dir, get_path
+from datajudge.utils.sql_utils import get_engine, get_pool_args, write_parquet
 from datajudge.utils.uri_utils import get_uri_netloc
 
 
@@ -49,38 +50,42 @@ class SQLArtifactStore(ArtifactStore):
         if fetch_mode == self.NATIVE:
             conn_str = self.config.get("connection_string")
             self._register_resource(f"{src}_{fetch_mode}", conn_str)
-            engine.dispose()
             return conn_str
 
         # Get file from remote and store locally
         if fetch_mode == self.FILE:
-            obj = self._get_data(engine, table_name, schema)
-            filepath = self._store_data(obj, key)
+            with engine.connect() as conn:
+                obj = self._get_data(conn, table_name, schema)
+                filepath = self._store_data(obj, key)
             self._register_resource(f"{src}_{fetch_mode}", filepath)
-            engine.dispose()
             return filepath
 
+        # Get table from remote as parquet in a buffer
         if fetch_mode == self.BUFFER:
-            engine.dispose()
-            raise NotImplementedError
+            buffer = BytesIO()
+            with engine.connect() as conn:
+                obj = self._get_data(conn, table_name, schema)
+                self._write_table(obj, buffer)
+            buffer.seek(0)
+            return buffer
 
     def _check_access_to_storage(self, engine: Engine) -> None:
         """
         Check if there is access to the storage.
         """
         try:
-            engine.connect()
+            with engine.connect():
+                pass
         except SQLAlchemyError:
-            engine.dispose()
             raise StoreError("No access to db!")
 
     def _get_engine(self) -> Engine:
         """
-        Create engine from connection string.
+        Return a pooled engine for the connection string.
         """
         connection_string = self.config.get("connection_string")
         try:
-            return create_engine(connection_string, future=True)
+            return get_engine(connection_string, **get_pool_args(self.config))
         except Exception as ex:
             raise StoreError(
                 f"Something wrong with connection string. Arguments: {str(ex.args)}"
@@ -103,17 +108,15 @@ class SQLArtifactStore(ArtifactStore):
         return name.split(".")[0]
 
     def _get_data(
-        self, engine: Engine, table_name: str, schema: Optional[str] = None
+        self, conn: Connection, table_name: str, schema: Optional[str] = None
     ) -> CursorResult:
         """
         Return a table from a db.
         """
-        metadata = MetaData(bind=engine, schema=schema)
-        table = Table(table_name, metadata, autoload=True)
+        metadata = MetaData(schema=schema)
+        table = Table(table_name, metadata, autoload_with=conn)
         query = table.select()
-        with engine.connect() as conn:
-            results = conn.execute(query)
-        return results
+        return conn.execute(query)
 
     def _store_data(self, obj: CursorResult, key: str) -> str:
         """
@@ -124,17 +127,16 @@ class SQLArtifactStore(ArtifactStore):
         self._write_table(obj, filepath)
         return filepath
 
-    @staticmethod
-    def _write_table(query_result: CursorResult, filepath: str) -> None:
-        """
-        Write a query result as file.
-        """
-        arrays = []
-        while True:
-            res = query_result.fetchmany(1024)
-            if res:
-                arrays.extend(list(map(dict, res)))
-            else:
-                tab = pa.Table.from_pylist(arrays)
-                pq.write_table(tab, filepath)
-                break
+    def _write_table(
+        self, query_result: CursorResult, filepath: Union[str, IO]
+    ) -> None:
+        """
+        Write a query result as parquet in a file or a buffer.
+        """
+        batch_size = self.config.get("batch_size", DEFAULT_BATCH_SIZE)
+        columns = list(query_result.keys())
+        # Use the DBAPI cursor if the driver can fetch Arrow data natively
+        cursor = query_result.cursor
+        if getattr(cursor, "fetch_record_batch", None) is None:
+            cursor = query_result
+        write_parquet(cursor, columns, filepath, batch_size)
@@ -0,0 +1,62 @@
+"""
+Arrow utils.
+"""
+import pyarrow as pa
+
+
+def fits_schema(data_schema: pa.Schema, schema: pa.Schema) -> bool:
+    """
+    Check if data with a schema can be stored with another schema
+    without promotion. Null columns fit any type.
+    """
+    return all(
+        field.type == target.type or pa.types.is_null(field.type)
+        for field, target in zip(data_schema, schema)
+    )
+
+
+def promote_schema(schema: pa.Schema, other: pa.Schema) -> pa.Schema:
+    """
+    Return a schema whose columns can hold the values of both schemas.
+    """
+    return pa.schema(
+        field.with_type(_promote_type(field.type, other_field.type))
+        for field, other_field in zip(schema, other)
+    )
+
+
+def _promote_type(left: pa.DataType, right: pa.DataType) -> pa.DataType:
+    """
+    Return a type that can hold the values of both types. Numbers
+    are widened (integers to float if mixed with floats, decimals
+    to the largest precision and scale), any other conflict falls
+    back to strings.
+    """
+    if left == right or pa.types.is_null(right):
+        return left
+    if pa.types.is_null(left):
+        return right
+    if pa.types.is_decimal(left) and pa.types.is_decimal(right):
+        scale = max(left.scale, right.scale)
+        digits = max(left.precision - left.scale, right.precision - right.scale)
+        if digits + scale <= 38:
+            return pa.decimal128(digits + scale, scale)
+        if digits + scale <= 76:
+            return pa.decimal256(digits + scale, scale)
+        return pa.float64()
+    if pa.types.is_integer(left) and pa.types.is_integer(right):
+        return pa.int64()
+    if _is_number(left) and _is_number(right):
+        return pa.float64()
+    return pa.string()
+
+
+def _is_number(data_type: pa.DataType) -> bool:
+    """
+    Check if a type is numeric.
+    """
+    return (
+        pa.types.is_integer(data_type)
+        or pa.types.is_floating(data_type)
+        or pa.types.is_decimal(data_type)
+    )
@@ -14,6 +14,7 @@ LIBRARY_SQLALCHEMY = "sqlalchemy"
 LIBRARY_GREAT_EXPECTATIONS = "great_expectations"
 LIBRARY_DUMMY = "_dummy"
 LIBRARY_EVIDENTLY = "evidently"
+LIBRARY_PYARROW = "pyarrow"
 
 # Data readers format
 DATAREADER_FILE = "file"
@@ -31,6 +32,8 @@ PANDAS_DATAFRAME_SQL_READER = "PandasDataFrameSQLReader"
 POLARS_DATAFRAME_FILE_READER = "PolarsDataFrameFileReader"
 POLARS_DATAFRAME_DUCKDB_READER = "PolarsDataFrameDuckDBReader"
 POLARS_DATAFRAME_SQL_READER = "PolarsDataFrameSQLReader"
+POLARS_LAZYFRAME_FILE_READER = "PolarsLazyFrameFileReader"
+PARQUET_METADATA_READER = "ParquetMetadataReader"
 
 
 # Store types
@@ -150,8 +153,30 @@ STATUS_FINISHED = "finished"
 STATUS_ERROR = "error"
 
 
+# Sampling
+SAMPLE_ARG = "sample"
+SAMPLE_HEAD = "head"
+SAMPLE_RANDOM = "random"
+SAMPLE_STRATIFIED = "stratified"
+SAMPLE_ROW_GROUPS = "row_groups"
+
+
 # Generics
 GENERIC_DUMMY = "_dummy"
 DEFAULT_DIRECTORY = "./djruns/tmp"
+DEFAULT_CACHE_SIZE = 2 * 1024**3
+DEFAULT_DISK_CACHE_SIZE = 20 * 1024**3
+DISK_CACHE_DIRECTORY = "data"
+DEFAULT_DOWNLOAD_CACHE_SIZE = 20 * 1024**3
+DOWNLOAD_CACHE_DIRECTORY = "downloads"
+REGISTRY_DIRECTORY = ".registry"
+DEFAULT_BATCH_SIZE = 65536
+DEFAULT_READ_WORKERS = 8
+DEFAULT_FOOTER_SIZE = 64 * 1024
+DEFAULT_RANGE_SIZE = 8 * 1024**2
+DEFAULT_MAX_IN_MEMORY_SIZE = 256 * 1024**2
+S3_MAX_POOL_CONNECTIONS = 50
+S3_PART_SIZE = 8 * 1024**2
+S3_MAX_CONCURRENCY = 10
 DEFAULT_PROJECT = "project"
 DEFAULT_EXPERIMENT = "experiment"
@@ -18,6 +18,8 @@ from datajudge.utils.commons import (
     CONSTRAINT_SQL_MINIMUM,
     CONSTRAINT_SQL_NON_EMPTY,
     CONSTRAINT_SQL_RANGE,
+    DEFAULT_CACHE_SIZE,
+    DEFAULT_DISK_CACHE_SIZE,
     LIBRARY_DUCKDB,
     LIBRARY_DUMMY,
     LIBRARY_FRICTIONLESS,
@@ -103,6 +105,10 @@ class DataResource(BaseModel):
     tableSchema: Optional[Union[str, dict]] = None
     """Resource table schema or path to table schema."""
 
+    partitions: Optional[dict] = None
+    """Partition filter of a hive-partitioned directory, e.g. {"date": "2026-10-17"}.
+    If set, path points to the directory. Use {} to select all partitions."""
+
 
 class Constraint(BaseModel):
     """
@@ -284,3 +290,12 @@ class RunConfig(BaseModel):
 
     profiling: Optional[List[ExecConfig]] = [ExecConfig()]
     """List of profiling configuration."""
+
+    cacheSize: Optional[int] = DEFAULT_CACHE_SIZE
+    """Memory budget in bytes for data shared by plugins (0 disables, None unbounded)."""
+
+    diskCache: Optional[bool] = False
+    """Persist parsed data in the user cache directory and reuse it across runs."""
+
+    diskCacheSize: Optional[int] = DEFAULT_DISK_CACHE_SIZE
+    """Disk budget in bytes for data persisted across runs (None unbounded)."""
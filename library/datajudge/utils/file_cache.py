@@ -0,0 +1,111 @@
+"""
+File cache module.
+"""
+import os
+from pathlib import Path
+from typing import Callable, Iterator, Optional
+
+from datajudge.utils.logger import LOGGER
+from datajudge.utils.utils import get_uiid
+
+
+class FileCache:
+    """
+    Base class of the caches of files on disk.
+
+    A FileCache keeps one file per key in a directory. Files are
+    written atomically and evicted in LRU order, by modification
+    time, once the disk budget is exceeded. The state of the cache
+    is the directory itself, so it can be shared by many processes.
+
+    Attributes
+    ----------
+    path : str
+        Cache directory.
+    max_size : int, default = None
+        Disk budget in bytes. If None, the cache is unbounded.
+
+    """
+
+    def __init__(self, path: str, max_size: Optional[int] = None) -> None:
+        self.path = Path(path)
+        self.max_size = max_size
+        self.logger = LOGGER
+
+    def get(self, key: str, suffix: str = "") -> Optional[str]:
+        """
+        Return the path of a cached file, None if not present.
+        """
+        path = self._get_path(key, suffix)
+        try:
+            # Mark the file as recently used
+            os.utime(path)
+        except OSError:
+            return None
+        return str(path)
+
+    def _write(self, key: str, suffix: str, write_fnc: Callable[[str], None]) -> str:
+        """
+        Write the file of a key with write_fnc, which takes the
+        destination path, and return the cached path.
+        """
+        # Other users cannot read or replace cached files
+        self.path.mkdir(mode=0o700, parents=True, exist_ok=True)
+        path = self._get_path(key, suffix)
+        tmp_path = self.path / f".{get_uiid()}.tmp"
+        try:
+            write_fnc(str(tmp_path))
+            # Readers never see partially written files
+            os.replace(tmp_path, path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+        os.utime(path)
+        return str(path)
+
+    def _evict(self, keep: Optional[str] = None) -> None:
+        """
+        Remove least recently used files until the cache fits the
+        disk budget. The keep file, just added or fetched by the
+        caller, is never removed.
+        """
+        if self.max_size is None:
+            return
+        files = []
+        for file in self._iter_files():
+            try:
+                stat = file.stat()
+            except OSError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, file))
+        size = sum(f[1] for f in files)
+        for _, file_size, file in sorted(files):
+            if size <= self.max_size:
+                break
+            if keep is not None and str(file) == keep:
+                continue
+            file.unlink(missing_ok=True)
+            size -= file_size
+            self.logger.info(f"Evicted {file.name} from {self.path}.")
+
+    def _iter_files(self) -> Iterator[Path]:
+        """
+        Yield cached files, skipping hidden and partial files.
+        """
+        if not self.path.is_dir():
+            return
+        for file in self.path.iterdir():
+            if file.is_file() and not file.name.startswith("."):
+                yield file
+
+    def _get_path(self, key: str, suffix: str = "") -> Path:
+        """
+        Return the path of the file associated with a key.
+        """
+        return self.path / f"{key}{suffix}"
+
+    def clean_all(self) -> None:
+        """
+        Remove all files from cache.
+        """
+        for file in list(self._iter_files()):
+            file.unlink(missing_ok=True)
@@ -3,7 +3,14 @@ Common filesystem utils.
 """
 import os
 import shutil
+from contextlib import contextmanager
 from pathlib import Path
+from typing import Iterator
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
 
 
 # Directories
@@ -51,6 +58,16 @@ def check_make_dir(uri: str) -> None:
         make_dir(uri)
 
 
+def get_user_cache_dir(name: str) -> str:
+    """
+    Return a cache directory private to the current user
+    ($XDG_CACHE_HOME/datajudge/name, ~/.cache/datajudge/name
+    by default).
+    """
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return str(Path(base, "datajudge", name))
+
+
 # Files
 
 
@@ -71,8 +88,41 @@ def copy_file(src: str, dst: str) -> None:
     shutil.copy(src, dst)
 
 
+def link_file(src: str, dst: str) -> None:
+    """
+    Hard link a file to destination, or copy it if the
+    filesystem does not support links (e.g. across devices).
+    """
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+
+
 def clean_all(path: str) -> None:
     """
     Remove dir and all it's contents.
     """
     shutil.rmtree(path)
+
+
+# Locks
+
+
+@contextmanager
+def lock_file(path: str) -> Iterator[None]:
+    """
+    Hold an exclusive lock on a file, shared by threads and processes.
+    The file is created if missing. Without fcntl (e.g. on Windows)
+    nothing is locked.
+    """
+    if fcntl is None:
+        yield
+        return
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock, fcntl.LOCK_UN)
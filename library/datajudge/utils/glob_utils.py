@@ -0,0 +1,101 @@
+"""
+Glob utils.
+"""
+import re
+
+# Characters that make a path a glob pattern
+GLOB_CHARS = ("*", "?", "[")
+
+
+def is_glob(path: str) -> bool:
+    """
+    Check if a path is a glob pattern.
+    """
+    return any(char in path for char in GLOB_CHARS)
+
+
+def is_prefix(path: str) -> bool:
+    """
+    Check if a path is a prefix, i.e. it ends with a separator.
+    """
+    return path.endswith("/")
+
+
+def is_expandable(path: str) -> bool:
+    """
+    Check if a path must be expanded into files,
+    i.e. it is a glob pattern or a prefix.
+    """
+    return is_glob(path) or is_prefix(path)
+
+
+def get_glob_base(pattern: str) -> str:
+    """
+    Return the directory (or prefix) of a pattern that has no
+    glob characters, e.g. s3://bucket/landing/ for
+    s3://bucket/landing/*.csv.
+    """
+    segments = pattern.split("/")
+    for idx, segment in enumerate(segments):
+        if is_glob(segment):
+            base = "/".join(segments[:idx])
+            return f"{base}/" if base else ""
+    return pattern
+
+
+def is_recursive_glob(pattern: str) -> bool:
+    """
+    Check if matching a pattern requires to list subdirectories.
+    """
+    rest = pattern[len(get_glob_base(pattern)) :]
+    return "**" in rest or "/" in rest
+
+
+def match_glob(path: str, pattern: str) -> bool:
+    """
+    Check if a path matches a glob pattern. ** matches any number
+    of directories, * and ? do not match separators.
+    """
+    return re.fullmatch(_translate(pattern), path) is not None
+
+
+def join_path(base: str, name: str) -> str:
+    """
+    Join a directory (or prefix) and a relative name.
+    """
+    base = base.rstrip("/")
+    return f"{base}/{name}" if base else name
+
+
+def _translate(pattern: str) -> str:
+    """
+    Translate a glob pattern into a regular expression.
+    """
+    regex = []
+    idx = 0
+    while idx < len(pattern):
+        char = pattern[idx]
+        if pattern.startswith("**/", idx):
+            regex.append("(?:.*/)?")
+            idx += 3
+            continue
+        if pattern.startswith("**", idx):
+            regex.append(".*")
+            idx += 2
+            continue
+        if char == "*":
+            regex.append("[^/]*")
+        elif char == "?":
+            regex.append("[^/]")
+        elif char == "[" and "]" in pattern[idx + 2 :]:
+            end = pattern.index("]", idx + 2)
+            chars = pattern[idx + 1 : end]
+            if chars.startswith("!"):
+                chars = "^" + chars[1:]
+            regex.append(f"[{chars}]")
+            idx = end + 1
+            continue
+        else:
+            regex.append(re.escape(char))
+        idx += 1
+    return "".join(regex)
@@ -3,9 +3,12 @@ Common IO utils.
 """
 import json
 import shutil
-from io import BufferedReader, BytesIO, StringIO, TextIOWrapper
+from io import BufferedReader, BytesIO, RawIOBase, StringIO, TextIOWrapper
 from pathlib import Path
-from typing import IO, Union
+from typing import IO, Callable, Iterator, Union
+
+import pyarrow as pa
+import pyarrow.parquet as pq
 
 
 #  https://stackoverflow.com/questions/55889474/convert-io-stringio-to-io-bytesio
@@ -35,6 +38,66 @@ class BytesIOWrapper(BufferedReader):
         return self._encoding_call("peek", size)
 
 
+class RangedFile(RawIOBase):
+    """
+    Read-only, seekable binary file over ranged reads of a remote
+    resource. Bytes are requested only when they are read, so
+    seeking to a footer or to a column chunk does not fetch
+    the rest of the resource.
+    """
+
+    def __init__(self, fetch_range: Callable[[int, int], bytes], size: int) -> None:
+        super().__init__()
+        self.fetch_range = fetch_range
+        self.size = size
+        self.pos = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self.pos
+
+    def seek(self, offset: int, whence: int = 0) -> int:
+        if whence == 0:
+            pos = offset
+        elif whence == 1:
+            pos = self.pos + offset
+        elif whence == 2:
+            pos = self.size + offset
+        else:
+            raise ValueError(f"Invalid whence {whence}.")
+        if pos < 0:
+            raise ValueError("Negative seek position.")
+        self.pos = pos
+        return self.pos
+
+    def readinto(self, buffer: Union[bytearray, memoryview]) -> int:
+        length = min(len(buffer), self.size - self.pos)
+        if length <= 0:
+            return 0
+        data = self.fetch_range(self.pos, length)
+        if len(data) != length:
+            raise IOError(f"Expected {length} bytes at {self.pos}, got {len(data)}.")
+        buffer[:length] = data
+        self.pos += length
+        return length
+
+
+def open_ranged(
+    fetch_range: Callable[[int, int], bytes], size: int, buffer_size: int
+) -> BufferedReader:
+    """
+    Open a remote resource of given size as a buffered binary file.
+    fetch_range(start, length) must return the requested bytes,
+    reads are issued in blocks of buffer_size bytes.
+    """
+    return BufferedReader(RangedFile(fetch_range, size), buffer_size)
+
+
 def wrap_bytes(src: IO) -> StringIO:
     """
     Wrap a BytesIO in a StringIO.
@@ -105,3 +168,40 @@ def write_object(buff: IO, dst: str) -> None:
     write_mode = "wb" if isinstance(buff, BytesIO) else "w"
     with open(dst, write_mode) as file:
         shutil.copyfileobj(buff, file)
+
+
+def write_arrow_ipc(table: pa.Table, path: str) -> None:
+    """
+    Write an Arrow table in an uncompressed IPC file.
+    """
+    with pa.OSFile(path, "wb") as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+
+
+def read_arrow_ipc(path: str) -> pa.Table:
+    """
+    Memory-map an Arrow IPC file. Buffers of the returned
+    table point to the mapped file, data are not copied.
+    """
+    source = pa.memory_map(path, "r")
+    return pa.ipc.open_file(source).read_all()
+
+
+def iter_parquet_batches(path: str, batch_size: int) -> Iterator[pa.RecordBatch]:
+    """
+    Yield the rows of a parquet file as Arrow record batches.
+    Row groups are read one at a time.
+    """
+    with pq.ParquetFile(path) as file:
+        yield from file.iter_batches(batch_size=batch_size)
+
+
+def iter_parquet_row_groups(path: str, step: int) -> Iterator[pa.Table]:
+    """
+    Yield one every step row groups of a parquet file as Arrow
+    tables. Other row groups are never read.
+    """
+    with pq.ParquetFile(path) as file:
+        for idx in range(0, file.num_row_groups, step):
+            yield file.read_row_group(idx)
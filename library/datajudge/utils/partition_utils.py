@@ -0,0 +1,57 @@
+"""
+Hive partitioning utils.
+"""
+import re
+from typing import Any, List, Optional
+
+# A path segment in the form key=value
+PARTITION_SEGMENT = re.compile(r"^([A-Za-z_][\w]*)=([^=]+)$")
+
+# Files written by processing engines next to data files
+IGNORED_PREFIXES = (".", "_")
+
+
+def parse_partitions(path: str) -> dict:
+    """
+    Return the partition columns of a file, parsed from the
+    key=value directories of its path.
+    """
+    partitions = {}
+    for segment in str(path).split("/")[:-1]:
+        match = PARTITION_SEGMENT.match(segment)
+        if match is not None:
+            partitions[match.group(1)] = match.group(2)
+    return partitions
+
+
+def is_data_file(path: str) -> bool:
+    """
+    Check if a file is a data file, i.e. it is not hidden
+    or a marker (e.g. _SUCCESS).
+    """
+    name = str(path).rstrip("/").split("/")[-1]
+    return bool(name) and not name.startswith(IGNORED_PREFIXES)
+
+
+def filter_partitions(paths: List[str], filters: Optional[dict] = None) -> List[str]:
+    """
+    Return the data files that match a partition filter. The filter
+    maps partition columns to a value or a list of accepted values.
+    """
+    filters = {k: _to_strings(v) for k, v in (filters or {}).items()}
+    result = []
+    for path in paths:
+        if not is_data_file(path):
+            continue
+        partitions = parse_partitions(path)
+        if all(partitions.get(k) in v for k, v in filters.items()):
+            result.append(path)
+    return sorted(result)
+
+
+def _to_strings(value: Any) -> List[str]:
+    """
+    Return the accepted values of a partition as strings.
+    """
+    values = value if isinstance(value, (list, tuple, set)) else [value]
+    return [str(v) for v in values]
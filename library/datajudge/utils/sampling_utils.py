@@ -0,0 +1,171 @@
+"""
+Sampling utils.
+"""
+from typing import Any, Callable, List, Optional
+
+import numpy as np
+
+from datajudge.utils.commons import (
+    DEFAULT_BATCH_SIZE,
+    SAMPLE_ARG,
+    SAMPLE_HEAD,
+    SAMPLE_RANDOM,
+    SAMPLE_ROW_GROUPS,
+    SAMPLE_STRATIFIED,
+)
+
+# Arguments required by each strategy
+SAMPLE_REQUIRED = {
+    SAMPLE_HEAD: ("size",),
+    SAMPLE_RANDOM: (),
+    SAMPLE_STRATIFIED: ("column", "size"),
+    SAMPLE_ROW_GROUPS: ("step",),
+}
+
+
+def parse_sample_args(sample: dict) -> dict:
+    """
+    Check sampling arguments and set defaults.
+    """
+    args = {"batchSize": DEFAULT_BATCH_SIZE, "seed": None, **sample}
+    strategy = args.get("strategy")
+    if strategy not in SAMPLE_REQUIRED:
+        raise ValueError(
+            f"Sampling strategy must be one of {', '.join(SAMPLE_REQUIRED)}."
+        )
+    missing = [arg for arg in SAMPLE_REQUIRED[strategy] if args.get(arg) is None]
+    if missing:
+        raise ValueError(f"Sampling strategy {strategy} requires {missing}.")
+    if strategy == SAMPLE_RANDOM and (args.get("size") is None) == (
+        args.get("fraction") is None
+    ):
+        raise ValueError("Random sampling requires either size or fraction.")
+    return args
+
+
+class Sampler:
+    """
+    Streaming sampler.
+
+    A Sampler receives the batches of a resource one at a time and
+    keeps only the rows that can still be part of the sample, so
+    memory is bounded by the sample and a batch. Random and
+    stratified samples are reservoirs: each row gets a random key and
+    the rows with the smallest keys (per stratum) are kept.
+
+    Attributes
+    ----------
+    args : dict
+        Sampling arguments (see parse_sample_args).
+    take : Callable
+        Function that selects rows of a batch by position.
+    get_column : Callable
+        Function that returns a column of a batch as numpy array.
+
+    """
+
+    def __init__(self, args: dict, take: Callable, get_column: Callable) -> None:
+        self.args = args
+        self.take = take
+        self.get_column = get_column
+        self.rng = np.random.default_rng(args.get("seed"))
+        self.candidates = []
+        self.rows = 0
+        self.done = False
+
+    def add(self, batch: Any, length: int) -> None:
+        """
+        Add a batch to the sample.
+        """
+        self.rows += length
+        strategy = self.args["strategy"]
+        if strategy == SAMPLE_HEAD:
+            remaining = self.args["size"] - self._count()
+            if remaining <= length:
+                batch = self.take(batch, np.arange(remaining))
+                self.done = True
+            self.candidates.append((batch, None, None))
+        elif strategy == SAMPLE_ROW_GROUPS:
+            self.candidates.append((batch, None, None))
+        elif strategy == SAMPLE_RANDOM and self.args.get("fraction") is not None:
+            mask = self.rng.random(length) < self.args["fraction"]
+            self.candidates.append((self.take(batch, np.flatnonzero(mask)), None, None))
+        else:
+            groups = None
+            if strategy == SAMPLE_STRATIFIED:
+                groups = self.get_column(batch, self.args["column"]).astype(str)
+            self.candidates.append((batch, self.rng.random(length), groups))
+            self._compact()
+
+    def get_sample(self) -> List[Any]:
+        """
+        Return the sampled batches.
+        """
+        return [batch for batch, _, _ in self.candidates]
+
+    def _count(self) -> int:
+        """
+        Return the number of sampled rows.
+        """
+        return sum(len(batch) for batch, _, _ in self.candidates)
+
+    def _compact(self) -> None:
+        """
+        Keep only the rows with the smallest keys, overall
+        or per stratum.
+        """
+        size = self.args["size"]
+        keys = np.concatenate([k for _, k, _ in self.candidates])
+        if self.args["strategy"] == SAMPLE_STRATIFIED:
+            groups = np.concatenate([g for _, _, g in self.candidates])
+            keep = _rank_by_group(keys, groups) < size
+        else:
+            if len(keys) <= size:
+                return
+            threshold = np.partition(keys, size - 1)[size - 1]
+            keep = keys <= threshold
+
+        candidates, start = [], 0
+        for batch, batch_keys, batch_groups in self.candidates:
+            mask = keep[start : start + len(batch_keys)]
+            start += len(batch_keys)
+            if mask.all():
+                candidates.append((batch, batch_keys, batch_groups))
+            elif mask.any():
+                idx = np.flatnonzero(mask)
+                groups = None if batch_groups is None else batch_groups[idx]
+                candidates.append((self.take(batch, idx), batch_keys[idx], groups))
+        self.candidates = candidates
+
+    def describe(self) -> dict:
+        """
+        Return a description of the sample.
+        """
+        desc = {
+            k: v for k, v in self.args.items() if k != "batchSize" and v is not None
+        }
+        desc["rows"] = self._count()
+        desc["readRows"] = self.rows
+        return desc
+
+
+def _rank_by_group(keys: np.ndarray, groups: np.ndarray) -> np.ndarray:
+    """
+    Return the rank of each key within its group.
+    """
+    order = np.lexsort((keys, groups))
+    sorted_groups = groups[order]
+    starts = np.r_[0, np.flatnonzero(sorted_groups[1:] != sorted_groups[:-1]) + 1]
+    lengths = np.diff(np.r_[starts, len(order)])
+    ranks = np.empty(len(order), dtype=np.int64)
+    ranks[order] = np.arange(len(order)) - np.repeat(starts, lengths)
+    return ranks
+
+
+def get_sample_args(exec_args: Optional[dict]) -> Optional[dict]:
+    """
+    Return the sampling arguments of a plugin, if any.
+    """
+    if not isinstance(exec_args, dict):
+        return None
+    return exec_args.get(SAMPLE_ARG)
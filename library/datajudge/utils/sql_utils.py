@@ -0,0 +1,148 @@
+"""
+SQL utils.
+"""
+import os
+import shutil
+import tempfile
+import threading
+from typing import IO, Any, Iterator, Optional, Union
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
+
+from datajudge.utils.arrow_utils import fits_schema, promote_schema
+
+# Keys of a store configuration used to configure the connection pool
+POOL_ARGS = ("pool_size", "max_overflow", "pool_recycle", "pool_timeout")
+
+_ENGINES = {}
+_LOCK = threading.Lock()
+
+
+def get_engine(conn_str: str, **kwargs) -> Engine:
+    """
+    Return a pooled SQLAlchemy Engine for a connection string.
+    Engines are created once per process and shared by every
+    store and reader that connect to the same database. Engines
+    use the SQLAlchemy 2.0 style API (future=True).
+    """
+    # Connection pools must not be shared with forked processes,
+    # so the process id is part of the key.
+    key = (os.getpid(), conn_str, tuple(sorted(kwargs.items())))
+    with _LOCK:
+        engine = _ENGINES.get(key)
+        if engine is None:
+            engine = create_engine(conn_str, future=True, pool_pre_ping=True, **kwargs)
+            _ENGINES[key] = engine
+        return engine
+
+
+def get_pool_args(config: Optional[dict]) -> dict:
+    """
+    Return the connection pool arguments from a store configuration.
+    """
+    if not config:
+        return {}
+    return {k: config[k] for k in POOL_ARGS if config.get(k) is not None}
+
+
+def dispose_engines() -> None:
+    """
+    Close all the connection pools of the registry.
+    """
+    with _LOCK:
+        for engine in _ENGINES.values():
+            engine.dispose()
+        _ENGINES.clear()
+
+
+def write_parquet(
+    cursor: Any, columns: list, filepath: Union[str, IO], batch_size: int
+) -> int:
+    """
+    Stream the rows of a cursor in a parquet file (or a writable
+    buffer), one record batch at a time, and return the number of
+    rows written. Only a batch of rows is held in memory.
+
+    Column types are inferred batch by batch, so a later batch may
+    not fit the schema of the first ones (e.g. floats after integers,
+    values after nulls). In that case the schema is promoted, the
+    following batches are written in a new segment and at the end
+    all the segments are rewritten in filepath with the final schema.
+    """
+    # Segments are written next to the destination file
+    parent = os.path.dirname(filepath) if isinstance(filepath, str) else None
+    with tempfile.TemporaryDirectory(dir=parent or None) as tmp_dir:
+        segments = []
+        schema = None
+        writer = None
+        rows = 0
+        try:
+            for batch in iter_record_batches(cursor, columns, batch_size):
+                if writer is None or not fits_schema(batch.schema, schema):
+                    if writer is not None:
+                        writer.close()
+                    schema = promote_schema(schema or batch.schema, batch.schema)
+                    # The first segment is written in place, so the
+                    # file is not rewritten if the schema never changes
+                    segment = filepath
+                    if segments:
+                        segment = os.path.join(tmp_dir, f"{len(segments)}.parquet")
+                    writer = pq.ParquetWriter(segment, schema)
+                    segments.append(segment)
+                writer.write_table(pa.Table.from_batches([batch]).cast(schema))
+                rows += batch.num_rows
+        finally:
+            if writer is not None:
+                writer.close()
+        if not segments:
+            arrays = [pa.array([], pa.string()) for _ in columns]
+            pq.write_table(pa.table(arrays, names=columns), filepath)
+        elif len(segments) > 1:
+            _merge_segments(segments, schema, filepath, tmp_dir)
+    return rows
+
+
+def _merge_segments(
+    segments: list, schema: pa.Schema, filepath: Union[str, IO], tmp_dir: str
+) -> None:
+    """
+    Rewrite parquet segments written with different schemas in
+    filepath, casting them to the final schema. The first segment
+    is filepath itself, so it is moved in the temporary directory.
+    """
+    first = os.path.join(tmp_dir, "0.parquet")
+    if isinstance(filepath, str):
+        shutil.move(filepath, first)
+    else:
+        filepath.seek(0)
+        with open(first, "wb") as file:
+            shutil.copyfileobj(filepath, file)
+        filepath.seek(0)
+        filepath.truncate()
+    with pq.ParquetWriter(filepath, schema) as writer:
+        for segment in [first, *segments[1:]]:
+            for batch in pq.ParquetFile(segment).iter_batches():
+                writer.write_table(pa.Table.from_batches([batch]).cast(schema))
+
+
+def iter_record_batches(
+    cursor: Any, columns: list, batch_size: int
+) -> Iterator[pa.RecordBatch]:
+    """
+    Yield the rows of a cursor as Arrow record batches. Cursors that
+    can fetch Arrow data natively (e.g. DuckDB) are read directly,
+    otherwise rows are fetched in chunks and converted column by column.
+    """
+    fetch_arrow = getattr(cursor, "fetch_record_batch", None)
+    if fetch_arrow is not None:
+        yield from fetch_arrow(batch_size)
+        return
+    while True:
+        res = cursor.fetchmany(batch_size)
+        if not res:
+            break
+        arrays = [pa.array(col) for col in zip(*res)]
+        yield pa.RecordBatch.from_arrays(arrays, names=columns)
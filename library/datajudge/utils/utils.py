@@ -1,10 +1,11 @@
 """
 Common generic utils.
 """
+import concurrent.futures
 import functools
 import operator
 from datetime import datetime
-from typing import Any, List, Optional, Tuple, Union
+from typing import Any, Callable, List, Optional, Tuple, Union
 from uuid import uuid4
 
 
@@ -41,3 +42,16 @@ def get_time() -> str:
     Return ISO 8601 time with timezone info.
     """
     return datetime.now().astimezone().isoformat(timespec="milliseconds")
+
+
+def parallel_map(
+    fnc: Callable, items: List[Any], max_workers: Optional[int] = None
+) -> List[Any]:
+    """
+    Apply a function to a list of items in a thread pool.
+    Results are returned in the same order of the items.
+    """
+    if len(items) < 2:
+        return [fnc(i) for i in items]
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(fnc, items))
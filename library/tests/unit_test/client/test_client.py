@@ -3,6 +3,7 @@ import pytest
 from datajudge.client.client import Client
 from datajudge.run.run import Run
 from datajudge.utils.exceptions import StoreError
+from datajudge.utils.sql_utils import get_engine
 
 
 class TestClient:
@@ -48,6 +49,14 @@ class TestClient:
         run = client.create_run([local_resource], run_empty)
         assert isinstance(run, Run)
 
+    def test_shutdown(self, sqlitedb):
+        client = Client(max_workers=1)
+        client._worker_pool.start()
+        engine = get_engine(sqlitedb)
+        client.shutdown()
+        assert client._worker_pool._executor is None
+        assert get_engine(sqlitedb) is not engine
+
 
 # Metadata store config
 @pytest.fixture
@@ -10,11 +10,13 @@ from datajudge.client.store_handler import (
     StoreRegistry,
 )
 from datajudge.store_artifact.artifact_store import ArtifactStore
+from datajudge.store_artifact.download_cache import DownloadCache
 from datajudge.store_artifact.dummy_artifact_store import DummyArtifactStore
 from datajudge.store_metadata.dummy_metadata_store import DummyMetadataStore
 from datajudge.store_metadata.metadata_store import MetadataStore
-from datajudge.utils.commons import GENERIC_DUMMY
+from datajudge.utils.commons import DOWNLOAD_CACHE_DIRECTORY, GENERIC_DUMMY
 from datajudge.utils.exceptions import StoreError
+from datajudge.utils.file_utils import get_user_cache_dir
 
 
 class TestStoreRegistry:
@@ -101,6 +103,24 @@ class TestStoreHandler:
             handler = StoreHandler(store=[st_loc1_cfg, st_loc2_cfg], tmp_dir=temp_data)
             handler._update_default_store()
 
+    def test_download_cache(self, temp_data, st_loc1_cfg, tmp_path):
+        handler = StoreHandler(store=st_loc1_cfg, tmp_dir=temp_data)
+        assert handler.get_art_store(st_loc1_cfg.name).download_cache is None
+        handler = StoreHandler(
+            store=st_loc1_cfg, tmp_dir=temp_data, download_cache=True
+        )
+        cache = handler.get_art_store(st_loc1_cfg.name).download_cache
+        assert isinstance(cache, DownloadCache)
+        assert handler.get_def_store().download_cache is cache
+        assert cache.path == Path(get_user_cache_dir(DOWNLOAD_CACHE_DIRECTORY))
+        handler = StoreHandler(
+            store=st_loc1_cfg,
+            tmp_dir=temp_data,
+            download_cache=True,
+            download_cache_dir=str(tmp_path),
+        )
+        assert handler.get_def_store().download_cache.path == tmp_path
+
     def test_get_md_store(self, temp_data):
         assert isinstance(
             StoreHandler(tmp_dir=temp_data).get_md_store(), DummyMetadataStore
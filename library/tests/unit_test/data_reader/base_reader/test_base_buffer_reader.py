@@ -1,11 +1,13 @@
+from pathlib import Path
+
 import pytest
 
 from datajudge.utils.commons import BASE_BUFFER_READER
 
 
 def test_fetch_data(reader, data_path_csv):
-    with pytest.raises(NotImplementedError):
-        reader.fetch_data(data_path_csv)
+    buffer = reader.fetch_data(data_path_csv)
+    assert buffer.read() == Path(data_path_csv).read_bytes()
 
 
 @pytest.fixture
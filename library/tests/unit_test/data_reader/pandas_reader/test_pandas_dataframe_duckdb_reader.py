@@ -1,6 +1,7 @@
 import pandas as pd
 import pytest
 
+from datajudge.plugins.utils.sql_checks import COUNT_COLUMN
 from datajudge.utils.commons import PANDAS_DATAFRAME_DUCKDB_READER
 from datajudge.utils.exceptions import StoreError
 
@@ -12,6 +13,17 @@ def test_fetch_data(reader, tmpduckdb):
         reader._read_df_from_db(tmpduckdb, "select not_existing from test")
 
 
+def test_fetch_rows(reader, tmpduckdb):
+    total = len(reader.fetch_data(tmpduckdb, "select * from test"))
+    count, df = reader.fetch_rows(tmpduckdb, "select * from test", 1)
+    assert count == total
+    assert len(df) == 1
+    assert COUNT_COLUMN not in df.columns
+    count, df = reader.fetch_rows(tmpduckdb, "select * from test where false", 1)
+    assert count == 0
+    assert df.empty
+
+
 @pytest.fixture
 def store_cfg(local_store_cfg):
     return local_store_cfg
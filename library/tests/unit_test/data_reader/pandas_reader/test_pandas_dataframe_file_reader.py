@@ -1,7 +1,13 @@
+import os
+
+import numpy as np
 import pandas as pd
 import pytest
 
+from datajudge.data_reader.utils import build_reader
+from datajudge.run.data_cache import DataCache
 from datajudge.utils.commons import PANDAS_DATAFRAME_FILE_READER
+from datajudge.utils.io_utils import open_ranged
 
 
 def test_fetch_data(reader, data_path_csv):
@@ -9,6 +15,147 @@ def test_fetch_data(reader, data_path_csv):
     assert isinstance(data, pd.DataFrame)
 
 
+def test_fetch_data_multiple(reader, data_path_csv, data_path_parquet):
+    single = reader.fetch_data(data_path_csv)
+    data = reader.fetch_data([data_path_csv, data_path_parquet, data_path_csv])
+    assert isinstance(data, pd.DataFrame)
+    assert len(data) == 3 * len(single)
+
+
+def test_fetch_data_in_memory(
+    reader, data_path_csv, data_path_parquet, tmp_path, monkeypatch
+):
+    data = reader.fetch_data([data_path_csv, data_path_parquet])
+    monkeypatch.setattr(reader.store, "fetch_in_memory", True)
+    monkeypatch.setattr(reader.store, "get_size", os.path.getsize)
+    monkeypatch.setattr(reader.store, "fetch_file", None)
+    buffered = reader.fetch_data([data_path_csv, data_path_parquet])
+    assert buffered.equals(data)
+
+    # Unsupported formats are not parsed as CSV
+    path_json = tmp_path / "test.json"
+    path_json.write_text('[{"col1": 1}]')
+    with pytest.raises(ValueError):
+        reader.fetch_data(str(path_json))
+
+
+def test_fetch_data_ranged(reader, data_path_csv, tmp_path, monkeypatch):
+    df = pd.DataFrame({"id": range(100000), "group": ["a", "b"] * 50000})
+    path_parquet = str(tmp_path / "ranged.parquet")
+    df.to_parquet(path_parquet, row_group_size=10000)
+    data = reader.fetch_data([data_path_csv, path_parquet])
+    requested = []
+
+    def open_file(src):
+        content = open(src, "rb").read()
+
+        def fetch_range(start, length):
+            requested.append(length)
+            return content[start : start + length]
+
+        return open_ranged(fetch_range, len(content), 1024)
+
+    monkeypatch.setattr(reader.store, "open_file", open_file)
+    monkeypatch.setattr(reader.store, "fetch_file", None)
+    ranged = reader.fetch_data([data_path_csv, path_parquet])
+    assert ranged.equals(data)
+
+    # Only the sampled row groups and the footer are requested
+    requested.clear()
+    sample = {"strategy": "row_groups", "step": 5}
+    data, _ = reader.fetch_sample(path_parquet, sample)
+    assert data["id"].tolist() == list(range(10000)) + list(range(50000, 60000))
+    assert sum(requested) < os.path.getsize(path_parquet) / 2
+
+
+def test_fetch_batches(reader, data_path_csv, data_path_parquet):
+    single = reader.fetch_data(data_path_csv)
+    batch_size = len(single) // 3 + 1
+    batches = list(reader.fetch_batches([data_path_csv, data_path_parquet], batch_size))
+    assert all(isinstance(b, pd.DataFrame) for b in batches)
+    assert all(len(b) <= batch_size for b in batches)
+    assert sum(len(b) for b in batches) == 2 * len(single)
+    data = pd.concat(batches[: len(batches) // 2])
+    assert data.reset_index(drop=True).equals(single)
+
+
+def test_fetch_data_partitioned(reader, data_path_csv, tmp_path):
+    path = tmp_path / "date=2026-10-17" / "region=x" / "file.csv"
+    path.parent.mkdir(parents=True)
+    path.write_bytes(open(data_path_csv, "rb").read())
+    # Partitions are added only if the resource is partitioned
+    assert "date" not in reader.fetch_data(str(path))
+    reader = build_reader(PANDAS_DATAFRAME_FILE_READER, reader.store, partitioned=True)
+    data = reader.fetch_data(str(path))
+    assert (data["date"] == "2026-10-17").all()
+    assert (data["region"] == "x").all()
+    batches = list(reader.fetch_batches(str(path), 10))
+    assert all((b["date"] == "2026-10-17").all() for b in batches)
+
+
+def test_fetch_sample(reader, tmp_path):
+    df = pd.DataFrame({"id": range(1000), "group": ["a", "b"] * 500})
+    path_csv = str(tmp_path / "sample.csv")
+    path_parquet = str(tmp_path / "sample.parquet")
+    df.to_csv(path_csv, index=False)
+    df.to_parquet(path_parquet, row_group_size=100)
+
+    sample = {"strategy": "head", "size": 10, "batchSize": 100}
+    data, desc = reader.fetch_sample(path_csv, sample)
+    assert data["id"].tolist() == list(range(10))
+    assert desc["readRows"] == 100
+
+    sample = {"strategy": "random", "size": 10, "batchSize": 100, "seed": 1}
+    data, desc = reader.fetch_sample(path_csv, sample)
+    assert len(data) == 10
+    assert desc["readRows"] == 1000
+
+    # Only one every 4 row groups is read
+    sample = {"strategy": "row_groups", "step": 4}
+    data, desc = reader.fetch_sample(path_parquet, sample)
+    assert desc["rows"] == desc["readRows"] == 300
+    assert data["id"].iloc[100] == 400
+
+
+def test_fetch_data_cached(store, data_path_csv):
+    cache = DataCache()
+    reader = build_reader(PANDAS_DATAFRAME_FILE_READER, store, cache=cache)
+    data_1 = reader.fetch_data(data_path_csv)
+    data_2 = reader.fetch_data(data_path_csv)
+    assert len(cache) == 1
+    assert cache.hits == 1
+    assert data_1 is not data_2
+    assert data_1.equals(data_2)
+    assert cache.size == reader.get_size(data_1)
+
+    # Plugins that may modify data get a copy
+    data_1.iloc[0, 0] = None
+    assert reader.fetch_data(data_path_csv).equals(data_2)
+
+    # Read-only plugins share the cached memory
+    viewer = build_reader(
+        PANDAS_DATAFRAME_FILE_READER, store, cache=cache, read_only=True
+    )
+    view_1 = viewer.fetch_data(data_path_csv)
+    view_2 = viewer.fetch_data(data_path_csv)
+    assert np.shares_memory(view_1.iloc[:, 0].values, view_2.iloc[:, 0].values)
+
+
+def test_share_data(store, data_path_csv, tmp_path):
+    path = str(tmp_path / "test.arrow")
+    reader = build_reader(PANDAS_DATAFRAME_FILE_READER, store)
+    data = reader.fetch_data(data_path_csv)
+    reader.share_data(data_path_csv, path)
+    assert reader.shared == {data_path_csv: path}
+
+    # Another reader uses the file without writing it again
+    other = build_reader(PANDAS_DATAFRAME_FILE_READER, store)
+    other.share_data(data_path_csv, path, write=False)
+    shared = other.fetch_data(data_path_csv)
+    assert isinstance(shared, pd.DataFrame)
+    assert shared.equals(data)
+
+
 @pytest.fixture
 def store_cfg(local_store_cfg):
     return local_store_cfg
@@ -13,6 +13,18 @@ class TestPandasDataFrameSQLReader:
         with pytest.raises(StoreError):
             reader.fetch_data(sqlitedb, "select not_existing from test")
 
+    def test_fetch_rows(self, reader, sqlitedb):
+        data = reader.fetch_data(sqlitedb, "select * from test")
+        count, df = reader.fetch_rows(sqlitedb, "select * from test;", 1)
+        assert count == len(data)
+        assert list(df.columns) == list(data.columns)
+        assert len(df) == 1
+        count, df = reader.fetch_rows(sqlitedb, "select * from test where 0", 1)
+        assert count == 0
+        assert df.empty
+        with pytest.raises(StoreError):
+            reader.fetch_rows(sqlitedb, "select not_existing from test", 1)
+
     def test_get_engine(self, reader, sqlitedb):
         engine = reader._get_engine(sqlitedb)
         assert isinstance(engine, Engine)
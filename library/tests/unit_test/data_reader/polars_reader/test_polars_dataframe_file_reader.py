@@ -1,7 +1,10 @@
+import os
+
 import polars as pl
 import pytest
 
 from datajudge.utils.commons import POLARS_DATAFRAME_FILE_READER
+from datajudge.utils.io_utils import open_ranged
 
 
 def test_fetch_data(reader, data_path_csv):
@@ -9,6 +12,73 @@ def test_fetch_data(reader, data_path_csv):
     assert isinstance(data, pl.DataFrame)
 
 
+def test_fetch_data_multiple(reader, data_path_csv):
+    single = reader.fetch_data(data_path_csv)
+    data = reader.fetch_data([data_path_csv, data_path_csv])
+    assert isinstance(data, pl.DataFrame)
+    assert data.shape[0] == 2 * single.shape[0]
+
+
+def test_fetch_data_in_memory(reader, data_path_csv, data_path_parquet, monkeypatch):
+    data = reader.fetch_data([data_path_csv, data_path_parquet])
+    monkeypatch.setattr(reader.store, "fetch_in_memory", True)
+    monkeypatch.setattr(reader.store, "get_size", os.path.getsize)
+    monkeypatch.setattr(reader.store, "fetch_file", None)
+    buffered = reader.fetch_data([data_path_csv, data_path_parquet])
+    assert buffered.frame_equal(data)
+
+    batch_size = data.shape[0] // 5 + 1
+    batches = list(reader.fetch_batches([data_path_csv, data_path_parquet], batch_size))
+    assert all(b.shape[0] <= batch_size for b in batches)
+    assert pl.concat(batches).frame_equal(data)
+
+
+def test_fetch_data_ranged(reader, data_path_csv, data_path_parquet, monkeypatch):
+    data = reader.fetch_data([data_path_csv, data_path_parquet])
+
+    def open_file(src):
+        content = open(src, "rb").read()
+        fetch_range = lambda start, length: content[start : start + length]
+        return open_ranged(fetch_range, len(content), 1024)
+
+    monkeypatch.setattr(reader.store, "open_file", open_file)
+    monkeypatch.setattr(reader.store, "fetch_file", None)
+    ranged = reader.fetch_data([data_path_csv, data_path_parquet])
+    assert ranged.frame_equal(data)
+
+
+def test_fetch_batches(reader, data_path_csv, data_path_parquet):
+    single = reader.fetch_data(data_path_csv)
+    batch_size = single.shape[0] // 3 + 1
+    batches = list(reader.fetch_batches([data_path_csv, data_path_parquet], batch_size))
+    assert all(isinstance(b, pl.DataFrame) for b in batches)
+    assert sum(b.shape[0] for b in batches) == 2 * single.shape[0]
+
+
+def test_fetch_sample(reader, tmp_path):
+    df = pl.DataFrame({"id": range(1000), "group": ["a"] * 990 + ["b"] * 10})
+    path = str(tmp_path / "sample.parquet")
+    df.write_parquet(path, row_group_size=100)
+
+    sample = {"strategy": "stratified", "column": "group", "size": 20}
+    data, desc = reader.fetch_sample(path, {**sample, "batchSize": 100})
+    assert isinstance(data, pl.DataFrame)
+    assert data.filter(pl.col("group") == "b").shape[0] == 10
+    assert desc["rows"] == 30
+
+    data, desc = reader.fetch_sample(path, {"strategy": "row_groups", "step": 5})
+    assert desc["rows"] == 200
+
+
+def test_share_data(reader, data_path_csv, tmp_path):
+    path = str(tmp_path / "test.arrow")
+    data = reader.fetch_data(data_path_csv)
+    reader.share_data(data_path_csv, path)
+    shared = reader.fetch_data(data_path_csv)
+    assert isinstance(shared, pl.DataFrame)
+    assert shared.frame_equal(data)
+
+
 @pytest.fixture
 def store_cfg(local_store_cfg):
     return local_store_cfg
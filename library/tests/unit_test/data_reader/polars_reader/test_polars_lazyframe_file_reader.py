@@ -0,0 +1,47 @@
+import polars as pl
+import pytest
+
+from datajudge.utils.commons import POLARS_LAZYFRAME_FILE_READER
+
+
+def test_fetch_data(reader, data_path_csv):
+    data = reader.fetch_data(data_path_csv)
+    assert isinstance(data, pl.LazyFrame)
+    assert data.columns == ["col1", "col2", "col3", "col4"]
+
+
+def test_fetch_data_parquet(reader, data_path_parquet):
+    data = reader.fetch_data(data_path_parquet)
+    assert isinstance(data, pl.LazyFrame)
+
+
+def test_fetch_data_multiple(reader, data_path_csv):
+    single = reader.fetch_data(data_path_csv).collect()
+    data = reader.fetch_data([data_path_csv, data_path_csv])
+    assert isinstance(data, pl.LazyFrame)
+    assert data.collect().shape[0] == 2 * single.shape[0]
+
+
+def test_collect(reader, data_path_csv):
+    data = reader.fetch_data(data_path_csv)
+    df = reader.collect(data, columns=["col1"])
+    assert isinstance(df, pl.DataFrame)
+    assert df.columns == ["col1"]
+    df = reader.collect(data, predicate=pl.col("col3") < 0)
+    assert df.shape[0] == 0
+
+
+def test_return_length(reader, data_path_csv):
+    data = reader.fetch_data(data_path_csv)
+    assert reader.return_length(data) == data.collect().shape[0]
+    assert isinstance(reader.return_head(data), dict)
+
+
+@pytest.fixture
+def store_cfg(local_store_cfg):
+    return local_store_cfg
+
+
+@pytest.fixture
+def data_reader():
+    return POLARS_LAZYFRAME_FILE_READER
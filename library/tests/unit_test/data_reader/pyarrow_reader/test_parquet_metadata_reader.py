@@ -0,0 +1,63 @@
+from pathlib import Path
+
+import pyarrow.parquet as pq
+import pytest
+
+from datajudge.utils.commons import PARQUET_METADATA_READER
+
+
+def test_fetch_data(reader, data_path_parquet):
+    table = pq.read_table(data_path_parquet)
+    data = reader.fetch_data(data_path_parquet)
+    assert data["rows"] == table.num_rows
+    assert [f["name"] for f in data["fields"]] == table.column_names
+    for field in data["fields"]:
+        column = table.column(field["name"]).drop_null()
+        if field["min"] is not None:
+            assert field["min"] == min(column.to_pylist())
+            assert field["max"] == max(column.to_pylist())
+
+
+def test_fetch_data_multiple(reader, data_path_parquet):
+    single = reader.fetch_data(data_path_parquet)
+    data = reader.fetch_data([data_path_parquet, data_path_parquet])
+    assert data["rows"] == 2 * single["rows"]
+    for field, other in zip(data["fields"], single["fields"]):
+        assert field["min"] == other["min"]
+        if field["nullCount"] is not None:
+            assert field["nullCount"] == 2 * other["nullCount"]
+
+
+@pytest.mark.parametrize("footer_size", [16, 1024**2])
+def test_fetch_footer(reader, data_path_parquet, monkeypatch, footer_size):
+    content = Path(data_path_parquet).read_bytes()
+    monkeypatch.setattr(
+        "datajudge.data_reader.pyarrow_reader.parquet_metadata_reader."
+        "DEFAULT_FOOTER_SIZE",
+        footer_size,
+    )
+    monkeypatch.setattr(
+        reader.store, "fetch_tail", lambda src, length: content[-length:]
+    )
+    monkeypatch.setattr(reader.store, "fetch_file", None)
+    data = reader.fetch_data(data_path_parquet)
+    assert data["rows"] == pq.read_metadata(data_path_parquet).num_rows
+
+
+def test_fetch_footer_not_parquet(reader, data_path_csv, monkeypatch):
+    content = Path(data_path_csv).read_bytes()
+    monkeypatch.setattr(
+        reader.store, "fetch_tail", lambda src, length: content[-length:]
+    )
+    with pytest.raises(ValueError):
+        reader.fetch_data(data_path_csv)
+
+
+@pytest.fixture
+def store_cfg(local_store_cfg):
+    return local_store_cfg
+
+
+@pytest.fixture
+def data_reader():
+    return PARQUET_METADATA_READER
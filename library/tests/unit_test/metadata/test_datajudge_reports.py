@@ -14,9 +14,14 @@ class TestDatajudgeReports:
             "duration": 1.0,
             "stats": {},
             "fields": {},
+            "sample": None,
         }
         assert data.to_dict() == expected_data
 
+        sample = {"strategy": "head", "size": 10, "rows": 10, "readRows": 10}
+        data = DatajudgeProfile("test", "test", 1.0, {}, {}, sample)
+        assert data.to_dict()["sample"] == sample
+
     def test_report(self):
         data = DatajudgeReport("test", "test", 1.0, {}, True, {})
         expected_data = {
@@ -36,5 +41,6 @@ class TestDatajudgeReports:
             "lib_version": "test",
             "duration": 1.0,
             "fields": [],
+            "sample": None,
         }
         assert data.to_dict() == expected_data
@@ -82,6 +82,21 @@ class TestInferenceBuilderFrictionless:
         plugins = plugin_builder.build(*plugin_builder_non_val_args)
         correct_plugin_build(plugins, InferencePluginFrictionless)
 
+    def test_build_sample(self, store, resource):
+        sample = {"strategy": "head", "size": 10}
+        builder = InferenceBuilderFrictionless([store], {"sample": sample})
+        plugin = builder.build([resource])[0]
+        result = plugin.infer()
+        correct_execute(result)
+        assert [f.name for f in result.artifact.fields] == [
+            "col1",
+            "col2",
+            "col3",
+            "col4",
+        ]
+        output = plugin.render_datajudge(result)
+        assert output.artifact.sample["rows"] == 1
+
 
 @pytest.fixture
 def plugin():
@@ -0,0 +1,133 @@
+import json
+
+import pyarrow as pa
+import pytest
+
+from datajudge.plugins.inference.pyarrow_inference import (
+    InferenceBuilderPyArrow,
+    InferencePluginPyArrow,
+)
+from datajudge.utils.commons import (
+    LIBRARY_PYARROW,
+    OPERATION_INFERENCE,
+    PARQUET_METADATA_READER,
+)
+from datajudge.utils.config import DataResource
+from tests.unit_test.plugins.utils_plugin_tests import (
+    correct_execute,
+    correct_plugin_build,
+    correct_setup,
+    correct_render_artifact,
+    correct_render_datajudge,
+    incorrect_execute,
+    incorrect_render_artifact,
+    incorrect_render_datajudge,
+)
+
+
+class TestInferencePluginPyArrow:
+    def test_setup(self, plugin):
+        plg = plugin()
+        plg.setup("test", "test", "test")
+        correct_setup(plg)
+
+    def test_infer(self, setted_plugin):
+        # Correct execution
+        output = setted_plugin.infer()
+        correct_execute(output)
+        assert output.artifact["rows"] > 0
+        assert output.artifact["fields"]
+        json.dumps(output.artifact)
+
+        # Error execution
+        setted_plugin.data_reader = "error"
+        output = setted_plugin.infer()
+        incorrect_execute(output)
+
+    def test_render_datajudge(self, setted_plugin):
+        # Correct execution
+        result = setted_plugin.infer()
+        output = setted_plugin.render_datajudge(result)
+        correct_render_datajudge(output, OPERATION_INFERENCE)
+
+        # Error execution
+        setted_plugin.data_reader = "error"
+        result = setted_plugin.infer()
+        output = setted_plugin.render_datajudge(result)
+        incorrect_render_datajudge(output, OPERATION_INFERENCE)
+
+    def test_render_artifact_method(self, setted_plugin):
+        # Correct execution
+        result = setted_plugin.infer()
+        output = setted_plugin.render_artifact(result)
+        filename = setted_plugin._fn_schema.format(f"{LIBRARY_PYARROW}.json")
+        correct_render_artifact(output)
+        assert isinstance(output.artifact[0].object, dict)
+        assert output.artifact[0].filename == filename
+
+        # Error execution
+        setted_plugin.data_reader = "error"
+        result = setted_plugin.infer()
+        output = setted_plugin.render_artifact(result)
+        incorrect_render_artifact(output)
+        assert output.artifact[0].filename == filename
+
+    # fmt: off
+    @pytest.mark.parametrize(
+        "arrow_type,expected",
+        [
+            (pa.int32(), "integer"),
+            (pa.float64(), "number"),
+            (pa.string(), "string"),
+            (pa.bool_(), "boolean"),
+            (pa.date32(), "date"),
+            (pa.timestamp("ms"), "datetime"),
+            (pa.list_(pa.int8()), "array"),
+            (pa.binary(), "any"),
+        ],
+    )
+    # fmt: on
+    def test_get_type(self, plugin, arrow_type, expected):
+        assert plugin._get_type(arrow_type) == expected
+
+    def test_get_lib_name(self, plugin):
+        assert plugin().get_lib_name() == pa.__name__
+
+    def test_get_lib_version(self, plugin):
+        assert plugin().get_lib_version() == pa.__version__
+
+
+class TestInferenceBuilderPyArrow:
+    def test_build(self, plugin_builder, plugin_builder_non_val_args):
+        plugins = plugin_builder.build(*plugin_builder_non_val_args)
+        correct_plugin_build(plugins, InferencePluginPyArrow)
+
+
+@pytest.fixture
+def plugin():
+    return InferencePluginPyArrow
+
+
+@pytest.fixture
+def plugin_builder(config_plugin_builder):
+    return InferenceBuilderPyArrow(**config_plugin_builder)
+
+
+@pytest.fixture
+def config_plugin(reader, resource):
+    return [reader, resource, {}]
+
+
+@pytest.fixture
+def store_cfg(local_store_cfg):
+    return local_store_cfg
+
+
+@pytest.fixture
+def resource(data_path_parquet):
+    return DataResource(path=data_path_parquet, name="res_test_01", store="local")
+
+
+@pytest.fixture
+def data_reader():
+    return PARQUET_METADATA_READER
@@ -1,9 +1,14 @@
+from io import BytesIO
+
 import pytest
 from frictionless import Detector
 
 from datajudge.utils.config import ConstraintFrictionless
 from datajudge.plugins.utils.frictionless_utils import (
+    DESCRIPTION_CACHE,
+    DescriptionCache,
     frictionless_schema_converter,
+    describe_buffer,
     describe_resource,
 )
 
@@ -110,3 +115,84 @@ def test_describe_resource_non_empty_dict(tmp_file):
 def test_describe_resource_raises_exception_for_invalid_path():
     with pytest.raises(Exception):
         describe_resource("invalid_path")
+
+
+def test_describe_resource_cached(tmp_file, monkeypatch):
+    result = describe_resource(tmp_file)
+    key = DescriptionCache.get_key(tmp_file)
+    assert DESCRIPTION_CACHE.get(key) == result
+
+    # Cached description is returned without detection
+    monkeypatch.setattr(
+        "datajudge.plugins.utils.frictionless_utils.Resource.describe", None
+    )
+    assert describe_resource(tmp_file) == result
+
+
+def test_describe_resource_binary(tmp_path):
+    path = tmp_path / "test.parquet"
+    path.write_bytes(b"test")
+    result = describe_resource(str(path))
+    assert result["format"] == "parquet"
+    assert result["path"] == str(path)
+
+
+def test_describe_buffer():
+    buffer = BytesIO(b"name;age\nJohn;30\nJane;25\n")
+    result = describe_buffer(buffer)
+    assert result["format"] == "csv"
+    assert result["dialect"]["delimiter"] == ";"
+    assert result["path"] is buffer
+    assert buffer.tell() == 0
+
+    buffer = BytesIO(b"PAR1test")
+    assert describe_buffer(buffer)["format"] == "parquet"
+    assert buffer.tell() == 0
+
+    # Text buffers are described by the extension of their source
+    buffer = BytesIO(b"name;age\nJohn;30\n")
+    assert describe_buffer(buffer, "s3://bucket/data.tsv")["format"] == "csv"
+    buffer = BytesIO(b'[{"name": "John", "age": 30}]')
+    result = describe_buffer(buffer, "https://host/data.json?version=1")
+    assert result["format"] == "json"
+    assert result["path"] is buffer
+
+
+def test_description_cache(tmp_file, tmp_path):
+    index = str(tmp_path / "index")
+    cache = DescriptionCache(index)
+    key = cache.get_key(tmp_file)
+    cache.add(key, {"format": "csv"})
+    assert cache.get(key) == {"format": "csv"}
+
+    # Descriptions are reloaded from the index
+    assert DescriptionCache(index).get(key) == {"format": "csv"}
+
+    # Every process writes its own entries
+    other = DescriptionCache(index)
+    other.add("other", {"format": "parquet"})
+    assert cache.get("other") == {"format": "parquet"}
+    assert DescriptionCache(index).get(key) == {"format": "csv"}
+
+    # A modified file has a different fingerprint
+    with open(tmp_file, "a") as file:
+        file.write("Carl,40\n")
+    assert cache.get_key(tmp_file) != key
+    assert cache.get_key("invalid_path") is None
+
+    # Persisted descriptions survive the cleanup of the memory cache
+    cache.clean_all()
+    assert cache.get(key) == {"format": "csv"}
+    assert DescriptionCache().get(key) is None
+
+
+def test_description_cache_bounded(tmp_path):
+    cache = DescriptionCache(str(tmp_path), max_entries=2, max_index_size=60)
+    for key in ("a", "b", "c"):
+        cache.add(key, {"format": "csv", "key": key})
+    assert len(cache) == 2
+    assert len(list(cache.index._iter_files())) == 2
+
+    # Least recently used descriptions are evicted first
+    assert cache.get("a") is None
+    assert cache.get("c") == {"format": "csv", "key": "c"}
@@ -1,10 +1,16 @@
+import pytest
+
 from datajudge.plugins.utils.sql_checks import (
+    build_fused_query,
     evaluate_empty,
     evaluate_exact,
     evaluate_max,
     evaluate_min,
     evaluate_range,
     evaluate_validity,
+    parse_simple_query,
+    wrap_count_query,
+    wrap_counted_query,
 )
 
 from datajudge.utils.commons import (
@@ -94,3 +100,50 @@ def test_evaluate_range_invalid_input():
     assert evaluate_range(-7, "[2, 10)") == (False, "Expected value between [2, 10).")
     assert evaluate_range(13, "[5, 12]") == (False, "Expected value between [5, 12].")
     assert evaluate_range("bad input", "(0, 1)") == (False, "Invalid range format.")
+
+
+# fmt: off
+@pytest.mark.parametrize(
+    "query,parsed",
+    [
+        ("select count(*) from test", {"expr": "count(*)", "table": "test", "where": None}),
+        ("SELECT max(col3) FROM test WHERE col1 = 'a';", {"expr": "max(col3)", "table": "test", "where": "col1 = 'a'"}),
+        ("select round(avg(col2), 2) from test", {"expr": "round(avg(col2), 2)", "table": "test", "where": None}),
+        ("select col1 from test", None),
+        ("select lower(col1) from test", None),
+        ("select max(col2) + col2 from test", None),
+        ("select round(avg(col2), 2) from test where col1 = 'a'", None),
+        ("select count(*), max(col2) from test", None),
+        ("select max(col2) from test group by col1", None),
+        ("select count(*) from test join other on test.a = other.a", None),
+        ("select sum(col2) + max(col2) from test where col1 = 'a'", None),
+    ],
+)
+# fmt: on
+def test_parse_simple_query(query, parsed):
+    assert parse_simple_query(query) == parsed
+
+
+def test_build_fused_query():
+    parsed = [
+        {"expr": "count(*)", "where": None},
+        {"expr": "count(*)", "where": "col1 is null"},
+    ]
+    query = build_fused_query("test", parsed)
+    assert query == (
+        'SELECT count(*) AS "c0", '
+        'count(*) FILTER (WHERE col1 is null) AS "c1" FROM test;'
+    )
+
+
+def test_wrap_count_query():
+    query = wrap_count_query("select * from test; ")
+    assert query == "SELECT COUNT(*) FROM (select * from test) dj_q"
+
+
+def test_wrap_counted_query():
+    query = wrap_counted_query("select * from test; ", 10)
+    assert query == (
+        'SELECT dj_q.*, COUNT(*) OVER () AS "_dj_count" '
+        "FROM (select * from test) dj_q LIMIT 10"
+    )
@@ -2,19 +2,25 @@ import shutil
 from pathlib import Path
 
 import duckdb
+import pandas as pd
+import pyarrow as pa
 import pytest
 
 from datajudge.plugins.utils.plugin_utils import ValidationReport
 from datajudge.plugins.validation.duckdb_validation import (
     ValidationBuilderDuckDB,
     ValidationPluginDuckDB,
+    ValidationPluginDuckDBFused,
 )
 from datajudge.utils.commons import (
     LIBRARY_DUCKDB,
     OPERATION_VALIDATION,
     PANDAS_DATAFRAME_DUCKDB_READER,
     DEFAULT_DIRECTORY,
+    RESULT_DATAJUDGE,
+    RESULT_WRAPPED,
 )
+from datajudge.utils.config import ConstraintDuckDB
 from tests.conftest import (
     CONST_DUCKDB_01,
     mock_c_duckdb,
@@ -40,12 +46,16 @@ class TestValidationPluginDuckDB:
         plg = plugin()
         plg.setup("test", "test", "test", "test", "test")
         correct_setup(plg)
+        # The database is local to the client
+        assert plg.exec_multiprocess
+        assert not plg.exec_distributed
 
     def test_validate(self, setted_plugin):
         # Correct execution
         output = setted_plugin.validate()
         correct_execute(output)
         assert isinstance(output.artifact, ValidationReport)
+        assert output.artifact.valid
 
         # Error execution
         setted_plugin.data_reader = "error"
@@ -87,12 +97,138 @@ class TestValidationPluginDuckDB:
         assert plugin().get_lib_version() == duckdb.__version__
 
 
+class TestValidationPluginDuckDBFused:
+    def test_execute(self, reader, tmpduckdb, error_report):
+        consts = [CONST_DUCKDB_VALUE_01, CONST_DUCKDB_VALUE_02]
+        query = 'SELECT count(*) AS "c0", max(col3) AS "c1" FROM test;'
+        plg = ValidationPluginDuckDBFused()
+        plg.setup(reader, tmpduckdb, consts, query, error_report, {})
+        output = plg.execute()
+        assert len(output[RESULT_DATAJUDGE]) == 2
+        for res, const in zip(output[RESULT_DATAJUDGE], consts):
+            correct_render_datajudge(res, OPERATION_VALIDATION)
+            assert res.artifact.constraint["name"] == const.name
+            assert res.artifact.valid
+        for res in output[RESULT_WRAPPED]:
+            correct_execute(res)
+            assert isinstance(res.artifact, ValidationReport)
+
+    def test_execute_fallback(self, reader, tmpduckdb, error_report):
+        consts = [CONST_DUCKDB_VALUE_01, CONST_DUCKDB_VALUE_02]
+        query = "SELECT not_existing FROM test;"
+        plg = ValidationPluginDuckDBFused()
+        plg.setup(reader, tmpduckdb, consts, query, error_report, {})
+        output = plg.execute()
+        for res in output[RESULT_DATAJUDGE]:
+            assert res.artifact.valid
+
+
 class TestValidationBuilderDuckDB:
     def test_build(self, plugin_builder, plugin_builder_val_args):
         plugins = plugin_builder.build(*plugin_builder_val_args)
         correct_plugin_build(plugins, ValidationPluginDuckDB)
         shutil.rmtree(Path(DEFAULT_DIRECTORY).parent)
 
+    def test_register_resources(self, plugin_builder, resource):
+        plugin_builder._setup_connection()
+        plugin_builder._register_resources(resource)
+        res = plugin_builder.con.execute(
+            "SELECT table_type FROM information_schema.tables "
+            f"WHERE table_name = '{resource.name}';"
+        ).fetchall()
+        assert res == [("VIEW",)]
+        count = plugin_builder.con.execute(f"SELECT COUNT(*) FROM {resource.name}")
+        assert count.fetchone()[0] > 0
+        plugin_builder._tear_down_connection()
+        plugin_builder.destroy()
+
+    def test_register_resources_materialize(self, plugin_builder, resource):
+        plugin_builder.exec_args = {"materialize": True}
+        plugin_builder._setup_connection()
+        plugin_builder._register_resources(resource)
+        res = plugin_builder.con.execute(
+            "SELECT table_type FROM information_schema.tables "
+            f"WHERE table_name = '{resource.name}';"
+        ).fetchall()
+        assert res == [("BASE TABLE",)]
+        plugin_builder._tear_down_connection()
+        plugin_builder.destroy()
+
+    def test_register_resources_partitioned(self, plugin_builder, resource, tmp_path):
+        path = tmp_path / "date=2026-10-17" / "part-0.csv"
+        path.parent.mkdir()
+        path.write_text("a\n1\n")
+        plugin_builder._setup_connection()
+        for name, partitions in (("plain", None), ("hive", {})):
+            res = resource.copy(update={"name": name, "path": [str(path)]})
+            res.partitions = partitions
+            plugin_builder._register_resources(res)
+        con = plugin_builder.con
+        # Partitions are exposed only if the resource is partitioned
+        assert [c[0] for c in con.execute("DESCRIBE plain").fetchall()] == ["a"]
+        assert [c[0] for c in con.execute("DESCRIBE hive").fetchall()] == ["a", "date"]
+        plugin_builder._tear_down_connection()
+        plugin_builder.destroy()
+
+    def test_insert_batches(self, plugin_builder, resource):
+        store = plugin_builder._get_resource_store(resource)
+        data_reader = plugin_builder._get_reader(store)
+        batches = [
+            pd.DataFrame({"a": [1, 2], "b": [None, None]}),
+            pd.DataFrame({"a": [2.5, 3.7], "b": ["x", None]}),
+            pd.DataFrame({"a": [4, None], "b": [None, None]}),
+        ]
+        batches = [data_reader.from_arrow(pa.Table.from_pandas(b)) for b in batches]
+        plugin_builder._setup_connection()
+        plugin_builder._insert_batches("test", data_reader, iter(batches))
+        con = plugin_builder.con
+        # Columns are promoted to hold the values of every batch
+        res = con.execute("SELECT a, b FROM test").fetchall()
+        assert res == [
+            (1.0, None),
+            (2.0, None),
+            (2.5, "x"),
+            (3.7, None),
+            (4.0, None),
+            (None, None),
+        ]
+        types = [c[1] for c in con.execute("DESCRIBE test").fetchall()]
+        assert types == ["DOUBLE", "VARCHAR"]
+        plugin_builder._tear_down_connection()
+        plugin_builder.destroy()
+
+    def test_plan_queries(self, plugin_builder):
+        consts = [CONST_DUCKDB_01, CONST_DUCKDB_VALUE_01, CONST_DUCKDB_VALUE_02]
+        fused, single = plugin_builder._plan_queries(consts)
+        assert single == [CONST_DUCKDB_01]
+        assert len(fused) == 1
+        assert fused[0][0] == [CONST_DUCKDB_VALUE_01, CONST_DUCKDB_VALUE_02]
+        assert fused[0][1] == ('SELECT count(*) AS "c0", max(col3) AS "c1" FROM test;')
+
+        # A single scalar constraint on a table is not fused
+        fused, single = plugin_builder._plan_queries(consts[:2])
+        assert fused == []
+        assert len(single) == 2
+
+        plugin_builder.exec_args = {"fuse": False}
+        fused, single = plugin_builder._plan_queries(consts)
+        assert fused == []
+        assert single == consts
+
+    # fmt: off
+    @pytest.mark.parametrize(
+        "files,scan",
+        [
+            (["a.csv", "b.csv"], "read_csv_auto"),
+            (["a.parquet"], "read_parquet"),
+            (["a.csv", "b.parquet"], None),
+            (["a.xlsx"], None),
+        ]
+    )
+    # fmt: on
+    def test_get_scan_function(self, plugin_builder, files, scan):
+        assert plugin_builder._get_scan_function(files) == scan
+
     # fmt: off
     @pytest.mark.parametrize(
         "const_list,len_list",
@@ -125,6 +261,28 @@ class TestValidationBuilderDuckDB:
         assert len(plugin_builder._filter_resources(res_list, const_list)) == len_list
 
 
+CONST_DUCKDB_VALUE_01 = ConstraintDuckDB(
+    name="const-duckdb-value-01",
+    title="Test duckdb constraint",
+    resources=["res_test_01"],
+    query="select count(*) from test",
+    expect="minimum",
+    value=1,
+    check="value",
+    weight=5,
+)
+CONST_DUCKDB_VALUE_02 = ConstraintDuckDB(
+    name="const-duckdb-value-02",
+    title="Test duckdb constraint",
+    resources=["res_test_01"],
+    query="select max(col3) from test",
+    expect="minimum",
+    value=0,
+    check="value",
+    weight=5,
+)
+
+
 @pytest.fixture
 def plugin():
     return ValidationPluginDuckDB
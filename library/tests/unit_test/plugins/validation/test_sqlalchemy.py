@@ -44,6 +44,7 @@ class TestValidationPluginSqlAlchemy:
         output = setted_plugin.validate()
         correct_execute(output)
         assert isinstance(output.artifact, ValidationReport)
+        assert output.artifact.valid
 
         # Error execution
         setted_plugin.data_reader = "error"
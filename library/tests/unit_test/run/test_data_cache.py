@@ -0,0 +1,72 @@
+import pickle
+
+import pytest
+
+from datajudge.run.data_cache import DataCache
+from datajudge.utils.commons import PANDAS_DATAFRAME_FILE_READER
+
+
+class TestDataCache:
+    def test_get_or_fetch(self, cache):
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            return "data"
+
+        assert cache.get_or_fetch(("k",), fetch, len) == "data"
+        assert cache.get_or_fetch(("k",), fetch, len) == "data"
+        assert len(calls) == 1
+        assert cache.hits == 1
+        assert cache.size == 4
+
+    def test_disabled(self):
+        cache = DataCache(0)
+        cache.get_or_fetch(("k",), lambda: "data", len)
+        assert len(cache) == 0
+
+    def test_eviction(self, cache):
+        cache.add(("a",), "a", 6)
+        cache.add(("b",), "b", 4)
+        cache.get(("a",))
+        cache.add(("c",), "c", 5)
+        assert ("a",) in cache
+        assert ("b",) not in cache
+        assert ("c",) in cache
+        assert cache.size == 11
+
+    def test_object_bigger_than_budget(self, cache):
+        cache.add(("a",), "a", 100)
+        assert len(cache) == 0
+        assert cache.size == 0
+
+    def test_get_key(self, reader):
+        key = DataCache.get_key(reader, "path")
+        assert key == (type(reader).__name__, reader.store.name, "path", False)
+
+    def test_clean_all(self, cache):
+        cache.add(("a",), "a", 1)
+        cache.clean_all()
+        assert len(cache) == 0
+        assert cache.size == 0
+
+    def test_pickle(self, cache):
+        cache.add(("a",), "a", 1)
+        new = pickle.loads(pickle.dumps(cache))
+        assert new.max_size == cache.max_size
+        assert len(new) == 0
+
+
+@pytest.fixture
+def cache():
+    return DataCache(12)
+
+
+@pytest.fixture
+def store_cfg(local_store_cfg):
+    return local_store_cfg
+
+
+@pytest.fixture
+def data_reader():
+    return PANDAS_DATAFRAME_FILE_READER
@@ -0,0 +1,79 @@
+import os
+import pickle
+
+import pyarrow as pa
+import pytest
+
+from datajudge.data_reader.utils import build_reader
+from datajudge.run.data_cache import DataCache
+from datajudge.run.disk_cache import DiskCache
+from datajudge.utils.commons import PANDAS_DATAFRAME_FILE_READER
+
+
+class TestDiskCache:
+    def test_add_get(self, disk):
+        assert disk.get("a") is None
+        path = disk.add("a", pa.table({"col": [1, 2]}))
+        assert disk.get("a") == path
+        assert len(list(disk.path.iterdir())) == 1
+
+    def test_eviction(self, disk):
+        path_a = disk.add("a", pa.table({"col": [1, 2]}))
+        size = os.path.getsize(path_a)
+        disk.max_size = 2 * size
+        path_b = disk.add("b", pa.table({"col": [3, 4]}))
+        os.utime(path_a, (0, 0))
+        os.utime(path_b, (1, 1))
+        disk.get("a")
+        disk.add("c", pa.table({"col": [5, 6]}))
+        assert disk.get("a") is not None
+        assert disk.get("b") is None
+        assert disk.get("c") is not None
+
+    def test_get_key(self, reader):
+        key = DiskCache.get_key(reader, "path", ["v1"])
+        assert key == DiskCache.get_key(reader, "path", ["v1"])
+        assert key != DiskCache.get_key(reader, "path", ["v2"])
+        reader.partitioned = True
+        assert key != DiskCache.get_key(reader, "path", ["v1"])
+
+    def test_clean_all(self, disk):
+        disk.add("a", pa.table({"col": [1, 2]}))
+        disk.clean_all()
+        assert disk.get("a") is None
+
+    def test_fetch_persisted(self, store, disk, data_path_csv):
+        reader = build_reader(
+            PANDAS_DATAFRAME_FILE_READER, store, cache=DataCache(disk=disk)
+        )
+        data = reader.fetch_data(data_path_csv)
+        assert len(list(disk.path.iterdir())) == 1
+
+        # A new run reads the persisted data
+        cache = pickle.loads(pickle.dumps(DataCache(disk=disk)))
+        other = build_reader(PANDAS_DATAFRAME_FILE_READER, store, cache=cache)
+        other._fetch_df = None
+        assert other.fetch_data(data_path_csv).equals(data)
+
+        # A changed file is parsed again
+        os.utime(data_path_csv, ns=(0, 0))
+        reader = build_reader(
+            PANDAS_DATAFRAME_FILE_READER, store, cache=DataCache(disk=disk)
+        )
+        reader.fetch_data(data_path_csv)
+        assert len(list(disk.path.iterdir())) == 2
+
+
+@pytest.fixture
+def disk(tmp_path):
+    return DiskCache(str(tmp_path / "cache"))
+
+
+@pytest.fixture
+def store_cfg(local_store_cfg):
+    return local_store_cfg
+
+
+@pytest.fixture
+def data_reader():
+    return PANDAS_DATAFRAME_FILE_READER
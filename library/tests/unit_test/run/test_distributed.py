@@ -0,0 +1,53 @@
+import pytest
+
+from datajudge.run.distributed import SocketExecutor, WorkerDaemon, parse_address
+from datajudge.utils.exceptions import RunError
+
+AUTHKEY = b"test"
+
+
+def square(x):
+    return x * x
+
+
+def fail():
+    raise ValueError("test")
+
+
+def test_parse_address():
+    assert parse_address("localhost:6000") == ("localhost", 6000)
+    assert parse_address(("localhost", 6000)) == ("localhost", 6000)
+
+
+class TestSocketExecutor:
+    def test_submit(self, daemon):
+        executor = SocketExecutor([daemon.address], AUTHKEY)
+        futures = [executor.submit(square, i) for i in range(4)]
+        assert [f.result() for f in futures] == [0, 1, 4, 9]
+
+        with pytest.raises(RunError):
+            executor.submit(fail).result()
+        executor.shutdown()
+
+    def test_failover(self, daemon):
+        # First worker is not reachable
+        executor = SocketExecutor(["localhost:1", daemon.address], AUTHKEY)
+        assert executor.submit(square, 3).result() == 9
+        assert executor.submit(square, 3).result() == 9
+        executor.shutdown()
+
+    def test_no_worker(self):
+        with pytest.raises(RunError):
+            SocketExecutor([], AUTHKEY)
+        executor = SocketExecutor(["localhost:1"], AUTHKEY)
+        with pytest.raises(RunError):
+            executor.submit(square, 3).result()
+        executor.shutdown()
+
+
+@pytest.fixture
+def daemon():
+    daemon = WorkerDaemon(("localhost", 0), AUTHKEY, 2)
+    daemon.start()
+    yield daemon
+    daemon.shutdown()
@@ -3,12 +3,15 @@ from pathlib import Path
 import pytest
 
 from datajudge.client.store_handler import StoreHandler
+from datajudge.data_reader.utils import build_reader
 from datajudge.plugins.base_plugin import Plugin
 from datajudge.plugins.plugin_factory import builder_factory
 from datajudge.plugins.utils.plugin_utils import Result
+from datajudge.run.distributed import SocketExecutor, WorkerDaemon
 from datajudge.run.run_handler import RunHandler, RunHandlerRegistry
 from datajudge.utils.commons import (
     MT_DJ_REPORT,
+    PANDAS_DATAFRAME_FILE_READER,
     OPERATION_INFERENCE,
     OPERATION_PROFILING,
     OPERATION_VALIDATION,
@@ -81,6 +84,66 @@ class TestRunHandler:
         for i in ("count", "partial", "full"):
             assert handler._parse_report_arg(i) is None
 
+    @pytest.mark.parametrize("parallel", [False, True])
+    def test_scheduler(self, handler, parallel):
+        plugins = [
+            FakePlugin("seq", False, False),
+            FakePlugin("thread", True, False),
+            FakePlugin("process", False, True),
+        ]
+        handler._scheduler(plugins, OPERATION_INFERENCE, parallel, 2)
+        res = handler.get_item(OPERATION_INFERENCE, RESULT_WRAPPED)
+        assert sorted(res) == ["process", "seq", "thread"]
+        assert OPERATION_INFERENCE in handler.get_durations()
+        handler.clean_all()
+
+    def test_scheduler_distributed(self, run_empty, store_handler):
+        daemon = WorkerDaemon(("localhost", 0), b"test", 1)
+        daemon.start()
+        executor = SocketExecutor([daemon.address], b"test")
+        handler = RunHandler(run_empty, store_handler, executor=executor)
+        plugin = FakePlugin("distributed", False, True)
+        plugin.exec_distributed = True
+        handler._scheduler([plugin], OPERATION_INFERENCE, True, 2)
+        res = handler.get_item(OPERATION_INFERENCE, RESULT_WRAPPED)
+        assert res == ["distributed"]
+        executor.shutdown()
+        daemon.shutdown()
+        handler.clean_all()
+
+    def test_share_data(self, handler, store_handler, local_resource):
+        store = store_handler.get_art_store(local_resource.store)
+        plugins = []
+        for _ in range(2):
+            plugin = FakePlugin("process", False, True)
+            plugin.data_reader = build_reader(PANDAS_DATAFRAME_FILE_READER, store)
+            plugin.resource = local_resource
+            plugins.append(plugin)
+        handler._share_data(plugins)
+        assert len(handler._shared) == 1
+        path = list(handler._shared.values())[0]
+        assert Path(path).exists()
+        for plugin in plugins:
+            assert plugin.data_reader.shared == {str(local_resource.path): path}
+
+        # A single plugin reuses data already shared
+        plugin = FakePlugin("process", False, True)
+        plugin.data_reader = build_reader(PANDAS_DATAFRAME_FILE_READER, store)
+        plugin.resource = local_resource
+        handler._share_data([plugin])
+        assert plugin.data_reader.shared == {str(local_resource.path): path}
+
+        # Sampling plugins never load whole resources
+        plugin = FakePlugin("process", False, True)
+        plugin.data_reader = build_reader(PANDAS_DATAFRAME_FILE_READER, store)
+        plugin.resource = local_resource
+        plugin.exec_args = {"sample": {"strategy": "head", "size": 10}}
+        handler._share_data([plugin])
+        assert plugin.data_reader.shared == {}
+
+        handler.clean_all()
+        assert not Path(path).exists()
+
     def test_register_results(self, dict_result, handler):
         res = handler._register_results(OPERATION_INFERENCE, dict_result)
         assert res is None
@@ -182,6 +245,61 @@ class TestRunHandler:
         handler.persist_data([local_resource], tmp_path)
         assert Path(tmp_path, "test_csv_file.csv").exists()
 
+    def test_resolve_resources(self, handler, local_resource, tmp_path):
+        for day in ("2026-10-16", "2026-10-17"):
+            Path(tmp_path, f"date={day}").mkdir()
+            Path(tmp_path, f"date={day}", "part-0.csv").write_text("a\n1\n")
+        Path(tmp_path, "_SUCCESS").touch()
+
+        # Resources without partition filter are left untouched
+        assert handler._resolve_resources([local_resource]) == [local_resource]
+
+        resource = local_resource.copy(update={"path": str(tmp_path)})
+        resource.partitions = {"date": "2026-10-17"}
+        resolved = handler._resolve_resources([resource])[0]
+        assert resolved.path == [str(Path(tmp_path, "date=2026-10-17", "part-0.csv"))]
+        assert resource.path == str(tmp_path)
+
+        resource.partitions = {}
+        assert len(handler._resolve_resources([resource])[0].path) == 2
+
+        resource.partitions = {"date": "2026-10-18"}
+        with pytest.raises(RunError):
+            handler._resolve_resources([resource])
+
+    def test_resolve_resources_glob(self, handler, local_resource, tmp_path):
+        for name in ("a.csv", "b.csv", "c.parquet", "sub/d.csv"):
+            Path(tmp_path, name).parent.mkdir(exist_ok=True)
+            Path(tmp_path, name).touch()
+
+        resource = local_resource.copy(update={"path": f"{tmp_path}/*.csv"})
+        resolved = handler._resolve_resources([resource])[0]
+        assert resolved.path == [f"{tmp_path}/a.csv", f"{tmp_path}/b.csv"]
+
+        resource.path = f"{tmp_path}/**/*.csv"
+        assert len(handler._resolve_resources([resource])[0].path) == 3
+
+        resource.path = [f"{tmp_path}/", local_resource.path]
+        resolved = handler._resolve_resources([resource])[0]
+        assert resolved.path[-1] == local_resource.path
+        assert len(resolved.path) == 5
+
+        resource.path = f"{tmp_path}/*.json"
+        with pytest.raises(RunError):
+            handler._resolve_resources([resource])
+
+
+class FakePlugin:
+    def __init__(self, name, multithread, multiprocess):
+        self.name = name
+        self.exec_multithread = multithread
+        self.exec_multiprocess = multiprocess
+        self.exec_distributed = False
+        self.exec_args = {}
+
+    def execute(self):
+        return {RESULT_WRAPPED: [self.name]}
+
 
 # RunHandlerRegistry
 @pytest.fixture()
@@ -9,6 +9,7 @@ def test_to_dict(run_empty, local_resource):
         "runId": "run_id",
         "runConfig": run_empty.dict(),
         "runLibraries": None,
+        "runDurations": None,
         "runMetadataUri": None,
         "runArtifactsUri": None,
         "resources": [local_resource.dict(exclude_none=True)],
@@ -0,0 +1,47 @@
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+
+from datajudge.run.worker_pool import WorkerPool
+
+
+def square(x):
+    return x * x
+
+
+class TestWorkerPool:
+    def test_get_executor(self):
+        pool = WorkerPool()
+        executor = pool.get_executor(2)
+        assert isinstance(executor, ProcessPoolExecutor)
+        assert list(executor.map(square, [1, 2, 3])) == [1, 4, 9]
+
+        # Executor is reused if enough workers are available
+        assert pool.get_executor(1) is executor
+        assert pool.get_executor(2) is executor
+
+        # Executor is recreated if more workers are required
+        assert pool.get_executor(3) is not executor
+        pool.shutdown()
+
+    def test_max_workers(self):
+        pool = WorkerPool(max_workers=2)
+        executor = pool.get_executor(10)
+        assert pool._size == 2
+        assert pool.get_executor(10) is executor
+        pool.shutdown()
+
+    def test_start_and_shutdown(self):
+        pool = WorkerPool()
+        pool.start(2)
+        assert pool._executor is not None
+        pool.shutdown()
+        assert pool._executor is None
+        assert pool._size == 0
+
+    def test_pickle(self):
+        pool = WorkerPool(max_workers=3)
+        pool.get_executor()
+        copy = pickle.loads(pickle.dumps(pool))
+        assert copy.max_workers == 3
+        assert copy._executor is None
+        pool.shutdown()
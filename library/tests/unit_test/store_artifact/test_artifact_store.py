@@ -1,8 +1,13 @@
 import io
+import pickle
+import threading
+import time
+from pathlib import Path
 
 import pytest
 
 from datajudge.store_artifact.artifact_store import ArtifactStore, ResourceRegistry
+from datajudge.utils.utils import parallel_map
 from tests.conftest import TEST_FILENAME
 
 
@@ -23,6 +28,15 @@ class TestResourceRegistry:
         registry.clean_all()
         assert registry.registry == {}
 
+    def test_shared(self, tmp_path):
+        registry = ResourceRegistry(str(tmp_path / "registry"))
+        copy = pickle.loads(pickle.dumps(registry))
+        registry.register("resource", "path")
+        assert copy.get_resource("resource") == "path"
+        assert copy.get_resource("err") is None
+        registry.clean_all()
+        assert ResourceRegistry(registry.path).get_resource("resource") is None
+
 
 class TestArtifactStore:
     def test_get_run_artifacts_uri(self, store, temp_folder):
@@ -44,6 +58,27 @@ class TestArtifactStore:
         store.clean_paths()
         assert not store._get_resource(TEST_FILENAME)
 
+    def test_fits_in_memory(self, store, monkeypatch):
+        monkeypatch.setattr(store, "get_size", lambda src: 100)
+        assert not store.fits_in_memory("src.csv")
+        monkeypatch.setattr(store, "fetch_in_memory", True)
+        assert store.fits_in_memory("src.csv")
+        store.config = {"max_in_memory_size": 10}
+        assert not store.fits_in_memory("src.csv")
+        # Resources of unknown size are fetched as files
+        store.config = None
+        monkeypatch.setattr(store, "get_size", lambda src: None)
+        assert not store.fits_in_memory("src.csv")
+
+    def test_fetch_file_once(self, tmp_path):
+        store = DownloadingStoreSample("", "", "", str(tmp_path / "tmp"))
+        # Copies of the store, as received by pool workers
+        copies = [pickle.loads(pickle.dumps(store)) for _ in range(8)]
+        paths = parallel_map(lambda s: s.fetch_file("src.csv"), copies)
+        assert len(set(paths)) == 1
+        assert len(list(Path(store.temp_dir).glob("src-*.csv"))) == 1
+        assert store.fetch_file("src.csv") == paths[0]
+
 
 class ArtifactStoreSample(ArtifactStore):
     def persist_artifact(self, *args, **kwargs):
@@ -62,6 +97,18 @@ class ArtifactStoreSample(ArtifactStore):
         ...
 
 
+class DownloadingStoreSample(ArtifactStoreSample):
+    cache_downloads = True
+
+    def _get_and_register_artifact(self, src, fetch_mode):
+        # Every download writes a new file
+        time.sleep(0.01)
+        path = Path(self.temp_dir, f"src-{threading.get_ident()}-{time.time_ns()}.csv")
+        path.write_text("a\n1\n")
+        self._register_resource(f"{src}_{fetch_mode}", str(path))
+        return str(path)
+
+
 @pytest.fixture
 def registry():
     return ResourceRegistry()
@@ -0,0 +1,110 @@
+import os
+import pickle
+import threading
+
+import pytest
+
+from datajudge.store_artifact.download_cache import DownloadCache
+from datajudge.utils.utils import parallel_map
+
+
+class TestDownloadCache:
+    def test_fetch(self, cache, src, tmp_path):
+        calls = []
+
+        def fetch_fnc():
+            calls.append(1)
+            return src
+
+        dst = str(tmp_path / "run" / "a.csv")
+        assert cache.get("a", ".csv") is None
+        assert cache.fetch("a", ".csv", fetch_fnc, dst) == src
+        cached = cache.get("a", ".csv")
+        assert cached.endswith("a.csv")
+        assert open(cached, "rb").read() == b"a,b\n1,2\n"
+        assert cache.fetch("a", ".csv", fetch_fnc, dst) == dst
+        assert open(dst, "rb").read() == b"a,b\n1,2\n"
+        assert len(calls) == 1
+
+        # Cached files outlive the downloaded ones
+        os.remove(src)
+        assert cache.get("a", ".csv") == cached
+
+    def test_fetch_concurrent(self, cache, src, tmp_path):
+        calls = []
+        lock = threading.Lock()
+
+        def fetch_fnc():
+            with lock:
+                calls.append(1)
+            return src
+
+        dst = str(tmp_path / "a")
+        paths = parallel_map(
+            lambda _: cache.fetch("a", "", fetch_fnc, dst), list(range(8))
+        )
+        assert set(paths) <= {src, dst}
+        assert len(calls) == 1
+
+    def test_eviction(self, cache, tmp_path):
+        srcs = {}
+        for key in "abc":
+            srcs[key] = tmp_path / key
+            srcs[key].write_bytes(b"data")
+        path_a = cache.add("a", "", srcs["a"])
+        size = os.path.getsize(path_a)
+        cache.max_size = 2 * size
+        path_b = cache.add("b", "", srcs["b"])
+        os.utime(path_a, (0, 0))
+        os.utime(path_b, (1, 1))
+        cache.get("a")
+        cache.fetch("c", "", lambda: srcs["c"], str(tmp_path / "dst"))
+        assert cache.get("a") is not None
+        assert cache.get("b") is None
+        assert cache.get("c") is not None
+
+    def test_eviction_shared(self, cache, tmp_path):
+        src = tmp_path / "src"
+        src.write_bytes(b"data")
+        cache.add("a", "", str(src))
+        dst = str(tmp_path / "run" / "a")
+        path = cache.fetch("a", "", None, dst)
+        # Another process evicts the file with a cache on the same directory
+        other = DownloadCache(str(cache.path), max_size=4)
+        other.fetch("b", "", lambda: str(src), str(tmp_path / "run" / "b"))
+        assert cache.get("a", "") is None
+        assert open(path, "rb").read() == b"data"
+
+    def test_get_key(self, store):
+        key = DownloadCache.get_key(store, "path", "v1")
+        assert key == DownloadCache.get_key(store, "path", "v1")
+        assert key != DownloadCache.get_key(store, "path", "v2")
+        assert key != DownloadCache.get_key(store, "other", "v1")
+
+    def test_clean_all(self, cache, src):
+        cache.add("a", "", src)
+        cache.fetch("b", "", lambda: src, src + ".b")
+        cache.clean_all()
+        assert cache.get("a") is None
+        assert cache.get("b") is None
+
+    def test_pickle(self, cache):
+        unpickled = pickle.loads(pickle.dumps(cache))
+        assert unpickled.path == cache.path
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return DownloadCache(str(tmp_path / "cache"))
+
+
+@pytest.fixture
+def src(tmp_path):
+    path = tmp_path / "download.csv"
+    path.write_bytes(b"a,b\n1,2\n")
+    return str(path)
+
+
+@pytest.fixture
+def store_cfg(local_store_cfg):
+    return local_store_cfg
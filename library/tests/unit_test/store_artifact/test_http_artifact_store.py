@@ -1,9 +1,22 @@
+from types import SimpleNamespace
+
 import pytest
+import requests
 
 from datajudge.store_artifact.http_artifact_store import HTTPArtifactStore
 
 
 class TestHTTPArtifactStore:
+    def test_get_size(self, monkeypatch):
+        store = HTTPArtifactStore("test", "http", "http://host", "tmp")
+        headers = {"Content-Length": "1024", "ETag": '"abc"'}
+        response = SimpleNamespace(ok=True, headers=headers)
+        monkeypatch.setattr(requests, "head", lambda *args, **kwargs: response)
+        assert store.get_size("http://host/data.csv") == 1024
+        assert store.get_version("http://host/data.csv") == '"abc"'
+        response.ok = False
+        assert store.get_size("http://host/data.csv") is None
+
     def test_persist_artifact(self):
         ...
 
@@ -1,3 +1,5 @@
+from pathlib import Path
+
 import pytest
 
 from datajudge.utils.commons import (
@@ -49,16 +51,28 @@ class TestLocalArtifactStore:
     def test_fetch_native(self, store):
         assert store.fetch_native(TEST_FILENAME) == TEST_FILENAME
 
-    def test_fetch_buffer(self, store):
-        with pytest.raises(NotImplementedError):
-            store.fetch_buffer(TEST_FILENAME)
+    def test_list_files(self, store, tmp_path):
+        Path(tmp_path, "date=2026-10-17").mkdir()
+        Path(tmp_path, "date=2026-10-17", "f.csv").touch()
+        Path(tmp_path, "g.csv").touch()
+        expected = [
+            str(Path(tmp_path, "date=2026-10-17", "f.csv")),
+            str(Path(tmp_path, "g.csv")),
+        ]
+        assert store.list_files(str(tmp_path)) == expected
+        assert store.list_files(str(tmp_path), recursive=False) == expected[1:]
+        assert store.list_files(str(tmp_path / "missing")) == []
+
+    def test_fetch_buffer(self, store, temp_file):
+        buffer = store.fetch_buffer(str(temp_file))
+        assert buffer.read() == b"test"
+        assert store._get_resource(f"{temp_file}_{DATAREADER_BUFFER}") is False
 
     @pytest.mark.parametrize(
         "src,fetch_mode,expected,not_implemented",
         [
             (TEST_FILENAME, DATAREADER_FILE, TEST_FILENAME, False),
             (TEST_FILENAME, DATAREADER_NATIVE, TEST_FILENAME, False),
-            (TEST_FILENAME, DATAREADER_BUFFER, None, True),
         ],
     )
     def test_get_and_register_artifact(
@@ -78,6 +92,12 @@ class TestLocalArtifactStore:
     def test_store_data(self, store):
         assert store._store_data(TEST_FILENAME) is None
 
+    def test_get_version(self, store, temp_file):
+        version = store.get_version(temp_file)
+        assert version is not None
+        assert store.get_version(temp_file) == version
+        assert store.get_version("not_existing") is None
+
     def test_check_access_to_storage(self, store, temp_folder):
         fld = temp_folder / "fld"
         store._check_access_to_storage(fld)
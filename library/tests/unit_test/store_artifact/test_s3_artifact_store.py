@@ -1,18 +1,27 @@
+import pickle
+from io import BytesIO
 from pathlib import Path
 
 import pytest
 from botocore.exceptions import ClientError
 
+from datajudge.store_artifact.download_cache import DownloadCache
+from datajudge.store_artifact.s3_artifact_store import S3ArtifactStore
 from datajudge.utils.commons import (
     DATAREADER_BUFFER,
     DATAREADER_FILE,
     DATAREADER_NATIVE,
+    S3_MAX_POOL_CONNECTIONS,
+    S3_PART_SIZE,
 )
 from datajudge.utils.exceptions import StoreError
 from datajudge.utils.file_utils import get_path
 from datajudge.utils.uri_utils import build_key, get_name_from_uri
+from datajudge.utils.utils import parallel_map
 from tests.conftest import S3_BUCKET, S3_FILENAME, TEST_FILENAME
 
+TEST_CSV_PATH = "tests/synthetic_data/test_csv_file.csv"
+
 
 class TestS3ArtifactStore:
     def test_persist_artifact(
@@ -61,8 +70,8 @@ class TestS3ArtifactStore:
         assert "Expires=" in string
 
     def test_fetch_buffer(self, store):
-        with pytest.raises(NotImplementedError):
-            store.fetch_buffer(S3_FILENAME)
+        buffer = store.fetch_buffer(S3_FILENAME)
+        assert buffer.read() == Path(TEST_CSV_PATH).read_bytes()
 
     def test_get_and_register_artifact(self, store):
         # File
@@ -77,8 +86,8 @@ class TestS3ArtifactStore:
         assert "Expires=" in res
 
         # Buffer
-        with pytest.raises(NotImplementedError):
-            store._get_and_register_artifact(S3_FILENAME, DATAREADER_BUFFER)
+        res = store._get_and_register_artifact(S3_FILENAME, DATAREADER_BUFFER)
+        assert isinstance(res, BytesIO)
 
     def test_check_access_to_storage(self, store, client):
         assert store._check_access_to_storage(client, S3_BUCKET) is None
@@ -114,6 +123,144 @@ class TestS3ArtifactStore:
         data = store._get_data(client, S3_BUCKET, key)
         assert data == b"test"
 
+    def test_fetch_tail(self, store):
+        content = Path(TEST_CSV_PATH).read_bytes()
+        assert store.fetch_tail(S3_FILENAME, 10) == content[-10:]
+        assert store.fetch_tail(S3_FILENAME, 10**6) == content
+
+    def test_list_files(self, store, client):
+        keys = ["data/date=2026-10-16/f.csv", "data/date=2026-10-17/f.csv"]
+        for key in keys:
+            client.put_object(Bucket=S3_BUCKET, Key=key, Body=b"a\n1\n")
+        assert store.list_files("data") == keys
+        assert store.list_files("data/date=2026-10-17/") == keys[1:]
+        s3_keys = [f"s3://{S3_BUCKET}/{key}" for key in keys]
+        assert store.list_files(f"s3://{S3_BUCKET}/data") == s3_keys
+        assert store.list_files("data", recursive=False) == []
+        client.put_object(Bucket=S3_BUCKET, Key="data/f.csv", Body=b"a")
+        assert store.list_files("data", recursive=False) == ["data/f.csv"]
+
+    def test_get_version(self, store, client, bytesio):
+        key = build_key("test", TEST_FILENAME)
+        store._upload_fileobj(client, S3_BUCKET, bytesio, key, {})
+        etag = client.head_object(Bucket=S3_BUCKET, Key=key)["ETag"]
+        assert store.get_version(key) == etag
+        assert store.get_version("not_existing") is None
+
+    def test_full_uri(self, store, client):
+        uri = f"s3://{S3_BUCKET}/{S3_FILENAME}"
+        content = Path(TEST_CSV_PATH).read_bytes()
+        assert store._get_key(uri) == S3_FILENAME
+        assert Path(store.fetch_file(uri)).read_bytes() == content
+        assert store.fetch_buffer(uri).read() == content
+        assert store.fetch_tail(uri, 10) == content[-10:]
+        assert store.open_file(uri).read() == content
+        etag = client.head_object(Bucket=S3_BUCKET, Key=S3_FILENAME)["ETag"]
+        assert store.get_version(uri) == etag
+
+    def test_get_client(self, store):
+        get_client = S3ArtifactStore._get_client
+        client = get_client(store)
+        assert get_client(store) is client
+        assert client.meta.config.max_pool_connections == S3_MAX_POOL_CONNECTIONS
+        clients = parallel_map(lambda _: get_client(store), list(range(4)))
+        assert all(c is client for c in clients)
+
+    def test_check_access_once(self, store, client, monkeypatch):
+        calls = []
+        head_bucket = client.head_bucket
+
+        def _head_bucket(**kwargs):
+            calls.append(kwargs)
+            return head_bucket(**kwargs)
+
+        monkeypatch.setattr(client, "head_bucket", _head_bucket)
+        store.fetch_buffer(S3_FILENAME)
+        store.persist_artifact({"a": 1}, "artifact/test", "check.json", {})
+        assert len(calls) == 1
+
+    def test_pickle(self, store, monkeypatch):
+        monkeypatch.delattr(store, "_get_client")
+        store._checked_buckets.add(S3_BUCKET)
+        unpickled = pickle.loads(pickle.dumps(store))
+        assert unpickled._client is None
+        assert unpickled._checked_buckets == {S3_BUCKET}
+
+    def test_download_file(self, store, client, monkeypatch):
+        content = Path(TEST_CSV_PATH).read_bytes()
+        store.part_size = 7
+        filepath = store._download_file(client, S3_BUCKET, S3_FILENAME)
+        assert Path(filepath).read_bytes() == content
+
+        # Single part and empty objects
+        store.part_size = S3_PART_SIZE
+        filepath = store._download_file(client, S3_BUCKET, S3_FILENAME)
+        assert Path(filepath).read_bytes() == content
+        client.put_object(Bucket=S3_BUCKET, Key="empty.csv", Body=b"")
+        filepath = store._download_file(client, S3_BUCKET, "empty.csv")
+        assert Path(filepath).read_bytes() == b""
+
+        # Object changed during the download
+        head_object = client.head_object
+
+        def _head_object(**kwargs):
+            return {**head_object(**kwargs), "ETag": '"changed"'}
+
+        monkeypatch.setattr(client, "head_object", _head_object)
+        with pytest.raises(StoreError):
+            store._download_file(client, S3_BUCKET, S3_FILENAME)
+
+    def test_open_file(self, store, client, monkeypatch):
+        content = Path(TEST_CSV_PATH).read_bytes()
+        file = store.open_file(S3_FILENAME)
+        file.seek(-10, 2)
+        assert file.read() == content[-10:]
+        file.seek(0)
+        assert file.read() == content
+
+        # Object changed after it was opened
+        file = store.open_file(S3_FILENAME)
+        client.put_object(Bucket=S3_BUCKET, Key=S3_FILENAME, Body=b"changed")
+        with pytest.raises(StoreError):
+            file.read()
+        client.upload_file(TEST_CSV_PATH, S3_BUCKET, S3_FILENAME)
+
+    def test_fetch_file_cached(self, store, client, tmp_path, monkeypatch):
+        store.download_cache = DownloadCache(str(tmp_path / "cache"))
+        calls = []
+        get_object = client.get_object
+
+        def _get_object(**kwargs):
+            calls.append(kwargs)
+            return get_object(**kwargs)
+
+        monkeypatch.setattr(client, "get_object", _get_object)
+        path = store.fetch_file(S3_FILENAME)
+        assert Path(path).read_bytes() == Path(TEST_CSV_PATH).read_bytes()
+        assert len(list(Path(tmp_path / "cache").iterdir())) == 2
+
+        # A new run revalidates the version and links the cached file
+        store.clean_paths()
+        path = store.fetch_file(S3_FILENAME)
+        assert path.startswith(store.temp_dir)
+        assert Path(path).read_bytes() == Path(TEST_CSV_PATH).read_bytes()
+        assert len(calls) == 1
+
+        # A changed object is downloaded again
+        store.clean_paths()
+        client.put_object(Bucket=S3_BUCKET, Key=S3_FILENAME, Body=b"a\n1\n")
+        changed = store.fetch_file(S3_FILENAME)
+        assert changed != path
+        assert Path(changed).read_bytes() == b"a\n1\n"
+        client.upload_file(TEST_CSV_PATH, S3_BUCKET, S3_FILENAME)
+
+    def test_transfer_config(self, s3_store_cfg, tmp_path):
+        config = {**s3_store_cfg.config, "part_size": 1024, "max_concurrency": 2}
+        store = S3ArtifactStore("s3", "s3", "s3://test", str(tmp_path), config)
+        assert store.part_size == 1024
+        assert store.max_concurrency == 2
+        assert store._get_client() is not None
+
     def test_store_data(self, store):
         key = build_key("test", TEST_FILENAME)
         name = get_name_from_uri("s3://" + key)
@@ -9,6 +9,8 @@ from datajudge.utils.file_utils import (
     copy_file,
     get_absolute_path,
     get_path,
+    get_user_cache_dir,
+    link_file,
     make_dir,
 )
 
@@ -79,3 +81,20 @@ def test_clean_all(tmp_path):
     assert pth.is_dir()
     clean_all(tmp_path)
     assert not pth.exists()
+
+
+def test_get_user_cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    assert get_user_cache_dir("x") == str(Path(tmp_path, "datajudge", "x"))
+    monkeypatch.delenv("XDG_CACHE_HOME")
+    expected = Path.home() / ".cache" / "datajudge" / "x"
+    assert get_user_cache_dir("x") == str(expected)
+
+
+def test_link_file(tmp_path):
+    src = Path(make_temp_file(tmp_path))
+    dst = Path(tmp_path, "link.txt")
+    link_file(str(src), str(dst))
+    assert dst.stat().st_ino == src.stat().st_ino
+    with pytest.raises(FileNotFoundError):
+        link_file(str(tmp_path / "missing"), str(tmp_path / "other"))
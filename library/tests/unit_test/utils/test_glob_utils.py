@@ -0,0 +1,49 @@
+import pytest
+
+from datajudge.utils.glob_utils import (
+    get_glob_base,
+    is_expandable,
+    is_glob,
+    is_recursive_glob,
+    join_path,
+    match_glob,
+)
+
+
+class TestGlobUtils:
+    def test_is_expandable(self) -> None:
+        assert is_glob("s3://bucket/landing/*.csv")
+        assert not is_glob("s3://bucket/landing/file.csv")
+        assert is_expandable("ftp://host/dir/")
+        assert not is_expandable("ftp://host/dir/file.csv")
+
+    def test_get_glob_base(self) -> None:
+        assert get_glob_base("s3://bucket/landing/*.csv") == "s3://bucket/landing/"
+        assert get_glob_base("ftp://host/dir/**") == "ftp://host/dir/"
+        assert get_glob_base("*.csv") == ""
+
+    def test_is_recursive_glob(self) -> None:
+        assert not is_recursive_glob("landing/*.csv")
+        assert is_recursive_glob("landing/**/*.csv")
+        assert is_recursive_glob("landing/*/file.csv")
+
+    @pytest.mark.parametrize(
+        "path,pattern,expected",
+        [
+            ("landing/a.csv", "landing/*.csv", True),
+            ("landing/sub/a.csv", "landing/*.csv", False),
+            ("landing/sub/a.csv", "landing/**", True),
+            ("landing/a.csv", "landing/**/*.csv", True),
+            ("landing/x/y/a.csv", "landing/**/*.csv", True),
+            ("landing/a1.csv", "landing/a?.csv", True),
+            ("landing/a1.csv", "landing/a[!1].csv", False),
+            ("landing/a.csv", "landing/*.parquet", False),
+        ],
+    )
+    def test_match_glob(self, path, pattern, expected) -> None:
+        assert match_glob(path, pattern) is expected
+
+    def test_join_path(self) -> None:
+        assert join_path("s3://bucket/dir/", "a.csv") == "s3://bucket/dir/a.csv"
+        assert join_path("dir", "a.csv") == "dir/a.csv"
+        assert join_path("", "a.csv") == "a.csv"
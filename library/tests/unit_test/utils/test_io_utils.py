@@ -2,7 +2,11 @@ import json
 from io import BytesIO, StringIO, TextIOWrapper
 from pathlib import Path
 
+import pyarrow as pa
+
 from datajudge.utils.io_utils import (
+    read_arrow_ipc,
+    write_arrow_ipc,
     wrap_bytes,
     wrap_string,
     write_bytes,
@@ -12,6 +16,8 @@ from datajudge.utils.io_utils import (
     write_stringio,
     write_text,
     BytesIOWrapper,
+    RangedFile,
+    open_ranged,
 )
 
 FILE_TXT = "test.txt"
@@ -73,3 +79,35 @@ def test_write_object(tmp_path):
     string_io = StringIO(SRC)
     write_object(string_io, path)
     assert read_cnt(path) == SRC
+
+
+def test_arrow_ipc(tmp_path):
+    path = str(tmp_path / "test.arrow")
+    table = pa.table({"a": [1, 2, 3], "b": ["x", "y", "z"]})
+    write_arrow_ipc(table, path)
+    assert read_arrow_ipc(path).equals(table)
+
+
+def test_ranged_file():
+    content = bytes(range(100))
+    requested = []
+
+    def fetch_range(start, length):
+        requested.append((start, length))
+        return content[start : start + length]
+
+    file = RangedFile(fetch_range, len(content))
+    assert file.seek(-10, 2) == 90
+    assert file.read(20) == content[90:]
+    assert requested == [(90, 10)]
+    assert file.read() == b""
+    file.seek(5)
+    file.seek(5, 1)
+    assert file.read(5) == content[10:15]
+
+    requested.clear()
+    buffered = open_ranged(fetch_range, len(content), 32)
+    assert buffered.read() == content
+    buffered.seek(0)
+    assert buffered.read(4) == content[:4]
+    assert requested[-1] == (0, 32)
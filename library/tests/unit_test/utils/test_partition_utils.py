@@ -0,0 +1,32 @@
+from datajudge.utils.partition_utils import (
+    filter_partitions,
+    is_data_file,
+    parse_partitions,
+)
+
+FILES = [
+    "data/date=2026-10-16/region=x/part-0.parquet",
+    "data/date=2026-10-17/region=x/part-0.parquet",
+    "data/date=2026-10-17/region=y/part-0.parquet",
+    "data/date=2026-10-17/region=y/_SUCCESS",
+    "data/date=2026-10-17/.part-0.parquet.crc",
+]
+
+
+class TestPartitionUtils:
+    def test_parse_partitions(self) -> None:
+        assert parse_partitions(FILES[0]) == {"date": "2026-10-16", "region": "x"}
+        assert parse_partitions("data/file.csv") == {}
+        # File names are not partitions
+        assert parse_partitions("data/key=value") == {}
+
+    def test_is_data_file(self) -> None:
+        assert is_data_file(FILES[0])
+        assert not is_data_file(FILES[3])
+        assert not is_data_file(FILES[4])
+
+    def test_filter_partitions(self) -> None:
+        assert filter_partitions(FILES) == FILES[:3]
+        assert filter_partitions(FILES, {"date": "2026-10-17"}) == FILES[1:3]
+        assert filter_partitions(FILES, {"region": ["x"]}) == FILES[:2]
+        assert filter_partitions(FILES, {"other": "x"}) == []
@@ -0,0 +1,87 @@
+import pandas as pd
+import pytest
+
+from datajudge.utils.sampling_utils import (
+    Sampler,
+    get_sample_args,
+    parse_sample_args,
+)
+
+
+def take(data, idx):
+    return data.iloc[idx]
+
+
+def get_column(data, column):
+    return data[column].to_numpy()
+
+
+def run_sampler(sample, batches):
+    sampler = Sampler(parse_sample_args(sample), take, get_column)
+    for batch in batches:
+        sampler.add(batch, len(batch))
+        if sampler.done:
+            break
+    return pd.concat(sampler.get_sample()), sampler
+
+
+@pytest.fixture
+def batches():
+    df = pd.DataFrame({"id": range(1000), "group": ["a"] * 990 + ["b"] * 10})
+    return [df.iloc[i : i + 100] for i in range(0, 1000, 100)]
+
+
+class TestSamplingUtils:
+    @pytest.mark.parametrize(
+        "sample",
+        [
+            {"strategy": "other"},
+            {"strategy": "head"},
+            {"strategy": "random"},
+            {"strategy": "random", "size": 10, "fraction": 0.1},
+            {"strategy": "stratified", "size": 10},
+            {"strategy": "row_groups"},
+        ],
+    )
+    def test_parse_sample_args_error(self, sample):
+        with pytest.raises(ValueError):
+            parse_sample_args(sample)
+
+    def test_get_sample_args(self):
+        assert get_sample_args({"sample": {"strategy": "head"}}) == {"strategy": "head"}
+        assert get_sample_args({}) is None
+        assert get_sample_args(None) is None
+
+    def test_head(self, batches):
+        data, sampler = run_sampler({"strategy": "head", "size": 150}, batches)
+        assert data["id"].tolist() == list(range(150))
+        desc = sampler.describe()
+        assert desc == {"strategy": "head", "size": 150, "rows": 150, "readRows": 200}
+
+    def test_random_size(self, batches):
+        sample = {"strategy": "random", "size": 50, "seed": 42}
+        data, _ = run_sampler(sample, batches)
+        assert len(data) == 50
+        assert data["id"].is_unique
+        # Rows come from the whole resource
+        assert data["id"].max() > 500
+        again, _ = run_sampler(sample, batches)
+        assert set(again["id"]) == set(data["id"])
+
+    def test_random_fraction(self, batches):
+        sample = {"strategy": "random", "fraction": 0.1, "seed": 42}
+        data, sampler = run_sampler(sample, batches)
+        assert 50 < len(data) < 150
+        assert sampler.describe()["readRows"] == 1000
+
+    def test_stratified(self, batches):
+        sample = {"strategy": "stratified", "column": "group", "size": 20}
+        data, _ = run_sampler(sample, batches)
+        counts = data["group"].value_counts()
+        assert counts["a"] == 20
+        assert counts["b"] == 10
+
+    def test_row_groups(self, batches):
+        data, sampler = run_sampler({"strategy": "row_groups", "step": 3}, batches)
+        assert len(data) == 1000
+        assert sampler.describe()["rows"] == 1000
@@ -0,0 +1,110 @@
+import sqlite3
+from decimal import Decimal
+from io import BytesIO
+
+import duckdb
+import pyarrow as pa
+import pyarrow.parquet as pq
+from sqlalchemy.engine import Engine
+from sqlalchemy.future import Engine as FutureEngine
+
+from datajudge.utils.sql_utils import (
+    dispose_engines,
+    get_engine,
+    get_pool_args,
+    iter_record_batches,
+    write_parquet,
+)
+
+
+def test_get_engine(sqlitedb):
+    engine = get_engine(sqlitedb)
+    assert isinstance(engine, Engine)
+    assert isinstance(engine, FutureEngine)
+    assert get_engine(sqlitedb) is engine
+    assert get_engine(sqlitedb, pool_recycle=10) is not engine
+
+
+def test_get_pool_args():
+    assert get_pool_args(None) == {}
+    config = {"connection_string": "test", "pool_size": 10, "pool_recycle": None}
+    assert get_pool_args(config) == {"pool_size": 10}
+
+
+def test_dispose_engines(sqlitedb):
+    engine = get_engine(sqlitedb)
+    dispose_engines()
+    assert get_engine(sqlitedb) is not engine
+
+
+def get_cursor(query):
+    con = sqlite3.connect(":memory:")
+    con.execute("CREATE TABLE test (col1, col2);")
+    rows = [(None if i < 5 else i, str(i)) for i in range(20)]
+    con.executemany("INSERT INTO test VALUES (?, ?);", rows)
+    return con.execute(query)
+
+
+def test_iter_record_batches():
+    cursor = get_cursor("select * from test")
+    batches = list(iter_record_batches(cursor, ["col1", "col2"], 5))
+    assert len(batches) == 4
+    assert all(isinstance(b, pa.RecordBatch) for b in batches)
+    assert batches[0].schema.names == ["col1", "col2"]
+
+    # Native arrow fetch
+    cursor = duckdb.connect().execute("select range as col1 from range(10)")
+    batches = list(iter_record_batches(cursor, ["col1"], 5))
+    assert sum(b.num_rows for b in batches) == 10
+
+
+def test_write_parquet(tmp_path):
+    path = str(tmp_path / "test.parquet")
+    cursor = get_cursor("select * from test")
+    assert write_parquet(cursor, ["col1", "col2"], path, 5) == 20
+    table = pq.read_table(path)
+    assert table.num_rows == 20
+    # First batch is all null, column takes the type of later batches
+    assert table.schema.field("col1").type == pa.int64()
+    assert table.column("col1").to_pylist() == [None] * 5 + list(range(5, 20))
+
+    cursor = get_cursor("select * from test where 0")
+    assert write_parquet(cursor, ["col1", "col2"], path, 5) == 0
+    assert pq.read_table(path).schema.names == ["col1", "col2"]
+
+
+def test_write_parquet_type_drift(tmp_path):
+    con = sqlite3.connect(":memory:")
+    con.execute("CREATE TABLE test (col1, col2);")
+    rows = [(1, None), (2, None), (2.5, "a"), (3.7, None), (None, 1)]
+    con.executemany("INSERT INTO test VALUES (?, ?);", rows)
+
+    path = str(tmp_path / "test.parquet")
+    cursor = con.execute("select * from test")
+    assert write_parquet(cursor, ["col1", "col2"], path, 2) == 5
+    table = pq.read_table(path)
+    assert table.schema.field("col1").type == pa.float64()
+    assert table.column("col1").to_pylist() == [1, 2, 2.5, 3.7, None]
+    assert table.schema.field("col2").type == pa.string()
+    assert table.column("col2").to_pylist() == [None, None, "a", None, "1"]
+
+    # Buffers are rewritten in place
+    buffer = BytesIO()
+    cursor = con.execute("select * from test")
+    assert write_parquet(cursor, ["col1", "col2"], buffer, 2) == 5
+    buffer.seek(0)
+    assert pq.read_table(buffer).equals(table)
+
+
+def test_write_parquet_decimals(tmp_path):
+    con = sqlite3.connect(":memory:", detect_types=sqlite3.PARSE_DECLTYPES)
+    sqlite3.register_converter("DEC", lambda v: Decimal(v.decode()))
+    con.execute("CREATE TABLE test (col1 DEC);")
+    con.executemany("INSERT INTO test VALUES (?);", [("1.5",), ("100.25",)])
+
+    path = str(tmp_path / "test.parquet")
+    cursor = con.execute("select * from test")
+    write_parquet(cursor, ["col1"], path, 1)
+    table = pq.read_table(path)
+    assert table.schema.field("col1").type == pa.decimal128(5, 2)
+    assert table.column("col1").to_pylist() == [Decimal("1.5"), Decimal("100.25")]
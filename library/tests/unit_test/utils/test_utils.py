@@ -1,6 +1,12 @@
 import re
 
-from datajudge.utils.utils import flatten_list, get_time, listify, get_uiid
+from datajudge.utils.utils import (
+    flatten_list,
+    get_time,
+    listify,
+    get_uiid,
+    parallel_map,
+)
 
 
 class TestUtils:
@@ -24,6 +30,13 @@ class TestUtils:
         assert isinstance(listify([1]), list)
         assert isinstance(listify([{"test": 1}]), list)
 
+    def test_parallel_map(self):
+        assert parallel_map(lambda x: x * 2, []) == []
+        assert parallel_map(lambda x: x * 2, [1]) == [2]
+        assert parallel_map(lambda x: x * 2, list(range(10)), 3) == list(
+            range(0, 20, 2)
+        )
+
     def test_get_time(self) -> None:
         date = get_time()
         # Excpected format